@@ -1,13 +1,14 @@
 import base64
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from typing import Union
+from typing import Optional, Union
 
 from beartype import beartype
 
-from .utils.AzApi_agents import _AzAgents
+from .utils.AzApi_agents import PoolInfo, _AzAgents
 from .utils.AzApi_boards import _AzBoards
-from .utils.AzApi_repos import _AzRepos
+from .utils.AzApi_repos import RepositoryInfo, _AzRepos
 from .utils.http_client import handle_incorrect_response, requests
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,8 @@ class AzApi:
         self.token = token
         self.__verify_connection()
         self.__users_data = ...
+        self.__repositories: dict[str, RepositoryInfo] = ...
+        self.__agent_pools: dict[str, PoolInfo] = ...
 
         # Components
         self.__repo_name: str = ...
@@ -40,6 +43,8 @@ class AzApi:
 
         self.__pool_name = ...
         self.__Agents: _AzAgents = ...
+        self.__pools_components: dict[str, _AzAgents] = {}
+        self.lazy_agent_capabilities: bool = False
 
     @property
     def token(self) -> str:
@@ -88,9 +93,10 @@ class AzApi:
             name (str): Azures repository name.
         Raises:
             beartype.roar.BeartypeCallHintParamViolation: If any attribute is in incorrect type.
+            ValueError: If repository does not exist in the project. Previous repository stays active.
         """
+        self.__Repos = _AzRepos(self, name)
         self.__repo_name = name
-        self.__Repos = _AzRepos(self, self.__repo_name)
 
     @property
     def Repos(self) -> _AzRepos:
@@ -123,13 +129,16 @@ class AzApi:
     def agent_pool_name(self, pool_name: str):
         """
         Setter for Agent's Pool name. If Pool name is valid it initiates constructor for AzRepos component.
+        Capabilities of agents are downloaded on first access when `lazy_agent_capabilities` is True. Component is
+        also available in `agent_pools`.
         Args:
             pool_name (str): Agent's pool name
         Raises:
             beartype.roar.BeartypeCallHintParamViolation: If any attribute is in incorrect type.
         """
         self.__pool_name = pool_name
-        self.__Agents = _AzAgents(self, pool_name)
+        self.__Agents = _AzAgents(self, pool_name, lazy_capabilities=self.lazy_agent_capabilities)
+        self.__pools_components[pool_name] = self.__Agents
 
     @property
     def Agents(self) -> _AzAgents:
@@ -146,6 +155,99 @@ class AzApi:
             )
         return self.__Agents
 
+    @property
+    def agent_pools(self) -> dict[str, _AzAgents]:
+        """
+        Getter for AzAgents components of all loaded pools.
+        Returns:
+            dict[str, _AzAgents]: keys are pools names.
+        """
+        return dict(self.__pools_components)
+
+    @beartype
+    def get_agents(self, pool_name: str) -> _AzAgents:
+        """
+        Getter for AzAgents component of loaded pool.
+        Args:
+            pool_name (str): Agent's pool name.
+        Returns:
+            _AzAgents: AzAgents instance.
+        Raises:
+            azapidevops.ComponentException: When component of the pool is not initiated.
+        """
+        if pool_name not in self.__pools_components:
+            raise AzApi.ComponentException(
+                f"AzAgents Component of {pool_name} was not initiated. Please use `load_agent_pools` method."
+            )
+        return self.__pools_components[pool_name]
+
+    @beartype
+    def load_agent_pools(self, pool_names: list[str], max_workers: int = 8) -> dict[str, Union[_AzAgents, Exception]]:
+        """
+        Initiates AzAgents components of many pools concurrently. The pool registry is downloaded once and shared by
+        all components. Successfully loaded components are available in `agent_pools` and with `get_agents`, the
+        `Agents` component and `agent_pool_name` are not changed.
+        Args:
+            pool_names (list[str]): Agent's pools names.
+            max_workers (int): Maximum number of pools loaded at once. Each pool is loaded with sequential requests,
+                so it is also the maximum number of concurrent requests on the shared HTTP session.
+        Returns:
+            dict[str, Union[_AzAgents, Exception]]: component or exception raised while loading, keys are pools names.
+        Raises:
+            RequestException: When pool registry could not be downloaded.
+            beartype.roar.BeartypeCallHintParamViolation: If any attribute is in incorrect type.
+        Examples:
+            >>> api = azapidevops('org','pro','pat')
+            >>> api.load_agent_pools(["LAB_1", "LAB_2"])
+            >>> api.get_agents("LAB_2").find_agents("hardware_available -equals true")
+        """
+        logger.info(f"Loading {len(pool_names)} agents pools...")
+        pools = self.get_agent_pools()
+        if any(pool_name not in pools for pool_name in pool_names):
+            pools = self.get_agent_pools(refresh=True)
+
+        def __load(pool_name: str) -> Union[_AzAgents, Exception]:
+            if pool_name not in pools:
+                logger.error(f"Agents pool {pool_name} not found in organization.")
+                return NameError("Pool name not detected in organization.")
+            try:
+                return _AzAgents(self, pool_name, lazy_capabilities=self.lazy_agent_capabilities, max_workers=1)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Agents pool {pool_name} not loaded: {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(pool_names, executor.map(__load, pool_names), strict=True))
+        self.__pools_components.update(
+            {name: component for name, component in results.items() if isinstance(component, _AzAgents)}
+        )
+        logger.info(f"SUCCESS: {sum(isinstance(result, _AzAgents) for result in results.values())} pools loaded.")
+        return results
+
+    def get_agent_pools(self, refresh: bool = False) -> dict[str, PoolInfo]:
+        """
+        Reads all agents pools of the organization with a single listing request. The registry is cached and shared by
+        all Agents components, so pools IDs are resolved without additional requests.
+        Args:
+            refresh (bool): download the listing again, e.g. after pool was created.
+
+        Returns:
+            dict[str, PoolInfo]: keys are pools names.
+
+        Raises:
+            RequestException: When API Request was not successful.
+        """
+        if self.__agent_pools is Ellipsis or refresh:
+            logger.info(f"Downloading list of agents pools in {self.organization}...")
+            url = f"https://dev.azure.com/{self.organization}/_apis/distributedtask/pools?api-version=7.2-preview.1"
+            response = requests.get(url, headers=self._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            pools = [PoolInfo.from_response(pool) for pool in response.json().get("value", [])]
+            self.__agent_pools = {pool.name: pool for pool in pools}
+            logger.info(f"SUCCESS: Found {len(self.__agent_pools)} agents pools.")
+        return self.__agent_pools
+
     def _headers(self, content_type: str = "application/json-patch+json") -> dict:
         """
         Private method to generate REST header with authentication method and provided data structure.
@@ -224,6 +326,57 @@ class AzApi:
         logger.info(f"Descriptor found: {descriptor}")
         return descriptor
 
+    def get_repositories(self, refresh: bool = False) -> dict[str, RepositoryInfo]:
+        """
+        Reads all repositories of the project with a single listing request. The registry is cached and shared by
+        all Repos components, so their GUIDs, default branches and urls are resolved without additional requests.
+        Args:
+            refresh (bool): download the listing again, e.g. after repository was created.
+
+        Returns:
+            dict[str, RepositoryInfo]: keys are repositories names.
+
+        Raises:
+            RequestException: When API Request was not successful.
+        """
+        if self.__repositories is Ellipsis or refresh:
+            logger.info(f"Downloading list of repositories in {self.project}...")
+            url = f"https://dev.azure.com/{self.organization}/{self.project}/_apis/git/repositories?api-version=7.1"
+            response = requests.get(url, headers=self._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            repositories = [RepositoryInfo.from_response(repo) for repo in response.json().get("value", [])]
+            self.__repositories = {repo.name: repo for repo in repositories}
+            logger.info(f"SUCCESS: Found {len(self.__repositories)} repositories.")
+        return self.__repositories
+
+    @beartype
+    def get_repository(self, name: str) -> Optional[RepositoryInfo]:
+        """
+        Searches repository in cached registry, case-insensitive like Azure DevOps. Registry is downloaded again once
+        when repository is missing, as it could be created after the listing.
+        Args:
+            name (str): Repository name.
+
+        Returns:
+            RepositoryInfo: Repository GUID, default branch, size and urls.
+            or
+            None: If repository was not found in the project.
+
+        Raises:
+            RequestException: When API Request was not successful.
+            beartype.roar.BeartypeCallHintParamViolation: If `name` is not a string type.
+        """
+        for refresh in (False, True):
+            repositories = self.get_repositories(refresh=refresh)
+            repository = repositories.get(name) or next(
+                (repo for repo_name, repo in repositories.items() if repo_name.lower() == name.lower()), None
+            )
+            if repository is not None:
+                return repository
+        logger.warning(f"Repository {name} not found.")
+        return None
+
     @beartype
     def get_guid_by_descriptor(self, descriptor: str) -> str:
         """
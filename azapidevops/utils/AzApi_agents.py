@@ -1,10 +1,15 @@
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from functools import wraps
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
 
+from pydantic import BaseModel, ConfigDict
+
+from .agent_demands import CapabilitiesIndex, Demand
 from .http_client import handle_incorrect_response, requests
 
 if TYPE_CHECKING:
@@ -31,30 +36,123 @@ class AgentsBy(Enum):
     ID = auto()
 
 
+class CapabilitiesUpdateResult(BaseModel):
+    """Result of user capabilities update of single agent by bulk methods.
+
+    Attributes:
+        agent_name (str): Name of agent.
+        agent_id (int): Unique ID of agent in the pool.
+        user_capabilities (Optional[dict[str, str]]): User capabilities after update, None if update failed.
+        error (Optional[Exception]): Exception raised while updating.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    agent_name: str
+    agent_id: int
+    user_capabilities: Optional[dict[str, str]] = None
+    error: Optional[Exception] = None
+
+
+class PoolInfo(BaseModel):
+    """Agents pool of the organization.
+
+    Attributes:
+        id (int): Unique ID of pool in the organization.
+        name (str): Name of pool.
+        is_hosted (bool): True for Microsoft-hosted pools.
+        pool_type (str): Type of pool, "automation" or "deployment".
+        size (int): Number of agents in the pool.
+    """
+
+    id: int
+    name: str
+    is_hosted: bool = False
+    pool_type: str = "automation"
+    size: int = 0
+
+    @classmethod
+    def from_response(cls, data: dict) -> "PoolInfo":
+        """
+        Creates pool info from raw pool data returned by endpoint.
+        Args:
+            data (dict): pool data.
+
+        Returns:
+            PoolInfo: pool info.
+        """
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            is_hosted=data.get("isHosted", False),
+            pool_type=data.get("poolType", "automation"),
+            size=data.get("size", 0),
+        )
+
+
+class AgentsDiff(BaseModel):
+    """Changes of agents pool found by `refresh`.
+
+    Attributes:
+        added (list[str]): Names of agents which appeared in the pool.
+        removed (list[str]): Names of agents which were removed from the pool.
+        changed (list[str]): Names of agents with changed name, version or status.
+    """
+
+    added: list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+
+
 class _AzAgents:
-    def __init__(self, api: "azapidevops", pool_name: str):  # noqa: F821
+    def __init__(
+        self,
+        api: "azapidevops",  # noqa: F821
+        pool_name: str,
+        lazy_capabilities: bool = False,
+        max_workers: int = 8,
+    ):
         """
         Constructor for Agents Pool control component.
         Args:
             api: Object of azapidevops parent.
             pool_name: name of agents pool in Azure Devops portal.
+            lazy_capabilities: download only lightweight agents list (id, name, status). Capabilities are downloaded
+                and memoized per agent on first access.
+            max_workers: Maximum number of concurrent requests for capabilities missing in the initial listing.
         """
         logger.info("Initializing azapidevops Agents Tool.")
         self.__pool_name = pool_name
         self.__azure_api = api
+        self.__lazy_capabilities = lazy_capabilities
+        self.__capabilities_lock = threading.Lock()
         self.__all_pools = self.__get_all_pools()
         self.__pool_id = self.__all_pools.get(self.__pool_name)
+        if not self.__pool_id:
+            self.__all_pools = self.__get_all_pools(refresh=True)
+            self.__pool_id = self.__all_pools.get(self.__pool_name)
         if not self.__pool_id:
             logger.error("Pool name not detected in organization.")
             logger.debug(f"{self.__pool_name} not found in {self.__all_pools}.")
             raise NameError("Pool name not detected in organization.")
-        self.__all_agents = self.__get_all_agents(self.__pool_id)
+        self.__fingerprints: dict[int, tuple] = {}
+        self.__demands_index: Optional[CapabilitiesIndex] = None
+        self.__all_agents = self.__get_all_agents(
+            self.__pool_id, max_workers=max_workers, include_capabilities=not lazy_capabilities
+        )
+        self.__ids_by_name: dict[str, int] = {}
+        self.__ids_by_pc_name: dict[str, int] = {}
+        self.__names_by_id: dict[int, str] = {}
+        self.__without_capabilities: set[str] = set()
+        with self.__capabilities_lock:
+            self.__assign_indexes(self.__build_indexes(self.__all_agents))
         logger.info("SUCCESS: Agents Component initialized.")
 
     @property
     def all_agents(self) -> dict[str, dict]:
         """
-        Getter for all available agents in the pool.
+        Getter for all available agents in the pool. In lazy mode capabilities not yet downloaded are requested
+        concurrently on first access.
         Returns:
             dict: dict with agents names and properites
         Examples:
@@ -71,28 +169,50 @@ class _AzAgents:
                 "status": "online",
             },}
         """
+        self.__load_missing_capabilities()
         return self.__all_agents
 
-    def __get_all_pools(self) -> dict[str, int]:
+    @property
+    def pool_name(self) -> str:
         """
-        Private method to download all available agents pools in the organization.
         Returns:
-        dict: dict with name of pool as a key, and ID of pool as value.
+            str: name of agents pool managed by component.
         """
-        logger.debug("Downloading list of all available pools...")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools?api-version=7.2-preview.1"
-        response = requests.get(url, headers=self.__azure_api._headers())
+        return self.__pool_name
 
-        if response.status_code != HTTPStatus.OK:
-            handle_incorrect_response(response)
-        logger.debug(f"Found {response.json()['count']} pools.")
-        response_json = response.json()["value"]
-        logger.info("SUCCESS: Pools list updated.")
-        return {pool.get("name"): pool.get("id") for pool in response_json}
+    @property
+    def lazy_capabilities(self) -> bool:
+        """
+        Returns:
+            bool: True if capabilities are downloaded on first access instead of on initialization.
+        """
+        return self.__lazy_capabilities
+
+    def __get_all_pools(self, refresh: bool = False) -> dict[str, int]:
+        """
+        Private method to read all available agents pools in the organization from the pool registry cached by parent,
+        so components of many pools share a single pools listing.
+        Args:
+            refresh (bool): download the pools listing again, e.g. when pool was created after the listing.
+        Returns:
+        dict: dict with name of pool as a key, and ID of pool as value.
+        """
+        pools = self.__azure_api.get_agent_pools(refresh=refresh)
+        return {name: pool.id for name, pool in pools.items()}
 
-    def __get_all_agents(self, pool_id: int) -> dict[str, dict]:
+    def __get_all_agents(
+        self, pool_id: int, page_size: int = 1000, max_workers: int = 8, include_capabilities: bool = True
+    ) -> dict[str, dict]:
         """
-        Private method to download all available agents in the specific pool.
+        Private method to download all available agents in the specific pool. Agents are listed together with their
+        capabilities (`includeCapabilities=true`) page by page. Capabilities of agents missing in the listing are
+        requested concurrently per agent. Fingerprints of listed agents are stored for `refresh`.
+        Args:
+            pool_id (int): ID of agents pool.
+            page_size (int): Number of agents requested in a single call.
+            max_workers (int): Maximum number of concurrent per-agent requests.
+            include_capabilities (bool): download capabilities. If False, `pc_name` and `capabilities` are None
+                until loaded with `__load_capabilities`.
         Returns:
             dict: dict with agents names and properites
         Examples:
@@ -108,29 +228,298 @@ class _AzAgents:
             },}
         """
         logger.debug("Downloading list of all available agents...")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{pool_id}/agents?api-version=7.1"
-        response = requests.get(url, headers=self.__azure_api._headers())
+        agents = self.__list_agents(pool_id, include_capabilities, page_size)
+        logger.debug(f"Found {len(agents)} agents.")
+        self.__fingerprints = {agent.get("id"): self.__fingerprint(agent) for agent in agents}
+        if not include_capabilities:
+            logger.info("SUCCESS: Agents list updated.")
+            return {
+                agent.get("name"): {
+                    "id": agent.get("id"),
+                    "pc_name": None,
+                    "capabilities": None,
+                    "status": agent.get("status"),
+                }
+                for agent in agents
+            }
+
+        capabilities = {
+            agent.get("id"): {
+                "systemCapabilities": agent.get("systemCapabilities"),
+                "userCapabilities": agent.get("userCapabilities"),
+            }
+            for agent in agents
+            if "systemCapabilities" in agent
+        }
+        missing = [agent.get("id") for agent in agents if agent.get("id") not in capabilities]
+        if missing:
+            logger.debug(f"TRACE: Reading capabilities of {len(missing)} agents separately.")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = executor.map(self.__fetch_capabilities, missing)
+                capabilities.update(zip(missing, fetched, strict=True))
 
-        if response.status_code != HTTPStatus.OK:
-            handle_incorrect_response(response)
-        logger.debug(f"Found {response.json()['count']} agents.")
-        response_json = response.json()["value"]
         result = {}
-        for agent in response_json:
-            capabilities = self.get_agent_capabilities(agent.get("id"), by=AgentsBy.ID)
+        for agent in agents:
+            agent_capabilities = capabilities[agent.get("id")]
             result[agent.get("name")] = {
                 "id": agent.get("id"),
-                "pc_name": capabilities.get("systemCapabilities", {}).get("Agent.ComputerName"),
-                "capabilities": capabilities,
+                "pc_name": (agent_capabilities.get("systemCapabilities") or {}).get("Agent.ComputerName"),
+                "capabilities": agent_capabilities,
                 "status": agent.get("status"),
             }
         logger.info("SUCCESS: Agents list updated.")
         return result
 
+    def __list_agents(self, pool_id: int, include_capabilities: bool, page_size: int = 1000) -> list[dict]:
+        """
+        Private method to list raw agents data of the pool following continuation tokens.
+        Args:
+            pool_id (int): ID of agents pool.
+            include_capabilities (bool): request capabilities together with agents.
+            page_size (int): Number of agents requested in a single call.
+
+        Returns:
+            list[dict]: raw agents data returned by endpoint.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{pool_id}/agents?includeCapabilities={str(include_capabilities).lower()}&api-version=7.1"
+        params = {"$top": page_size}
+        agents = []
+        while True:
+            response = requests.get(url, params=params, headers=self.__azure_api._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            agents.extend(response.json()["value"])
+            continuation_token = response.headers.get("x-ms-continuationtoken")
+            if not continuation_token:
+                return agents
+            params["continuationToken"] = continuation_token
+
+    @staticmethod
+    def __fingerprint(agent: dict) -> tuple:
+        """
+        Private method to get values of raw agent data which identify its change between listings.
+        Returns:
+            tuple: name, version, status and time of the last status change.
+        """
+        return agent.get("name"), agent.get("version"), agent.get("status"), agent.get("statusChangedOn")
+
+    @_require_valid_pool_name
+    def refresh(self, max_workers: int = 8) -> AgentsDiff:
+        """
+        Lists agents of the pool again without capabilities and updates agents database. Capabilities are downloaded
+        concurrently only for added and changed agents, in lazy mode they are downloaded on first access. Agents
+        database and indexes are replaced at once, only when all requests succeed.
+        Args:
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            AgentsDiff: names of added, removed and changed agents.
+
+        Examples:
+            >>> api = azapidevops('org','pro','pat')
+            >>> api.agent_pool_name = "pool"
+            >>> diff = api.Agents.refresh()
+            >>> diff.added
+                ['LAB_BENCH_5522']
+        """
+        logger.info(f"Refreshing agents of {self.__pool_name} pool...")
+        agents = self.__list_agents(self.__pool_id, include_capabilities=False)
+        fingerprints = {agent.get("id"): self.__fingerprint(agent) for agent in agents}
+        outdated = [
+            agent_id
+            for agent_id, fingerprint in fingerprints.items()
+            if self.__fingerprints.get(agent_id) != fingerprint
+        ]
+        diff = AgentsDiff(
+            added=[fingerprints[agent_id][0] for agent_id in outdated if agent_id not in self.__names_by_id],
+            removed=[name for agent_id, name in self.__names_by_id.items() if agent_id not in fingerprints],
+            changed=[fingerprints[agent_id][0] for agent_id in outdated if agent_id in self.__names_by_id],
+        )
+        outdated_ids = set(outdated)
+        capabilities = {}
+        if outdated and not self.__lazy_capabilities:
+            logger.debug(f"TRACE: Reading capabilities of {len(outdated)} agents.")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                capabilities = dict(zip(outdated, executor.map(self.__fetch_capabilities, outdated), strict=True))
+
+        all_agents = {}
+        for agent in agents:
+            agent_id = agent.get("id")
+            if agent_id in outdated_ids:
+                agent_capabilities = capabilities.get(agent_id)
+                all_agents[agent.get("name")] = {
+                    "id": agent_id,
+                    "pc_name": ((agent_capabilities or {}).get("systemCapabilities") or {}).get("Agent.ComputerName"),
+                    "capabilities": agent_capabilities,
+                    "status": agent.get("status"),
+                }
+            else:
+                all_agents[agent.get("name")] = self.__all_agents[self.__names_by_id[agent_id]]
+        indexes = self.__build_indexes(all_agents)
+        with self.__capabilities_lock:
+            stale_names = [name for agent_id, name in self.__names_by_id.items() if agent_id in outdated_ids]
+            self.__all_agents = all_agents
+            self.__fingerprints = fingerprints
+            self.__assign_indexes(indexes)
+            self.__update_demands_index(
+                added=[fingerprints[agent_id][0] for agent_id in outdated], removed=diff.removed + stale_names
+            )
+        logger.info(
+            f"SUCCESS: Agents refreshed: {len(diff.added)} added, {len(diff.removed)} removed, "
+            f"{len(diff.changed)} changed."
+        )
+        return diff
+
+    def __load_capabilities(self, agent_names: list[str], max_workers: int = 8) -> None:
+        """
+        Private method to download and memoize capabilities of agents which do not have them yet. Does nothing
+        when all capabilities are already loaded.
+        Args:
+            agent_names (list[str]): names of agents.
+            max_workers (int): Maximum number of concurrent requests.
+        """
+        missing = [name for name in agent_names if self.__all_agents[name]["capabilities"] is None]
+        if not missing:
+            return
+        logger.debug(f"TRACE: Loading capabilities of {len(missing)} agents.")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = list(executor.map(lambda name: self.__fetch_capabilities(self.__all_agents[name]["id"]), missing))
+        with self.__capabilities_lock:
+            for name, capabilities in zip(missing, fetched, strict=True):
+                if self.__all_agents[name]["capabilities"] is None:
+                    self.__all_agents[name]["capabilities"] = capabilities
+                    pc_name = (capabilities.get("systemCapabilities") or {}).get("Agent.ComputerName")
+                    self.__all_agents[name]["pc_name"] = pc_name
+                    if pc_name is not None:
+                        self.__ids_by_pc_name[pc_name] = self.__all_agents[name]["id"]
+            self.__without_capabilities.difference_update(missing)
+            self.__update_demands_index(added=missing)
+
+    def __load_missing_capabilities(self) -> None:
+        """
+        Private method to download capabilities of all agents which do not have them yet. Agents without capabilities
+        are tracked in a set, so nothing is scanned when all capabilities are loaded or lazy mode is off.
+        """
+        if not self.__lazy_capabilities or not self.__without_capabilities:
+            return
+        with self.__capabilities_lock:
+            agent_names = list(self.__without_capabilities)
+        self.__load_capabilities(agent_names)
+
+    @_require_valid_pool_name
+    def find_agents(self, demands: Union[str, Demand, list[Union[str, Demand]]], online_only: bool = True) -> list[str]:
+        """
+        Finds agents meeting all Azure Pipelines demands with inverted index of user and system capabilities. Index
+        is built on first call (in lazy mode with all capabilities downloaded) and then kept up to date by
+        capabilities changes and `refresh`.
+        Args:
+            demands (str or Demand or list): demands in Azure Pipelines syntax: `name` (exists),
+                `name -equals value` or `name -gtVersion|-geVersion|-ltVersion|-leVersion version`.
+            online_only (bool): return only online agents.
+
+        Returns:
+            list[str]: sorted names of matching agents.
+
+        Raises:
+            ValueError: When demand is not supported.
+
+        Examples:
+            >>> api = azapidevops('org','pro','pat')
+            >>> api.agent_pool_name = "pool"
+            >>> api.Agents.find_agents(["hardware_available -equals true", "Agent.Version -gtVersion 4.200"])
+                ['LAB_BENCH_5521']
+        """
+        if not isinstance(demands, list):
+            demands = [demands]
+        demands = [Demand.parse(demand) if isinstance(demand, str) else demand for demand in demands]
+        self.__load_missing_capabilities()
+        with self.__capabilities_lock:
+            if self.__demands_index is None:
+                self.__demands_index = CapabilitiesIndex()
+                self.__update_demands_index(added=list(self.__all_agents))
+                logger.debug(f"TRACE: Demands index of {len(self.__demands_index)} agents built.")
+            agent_names = sorted(self.__demands_index.match(demands, online_only))
+        logger.debug(f"TRACE: {len(agent_names)} agents meet demands {demands}.")
+        return agent_names
+
+    def __update_demands_index(self, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """
+        Private method to update demands index, if already built, with current records of agents. Must be called
+        with `__capabilities_lock` held.
+        Args:
+            added (Iterable[str]): names of added or modified agents.
+            removed (Iterable[str]): names of agents to remove from the index.
+        """
+        if self.__demands_index is None:
+            return
+        for agent_name in removed:
+            self.__demands_index.remove_agent(agent_name)
+        for agent_name in added:
+            agent = self.__all_agents[agent_name]
+            self.__demands_index.set_agent(agent_name, agent.get("status"), agent.get("capabilities"))
+
+    @staticmethod
+    def __build_indexes(all_agents: dict[str, dict]) -> tuple[dict[str, int], dict[int, str], dict[str, int], set[str]]:
+        """
+        Private method to build lookup indexes of agents by name, ID and PC name, and set of agents without loaded
+        capabilities. Does not touch component state, so it runs without `__capabilities_lock`.
+        Args:
+            all_agents (dict[str, dict]): agents database.
+
+        Returns:
+            tuple: IDs by name, names by ID, IDs by PC name and names of agents without capabilities.
+        """
+        ids_by_name = {name: agent.get("id") for name, agent in all_agents.items()}
+        names_by_id = {agent_id: name for name, agent_id in ids_by_name.items()}
+        ids_by_pc_name = {
+            agent.get("pc_name"): agent.get("id") for agent in all_agents.values() if agent.get("pc_name") is not None
+        }
+        without_capabilities = {name for name, agent in all_agents.items() if agent.get("capabilities") is None}
+        logger.debug(f"TRACE: Indexes of {len(ids_by_name)} agents built.")
+        return ids_by_name, names_by_id, ids_by_pc_name, without_capabilities
+
+    def __assign_indexes(self, indexes: tuple[dict[str, int], dict[int, str], dict[str, int], set[str]]) -> None:
+        """
+        Private method to replace lookup indexes with ones built by `__build_indexes`. Must be called with
+        `__capabilities_lock` held together with replacing `__all_agents`, so readers never see them out of sync.
+        """
+        self.__ids_by_name, self.__names_by_id, self.__ids_by_pc_name, self.__without_capabilities = indexes
+
+    def __fetch_capabilities(self, agent_id: int) -> dict:
+        """
+        Private method to request Agent's User and System Capabilities.
+        Args:
+            agent_id (int): unique Agent's ID in the pool.
+
+        Returns:
+            dict: dict with user and system capabilities
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{self.__pool_id}/agents/{agent_id}?includeCapabilities=true&api-version=7.2-preview.1"
+        response = requests.get(url, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+
+        response_json = response.json()
+        return {
+            "systemCapabilities": response_json.get("systemCapabilities"),
+            "userCapabilities": response_json.get("userCapabilities"),
+        }
+
+    def __get_agent_name(self, agent_id: int) -> str:
+        """
+        Private method to find Agent's name by its ID.
+        Raises:
+            KeyError: When ID was not found in agent's database.
+        """
+        try:
+            return self.__names_by_id[agent_id]
+        except KeyError:
+            raise KeyError(f"{agent_id} not found in all agents list.") from None
+
     def __resolve_agent_key(self, key: Union[str, int], by: AgentsBy) -> int:
         """
         As Azure Devops always uses unique Agent's ID it translates agents name or PC name to Unique ID based on
-        database of agents.
+        indexes of agents database.
         Args:
             key (str or int): key to search Agent. It can be ID, PC name or Agent's Name.
             by (AgentsBy): Type of key data.
@@ -144,22 +533,22 @@ class _AzAgents:
         """
         match by:
             case AgentsBy.ID:
+                if key not in self.__names_by_id:
+                    raise KeyError(f"{key} not found in all agents list.")
                 return key
             case AgentsBy.Agent_Name:
-                _ = key
-                key = self.__all_agents[key]["id"]
-                logger.debug(f"TRACE: Swapping {_} to {key}")
-                return key
+                agent_id = self.__ids_by_name.get(key)
             case AgentsBy.PC_Name:
-                for _, agent_data in self.__all_agents.items():
-                    if agent_data.get("pc_name") == key:
-                        _ = key
-                        key = agent_data.get("id")
-                        logger.debug(f"TRACE: Swapping {_} to {key}")
-                        return key
-                    raise KeyError(f"{key} not found in all agents list.")
+                agent_id = self.__ids_by_pc_name.get(key)
+                if agent_id is None and self.__lazy_capabilities:
+                    self.__load_missing_capabilities()
+                    agent_id = self.__ids_by_pc_name.get(key)
             case _:
                 raise AttributeError(f"{by} is not recognised AgentsBy object.")
+        if agent_id is None:
+            raise KeyError(f"{key} not found in all agents list.")
+        logger.debug(f"TRACE: Swapping {key} to {agent_id}")
+        return agent_id
 
     @_require_valid_pool_name
     def get_agent_capabilities(self, key: Union[str, int], by: AgentsBy) -> dict:
@@ -180,19 +569,16 @@ class _AzAgents:
             {"userCapabilities":{"hardware_available":true}
              "systemCapabilities":{...,"Agent.Version":"4.255.0",...}
              }
+
+        In lazy mode capabilities are downloaded once and memoized, later calls return the cached data.
         """
         logger.info(f"Reading capabilities for agent: {key}...")
         key = self.__resolve_agent_key(key, by)
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{self.__pool_id}/agents/{key}?includeCapabilities=true&api-version=7.2-preview.1"
-        response = requests.get(url, headers=self.__azure_api._headers())
-        if response.status_code != HTTPStatus.OK:
-            handle_incorrect_response(response)
-
-        response_json = response.json()
-        return {
-            "systemCapabilities": response_json.get("systemCapabilities"),
-            "userCapabilities": response_json.get("userCapabilities"),
-        }
+        if self.__lazy_capabilities:
+            agent_name = self.__get_agent_name(key)
+            self.__load_capabilities([agent_name])
+            return self.__all_agents[agent_name]["capabilities"]
+        return self.__fetch_capabilities(key)
 
     @_require_valid_pool_name
     def add_user_capabilities(self, key: Union[str, int], by: AgentsBy, capabilities: dict[str, str]) -> None:
@@ -210,27 +596,18 @@ class _AzAgents:
         """
         logger.info(f"Adding capability: {capabilities} for agent: {key}...")
         key = self.__resolve_agent_key(key, by)
-        agent_name, agent_data = None, None
-        for tmp_agent_name, tmp_agent_data in self.__all_agents.items():
-            if tmp_agent_data.get("id") == key:
-                agent_name = tmp_agent_name
-                agent_data = tmp_agent_data
-                break
-        if not agent_name:
-            raise KeyError(f"{key} not found in all agents list.")
+        agent_name = self.__get_agent_name(key)
+        self.__load_capabilities([agent_name])
+        agent_data = self.__all_agents[agent_name]
 
         new_capabilities = agent_data["capabilities"].get("userCapabilities", {})
         new_capabilities.update(capabilities)
 
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{self.__pool_id}/agents/{key}/usercapabilities?api-version=5.0"
-        response = requests.put(
-            url, headers=self.__azure_api._headers("application/json"), data=json.dumps(new_capabilities)
-        )
-
-        if response.status_code != HTTPStatus.OK:
-            handle_incorrect_response(response)
+        self.__put_user_capabilities(key, new_capabilities)
         logger.info("SUCCESS: Capabilities modified.")
-        self.__all_agents[agent_name]["capabilities"]["userCapabilities"] = new_capabilities
+        with self.__capabilities_lock:
+            self.__all_agents[agent_name]["capabilities"]["userCapabilities"] = new_capabilities
+            self.__update_demands_index(added=[agent_name])
 
     @_require_valid_pool_name
     def remove_user_capabilities(self, key: Union[str, int], by: AgentsBy, capabilities: Union[str, list]) -> None:
@@ -248,14 +625,9 @@ class _AzAgents:
         """
         logger.info(f"Removing capability: {capabilities} for agent: {key}...")
         key = self.__resolve_agent_key(key, by)
-        agent_name, agent_data = None, None
-        for tmp_agent_name, tmp_agent_data in self.__all_agents.items():
-            if tmp_agent_data.get("id") == key:
-                agent_name = tmp_agent_name
-                agent_data = tmp_agent_data
-                break
-        if not agent_name:
-            raise KeyError(f"{key} not found in all agents list.")
+        agent_name = self.__get_agent_name(key)
+        self.__load_capabilities([agent_name])
+        agent_data = self.__all_agents[agent_name]
 
         new_capabilities = agent_data["capabilities"].get("userCapabilities", {})
         if isinstance(capabilities, str):
@@ -263,12 +635,152 @@ class _AzAgents:
         for capability in capabilities:
             new_capabilities.pop(capability, None)
 
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{self.__pool_id}/agents/{key}/usercapabilities?api-version=5.0"
-        response = requests.put(
-            url, headers=self.__azure_api._headers("application/json"), data=json.dumps(new_capabilities)
+        self.__put_user_capabilities(key, new_capabilities)
+        logger.info("SUCCESS: Capabilities removed.")
+        with self.__capabilities_lock:
+            self.__all_agents[agent_name]["capabilities"]["userCapabilities"] = new_capabilities
+            self.__update_demands_index(added=[agent_name])
+
+    @_require_valid_pool_name
+    def add_user_capabilities_to_agents(
+        self,
+        capabilities: dict[str, str],
+        keys: Optional[list[Union[str, int]]] = None,
+        by: AgentsBy = AgentsBy.Agent_Name,
+        predicate: Optional[Callable[[str, dict], bool]] = None,
+        max_workers: int = 8,
+    ) -> list[CapabilitiesUpdateResult]:
+        """
+        Adds user capabilities to many agents concurrently.
+        Args:
+            capabilities (dict): dict with key as name of capabilitiy and value as value
+            keys (Optional[list[str or int]]): keys of agents. It can be IDs, PC names or Agent's Names.
+            by (AgentsBy): Type of keys data.
+            predicate (Optional[Callable[[str, dict], bool]]): selects agents by name and record from `all_agents`,
+                used instead of `keys`.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list[CapabilitiesUpdateResult]: per-agent results.
+
+        Examples:
+            >>> results = api.Agents.add_user_capabilities_to_agents(
+            >>>     {"buildAvailable": "true"}, predicate=lambda name, agent: name.startswith("LAB_")
+            >>> )
+        """
+        logger.info(f"Adding capabilities: {capabilities} to agents...")
+        return self.__update_user_capabilities_of_agents(
+            lambda user_capabilities: {**user_capabilities, **capabilities}, keys, by, predicate, max_workers
         )
 
+    @_require_valid_pool_name
+    def remove_user_capabilities_from_agents(
+        self,
+        capabilities: Union[str, list],
+        keys: Optional[list[Union[str, int]]] = None,
+        by: AgentsBy = AgentsBy.Agent_Name,
+        predicate: Optional[Callable[[str, dict], bool]] = None,
+        max_workers: int = 8,
+    ) -> list[CapabilitiesUpdateResult]:
+        """
+        Removes user capabilities from many agents concurrently.
+        Args:
+            capabilities (str or list): names of capabilities to remove.
+            keys (Optional[list[str or int]]): keys of agents. It can be IDs, PC names or Agent's Names.
+            by (AgentsBy): Type of keys data.
+            predicate (Optional[Callable[[str, dict], bool]]): selects agents by name and record from `all_agents`,
+                used instead of `keys`.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list[CapabilitiesUpdateResult]: per-agent results.
+
+        Examples:
+            >>> results = api.Agents.remove_user_capabilities_from_agents("buildAvailable", ["Agent1", "Agent2"])
+        """
+        logger.info(f"Removing capabilities: {capabilities} from agents...")
+        if isinstance(capabilities, str):
+            capabilities = [capabilities]
+        return self.__update_user_capabilities_of_agents(
+            lambda user_capabilities: {
+                name: value for name, value in user_capabilities.items() if name not in capabilities
+            },
+            keys,
+            by,
+            predicate,
+            max_workers,
+        )
+
+    def __update_user_capabilities_of_agents(
+        self,
+        update: Callable[[dict[str, str]], dict[str, str]],
+        keys: Optional[list[Union[str, int]]],
+        by: AgentsBy,
+        predicate: Optional[Callable[[str, dict], bool]],
+        max_workers: int,
+    ) -> list[CapabilitiesUpdateResult]:
+        """
+        Private method to compute new user capabilities of selected agents, send them concurrently and update agents
+        database at once with successful results. Failed agents keep their cached capabilities.
+        Args:
+            update (Callable): returns new user capabilities from current ones, must not modify its argument.
+            keys (Optional[list[str or int]]): keys of agents.
+            by (AgentsBy): Type of keys data.
+            predicate (Optional[Callable[[str, dict], bool]]): selects agents by name and record.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list[CapabilitiesUpdateResult]: per-agent results.
+
+        Raises:
+            ValueError: When neither `keys` nor `predicate` is provided.
+            KeyError: When any of keys was not found in agent's database. No agent is changed then.
+        """
+        if predicate is not None:
+            agent_names = [name for name, agent in self.all_agents.items() if predicate(name, agent)]
+        elif keys is not None:
+            agent_names = list(dict.fromkeys(self.__get_agent_name(self.__resolve_agent_key(key, by)) for key in keys))
+            self.__load_capabilities(agent_names)
+        else:
+            raise ValueError("Agents have to be selected with `keys` or `predicate`.")
+        logger.debug(f"TRACE: Updating user capabilities of {len(agent_names)} agents.")
+
+        def __update_agent(agent_name: str) -> CapabilitiesUpdateResult:
+            agent = self.__all_agents[agent_name]
+            result = CapabilitiesUpdateResult(agent_name=agent_name, agent_id=agent["id"])
+            try:
+                new_capabilities = update(dict(agent["capabilities"].get("userCapabilities") or {}))
+                self.__put_user_capabilities(agent["id"], new_capabilities)
+                result.user_capabilities = new_capabilities
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"User capabilities of {agent_name} not updated: {e}")
+                result.error = e
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(__update_agent, agent_names))
+        with self.__capabilities_lock:
+            for result in results:
+                if result.error is None:
+                    self.__all_agents[result.agent_name]["capabilities"]["userCapabilities"] = result.user_capabilities
+            self.__update_demands_index(added=[result.agent_name for result in results if result.error is None])
+        failed = sum(1 for result in results if result.error)
+        logger.info(f"SUCCESS: Capabilities of {len(results) - failed} agents updated, {failed} failed.")
+        return results
+
+    def __put_user_capabilities(self, agent_id: int, user_capabilities: dict[str, str]) -> None:
+        """
+        Private method to replace all user capabilities of agent.
+        Args:
+            agent_id (int): unique Agent's ID in the pool.
+            user_capabilities (dict): new user capabilities.
+
+        Raises:
+            RequestException: When API Request was not successful.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/distributedtask/pools/{self.__pool_id}/agents/{agent_id}/usercapabilities?api-version=5.0"
+        response = requests.put(
+            url, headers=self.__azure_api._headers("application/json"), data=json.dumps(user_capabilities)
+        )
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
-        logger.info("SUCCESS: Capabilities removed.")
-        self.__all_agents[agent_name]["capabilities"]["userCapabilities"] = new_capabilities
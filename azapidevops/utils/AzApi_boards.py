@@ -1,9 +1,12 @@
 import datetime
 import json
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from pydantic import BaseModel, EmailStr
 
@@ -11,11 +14,15 @@ try:
     from .http_client import handle_incorrect_response, requests
 except ImportError:
     from azapidevops.utils.http_client import requests
+from .ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     pass
 logger = logging.getLogger(__name__)
 
+_WORK_ITEMS_BATCH_SIZE = 200
+_REVISIONS_WORKER_DONE = object()
+
 
 class WorkItemsDef(str, Enum):
     """Defines available work item types in Azure Boards."""
@@ -42,6 +49,14 @@ class WorkItemsStatesDef:
         Closed = "Closed"
 
 
+class WorkItemRelationsDef(str, Enum):
+    """Defines work item link types which can be followed when walking the work item hierarchy."""
+
+    Parent = "System.LinkTypes.Hierarchy-Reverse"
+    Child = "System.LinkTypes.Hierarchy-Forward"
+    Related = "System.LinkTypes.Related"
+
+
 class WorkItem(BaseModel):
     """Represents a single work item retrieved from Azure Boards.
 
@@ -60,9 +75,120 @@ class WorkItem(BaseModel):
     created_by: EmailStr
 
 
+class WorkItemNode(BaseModel):
+    """Represents a single work item in a work items graph.
+
+    Attributes:
+        id (int): Unique identifier of the work item.
+        title (str): Title of the work item.
+        state (str): Current state of the work item.
+        work_item_type (str): Type of the work item, e.g. Feature, User Story, Task.
+        depth (int): Distance from the closest root work item.
+        relations (dict[WorkItemRelationsDef, list[int]]): IDs of linked work items grouped by link type.
+    """
+
+    id: int
+    title: str
+    state: str
+    work_item_type: str
+    depth: int
+    relations: dict[WorkItemRelationsDef, list[int]] = {}
+
+
+class WorkItemGraph(BaseModel):
+    """Represents in-memory graph of linked work items.
+
+    Attributes:
+        roots (list[int]): IDs of work items the traversal started from.
+        nodes (dict[int, WorkItemNode]): Downloaded work items, keys are work item IDs.
+        truncated (bool): True if traversal was stopped by `max_depth` or `max_items` limit.
+    """
+
+    roots: list[int]
+    nodes: dict[int, WorkItemNode] = {}
+    truncated: bool = False
+
+    def get_linked(self, work_item_id: int, relation: WorkItemRelationsDef) -> list[WorkItemNode]:
+        """
+        Returns downloaded work items linked to the work item with given relation.
+        Args:
+            work_item_id (int): Unique ID of Work Item.
+            relation (WorkItemRelationsDef): Type of link to follow.
+
+        Returns:
+            list[WorkItemNode]: Linked work items. Items which were not downloaded are skipped.
+        """
+        node = self.nodes.get(work_item_id)
+        if not node:
+            return []
+        return [self.nodes[item_id] for item_id in node.relations.get(relation, []) if item_id in self.nodes]
+
+
+class WorkItemRevision(BaseModel):
+    """Represents a single revision of a work item.
+
+    Attributes:
+        id (int): Unique identifier of the work item.
+        rev (int): Revision number, starts from 1.
+        fields (dict): Work item fields in this revision.
+        changed_date (Optional[datetime.datetime]): Date and time of the revision.
+        watermark (Optional[str]): Only for reporting feed - continuation token of the batch with this revision. Can be
+            passed back to `iter_reporting_revisions` to resume reading.
+    """
+
+    id: int
+    rev: int
+    fields: dict = {}
+    changed_date: Optional[datetime.datetime] = None
+    watermark: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, item: dict, watermark: Optional[str] = None) -> "WorkItemRevision":
+        """
+        Creates revision object from raw API response data.
+        Args:
+            item (dict): Raw revision data.
+            watermark (Optional[str]): Continuation token of the batch with this revision.
+
+        Returns:
+            WorkItemRevision: Parsed revision.
+        """
+        fields = item.get("fields") or {}
+        changed_date = fields.get("System.ChangedDate")
+        return cls(
+            id=item["id"],
+            rev=item["rev"],
+            fields=fields,
+            changed_date=datetime.datetime.fromisoformat(changed_date.replace("Z", "+00:00")) if changed_date else None,
+            watermark=watermark,
+        )
+
+
 class _AzBoards:
-    def __init__(self, api: "azapidevops"):  # noqa: F821
+    def __init__(self, api: "azapidevops", query_cache_ttl: float = 0, query_cache_max_size: int = 128):  # noqa: F821
+        """
+        Constructor for Boards component.
+        Args:
+            api: Object of azapidevops parent.
+            query_cache_ttl (float): Time to live in seconds of cached `get_work_items` results. 0 disables cache.
+            query_cache_max_size (int): Maximum number of cached `get_work_items` results.
+        """
         self.__azure_api = api
+        self.__query_cache = TTLCache(query_cache_ttl, query_cache_max_size)
+
+    @property
+    def query_cache(self) -> TTLCache:
+        """
+        Getter for cache of `get_work_items` results. Cache is disabled by default, it can be enabled by setting TTL.
+        Cache is cleared when work item is created or changed by this client.
+        Returns:
+            TTLCache: cache with normalized WIQL query as a key.
+        Examples:
+            >>> api = azapidevops("Org", "Pro", "PAT")
+            >>> api.Boards.query_cache.ttl = 30
+            >>> api.Boards.query_cache.max_size = 64
+        """
+        return self.__query_cache
 
     def create_new_item(
         self,
@@ -110,6 +236,7 @@ class _AzBoards:
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
 
+        self.__query_cache.clear()
         logger.info("SUCCESS: Work item created successfully.")
         return response.json()["id"]
 
@@ -136,6 +263,7 @@ class _AzBoards:
 
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
+        self.__query_cache.clear()
         logger.info(f"SUCCESS: State of object changed to {state}.")
 
     def get_work_items(self, type_of_workitem: WorkItemsDef, **kwargs) -> dict[int, WorkItem]:
@@ -147,6 +275,7 @@ class _AzBoards:
             kwargs: Additional keyword arguments to filter work items.
                 allowed_states (Union[list[WorkItemsStatesDef], WorkItemsStatesDef]): Allowed state or list of states to
                 filter work items.
+                use_cache (bool): Read result from `query_cache` if available. Defaults to True.
 
         Returns:
             dict[int, WorkItem]: A dictionary mapping work item IDs to their corresponding WorkItem objects.
@@ -165,7 +294,9 @@ class _AzBoards:
         states_wiql = None
         if allowed_states := kwargs.get("allowed_states"):
             if isinstance(allowed_states, list):
-                states_wiql = " OR ".join(f"[State] = '{state.value}'" for state in allowed_states)
+                states_wiql = " OR ".join(
+                    f"[State] = '{state}'" for state in sorted({state.value for state in allowed_states})
+                )
             else:
                 states_wiql = f"[State] = '{allowed_states.value}'"
 
@@ -175,10 +306,16 @@ class _AzBoards:
             f"Where [System.WorkItemType] = '{type_of_workitem.value}' "
         )
 
-        wiql += "" if not states_wiql else f"AND {states_wiql} "
+        wiql += "" if not states_wiql else f"AND ({states_wiql}) "
 
         wiql += "order by [System.CreatedDate] desc, [Microsoft.VSTS.Common.Priority] asc"
+        cache_key = self.__normalize_wiql(wiql)
+        use_cache = kwargs.get("use_cache", True)
+        if use_cache and (cached := self.__query_cache.get(cache_key)) is not None:
+            logger.info(f"SUCCESS: Retrieved {len(cached)} work items of type {type_of_workitem} from cache.")
+            return dict(cached)
         query = {"query": wiql}
+        generation = self.__query_cache.generation
 
         url = f"https://dev.azure.com/{self.__azure_api.organization}/_apis/wit/wiql?api-version=7.1"
         response = requests.post(url=url, data=json.dumps(query), headers=self.__azure_api._headers("application/json"))
@@ -189,6 +326,7 @@ class _AzBoards:
 
         ids = [item["id"] for item in response.json()["workItems"]]
         if not ids:
+            self.__query_cache.set(cache_key, {}, generation)
             return {}
         ids_str = ",".join(map(str, ids))
         params_to_read = ",".join(
@@ -224,4 +362,331 @@ class _AzBoards:
             f"with states {kwargs.get('allowed_states', 'all')}."
         )
         logger.debug(work_items)
+        self.__query_cache.set(cache_key, dict(work_items), generation)
         return work_items
+
+    @staticmethod
+    def __normalize_wiql(wiql: str) -> str:
+        """
+        Private method to normalize WIQL query text to be used as a cache key. WIQL is case-insensitive, so whitespaces
+        are collapsed and text is lowercased.
+        Args:
+            wiql (str): WIQL query.
+
+        Returns:
+            str: normalized query.
+        """
+        return " ".join(wiql.split()).lower()
+
+    def get_work_item_graph(
+        self,
+        root_ids: Union[int, list[int]],
+        relations: Optional[list[WorkItemRelationsDef]] = None,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> WorkItemGraph:
+        """
+        Walks work items hierarchy breadth-first starting from root work items. Each level of the graph is downloaded
+        with `$expand=relations` in batches of 200 IDs, batches are requested concurrently.
+
+        Args:
+            root_ids (Union[int, list[int]]): ID or list of IDs of work items to start from.
+            relations (Optional[list[WorkItemRelationsDef]]): Link types to follow. Defaults to children only.
+            max_depth (Optional[int]): Maximum distance from root work items. No limit by default.
+            max_items (Optional[int]): Maximum number of downloaded work items. No limit by default.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            WorkItemGraph: Graph with all downloaded work items and links between them.
+
+        Raises:
+            RequestException: If the API request fails or returns a non-OK status code.
+
+        Example:
+            >>> api = azapidevops("Org", "Pro", "PAT")
+            >>> graph = api.Boards.get_work_item_graph(12, relations=[WorkItemRelationsDef.Child], max_depth=2)
+            >>> tasks = graph.get_linked(12, WorkItemRelationsDef.Child)
+        """
+        if isinstance(root_ids, int):
+            root_ids = [root_ids]
+        relations = relations or [WorkItemRelationsDef.Child]
+        logger.info(f"Downloading work items graph for {root_ids} following {[rel.name for rel in relations]}...")
+
+        graph = WorkItemGraph(roots=root_ids)
+        frontier = list(dict.fromkeys(root_ids))
+        visited = set(frontier)
+        depth = 0
+        while frontier:
+            if max_items is not None and len(graph.nodes) + len(frontier) > max_items:
+                frontier = frontier[: max_items - len(graph.nodes)]
+                graph.truncated = True
+            batches = [
+                frontier[index : index + _WORK_ITEMS_BATCH_SIZE]
+                for index in range(0, len(frontier), _WORK_ITEMS_BATCH_SIZE)
+            ]
+            logger.debug(f"TRACE: Depth {depth}: {len(frontier)} work items in {len(batches)} batches.")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(self.__get_work_items_with_relations, batches))
+
+            next_frontier = []
+            for item in (item for batch in responses for item in batch):
+                node = WorkItemNode(
+                    id=item["id"],
+                    title=item["fields"].get("System.Title", ""),
+                    state=item["fields"].get("System.State", ""),
+                    work_item_type=item["fields"].get("System.WorkItemType", ""),
+                    depth=depth,
+                )
+                for relation in item.get("relations") or []:
+                    if relation.get("rel") not in relations:
+                        continue
+                    linked_id = self.__get_linked_work_item_id(relation)
+                    if linked_id is None:
+                        continue
+                    node.relations.setdefault(WorkItemRelationsDef(relation["rel"]), []).append(linked_id)
+                    if linked_id in visited:
+                        continue
+                    if max_depth is not None and depth >= max_depth:
+                        graph.truncated = True
+                        continue
+                    visited.add(linked_id)
+                    next_frontier.append(linked_id)
+                graph.nodes[node.id] = node
+
+            if max_items is not None and len(graph.nodes) >= max_items and next_frontier:
+                graph.truncated = True
+                break
+            frontier = next_frontier
+            depth += 1
+
+        logger.info(f"SUCCESS: Downloaded {len(graph.nodes)} work items. Truncated: {graph.truncated}.")
+        return graph
+
+    def __get_work_items_with_relations(self, ids: list[int]) -> list[dict]:
+        """
+        Private method to download single batch of work items with their relations.
+        Args:
+            ids (list[int]): up to 200 IDs of work items.
+
+        Returns:
+            list[dict]: Raw work items data. Deleted or inaccessible work items are omitted.
+        """
+        ids_str = ",".join(map(str, ids))
+        url = (
+            f"https://dev.azure.com/{self.__azure_api.organization}/_apis/wit/workitems"
+            f"?ids={ids_str}&$expand=relations&errorPolicy=omit&api-version=7.1"
+        )
+        response = requests.get(url, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        return [item for item in response.json()["value"] if item]
+
+    @staticmethod
+    def __get_linked_work_item_id(relation: dict) -> Optional[int]:
+        """
+        Private method to read ID of linked work item from relation's url.
+        Args:
+            relation (dict): Raw relation data, e.g. {"rel": "...", "url": ".../_apis/wit/workItems/12"}
+
+        Returns:
+            int: ID of linked work item.
+            or
+            None: When relation does not point to a work item.
+        """
+        url = relation.get("url", "")
+        if "/workItems/" not in url:
+            return None
+        try:
+            return int(url.rsplit("/", 1)[-1])
+        except ValueError:
+            return None
+
+    def iter_revisions(
+        self,
+        work_item_ids: Union[int, list[int]],
+        watermark: Optional[dict[int, int]] = None,
+        page_size: int = 200,
+        max_workers: int = 4,
+        buffer_size: int = 1000,
+    ) -> Iterator[WorkItemRevision]:
+        """
+        Streams revision history of work items. Revisions of many work items are downloaded concurrently and yielded
+        as soon as they arrive, revisions of a single work item are always yielded in order. Only `buffer_size`
+        revisions are held in memory, download is paused until they are consumed.
+
+        Args:
+            work_item_ids (Union[int, list[int]]): ID or list of IDs of work items.
+            watermark (Optional[dict[int, int]]): Last processed revision number per work item ID. Only newer revisions
+                are downloaded.
+            page_size (int): Number of revisions requested in a single call.
+            max_workers (int): Maximum number of work items downloaded concurrently.
+            buffer_size (int): Maximum number of downloaded revisions waiting to be consumed.
+
+        Yields:
+            WorkItemRevision: Next revision.
+
+        Raises:
+            RequestException: If the API request fails or returns a non-OK status code.
+
+        Example:
+            >>> api = azapidevops("Org", "Pro", "PAT")
+            >>> watermark = {}
+            >>> for revision in api.Boards.iter_revisions([1, 2, 3], watermark={1: 5}):
+            >>>     watermark[revision.id] = revision.rev
+        """
+        if isinstance(work_item_ids, int):
+            work_item_ids = [work_item_ids]
+        watermark = watermark or {}
+        logger.info(f"Streaming revisions of {len(work_item_ids)} work items...")
+
+        results = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+
+        def __put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def __worker(work_item_id: int):
+            try:
+                for revision in self.__iter_work_item_revisions(
+                    work_item_id, watermark.get(work_item_id, 0), page_size
+                ):
+                    if not __put(revision):
+                        return
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                __put(e)
+            finally:
+                __put(_REVISIONS_WORKER_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for work_item_id in dict.fromkeys(work_item_ids):
+                executor.submit(__worker, work_item_id)
+            pending = len(dict.fromkeys(work_item_ids))
+            count = 0
+            while pending:
+                item = results.get()
+                if item is _REVISIONS_WORKER_DONE:
+                    pending -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                count += 1
+                yield item
+            logger.info(f"SUCCESS: Streamed {count} revisions.")
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter_work_item_revisions(self, work_item_id: int, skip: int, page_size: int) -> Iterator[WorkItemRevision]:
+        """
+        Private generator which pages through revisions of a single work item.
+        Args:
+            work_item_id (int): Unique ID of Work Item.
+            skip (int): Number of revisions to skip, equal to the last processed revision number.
+            page_size (int): Number of revisions requested in a single call.
+
+        Yields:
+            WorkItemRevision: Next revision.
+        """
+        while True:
+            url = (
+                f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/wit/"
+                f"workItems/{work_item_id}/revisions?$top={page_size}&$skip={skip}&api-version=7.1"
+            )
+            response = requests.get(url, headers=self.__azure_api._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            page = response.json()["value"]
+            logger.debug(f"TRACE: Work item {work_item_id}: {len(page)} revisions from {skip}.")
+            for item in page:
+                yield WorkItemRevision.from_response(item)
+            if len(page) < page_size:
+                return
+            skip += len(page)
+
+    def iter_reporting_revisions(
+        self,
+        watermark: Optional[str] = None,
+        start_date: Optional[datetime.datetime] = None,
+        fields: Optional[list[str]] = None,
+        project_scoped: bool = True,
+    ) -> Iterator[WorkItemRevision]:
+        """
+        Streams revisions feed from the reporting API, of the project or of the whole organization. Next batch is
+        downloaded in background while the current one is consumed.
+
+        Args:
+            watermark (Optional[str]): Continuation token to resume from, usually `watermark` of the last processed
+                revision. Batch containing that revision is read again.
+            start_date (Optional[datetime.datetime]): Date to start the feed from, used only without `watermark`.
+            fields (Optional[list[str]]): Fields to read, e.g. ["System.State"]. All fields by default.
+            project_scoped (bool): read revisions of work items in the project only. If False, organization-wide
+                feed is read. Watermarks of both feeds are not interchangeable.
+
+        Yields:
+            WorkItemRevision: Next revision with `watermark` set.
+
+        Raises:
+            RequestException: If the API request fails or returns a non-OK status code.
+
+        Example:
+            >>> api = azapidevops("Org", "Pro", "PAT")
+            >>> for revision in api.Boards.iter_reporting_revisions(watermark=saved_watermark):
+            >>>     saved_watermark = revision.watermark
+        """
+        logger.info(f"Streaming reporting revisions feed from {watermark or start_date or 'beginning'}...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.__get_reporting_revisions_batch, watermark, start_date, fields, project_scoped
+            )
+            count = 0
+            while future:
+                batch = future.result()
+                next_token = batch.get("continuationToken")
+                future = None
+                if not batch.get("isLastBatch") and next_token:
+                    future = executor.submit(
+                        self.__get_reporting_revisions_batch, next_token, None, fields, project_scoped
+                    )
+                for item in batch.get("values", []):
+                    count += 1
+                    yield WorkItemRevision.from_response(item, watermark=watermark)
+                watermark = next_token
+        logger.info(f"SUCCESS: Streamed {count} revisions. Last watermark: {watermark}")
+
+    def __get_reporting_revisions_batch(
+        self,
+        continuation_token: Optional[str],
+        start_date: Optional[datetime.datetime],
+        fields: Optional[list[str]],
+        project_scoped: bool = True,
+    ) -> dict:
+        """
+        Private method to download single batch of reporting revisions feed.
+        Returns:
+            dict: Raw response with `values`, `continuationToken` and `isLastBatch` keys.
+        """
+        scope = f"{self.__azure_api.organization}/{self.__azure_api.project}"
+        if not project_scoped:
+            scope = self.__azure_api.organization
+        url = f"https://dev.azure.com/{scope}/_apis/wit/reporting/workitemrevisions?api-version=7.1"
+        params = {}
+        if continuation_token:
+            params["continuationToken"] = continuation_token
+        elif start_date:
+            params["startDateTime"] = start_date.isoformat()
+        if fields:
+            params["fields"] = ",".join(fields)
+        response = requests.get(url, params=params, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        response_json = response.json()
+        logger.debug(f"TRACE: Reporting revisions batch received. Next token: {response_json.get('continuationToken')}")
+        return response_json
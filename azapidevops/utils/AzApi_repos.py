@@ -1,16 +1,28 @@
+import bisect
+import contextlib
+import datetime
 import json
 import logging
 import os
+import signal
 import subprocess
+import threading
+import time
+import zipfile
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, IntEnum
 from functools import wraps
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Literal, Optional, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Literal, Optional, Union
 
 from beartype import beartype
+from pydantic import BaseModel, ConfigDict
 
+from .clone_progress import CloneProgress, CloneProgressParser
+from .git_mirror_cache import GitMirrorCache
 from .http_client import handle_incorrect_response, requests
+from .pr_watcher import PullRequestEvent, PullRequestWatcher
 
 if TYPE_CHECKING:
     pass
@@ -43,12 +55,389 @@ class ReviewStateDef(IntEnum):
     Rejected = -10
 
 
+class RepositoryInfo(BaseModel):
+    """Represents repository metadata resolved once from repositories listing.
+
+    Attributes:
+        id (str): Repository GUID, used in API routes.
+        name (str): Repository name.
+        project_id (Optional[str]): Project GUID.
+        default_branch (Optional[str]): Default branch with refs/heads/ prefix, None for empty repository.
+        size (int): Size of repository in bytes.
+        remote_url (Optional[str]): HTTPS clone url.
+        ssh_url (Optional[str]): SSH clone url.
+        web_url (Optional[str]): url of repository in web browser.
+        is_disabled (bool): True for disabled repositories.
+    """
+
+    id: str
+    name: str
+    project_id: Optional[str] = None
+    default_branch: Optional[str] = None
+    size: int = 0
+    remote_url: Optional[str] = None
+    ssh_url: Optional[str] = None
+    web_url: Optional[str] = None
+    is_disabled: bool = False
+
+    @classmethod
+    def from_response(cls, repository: dict) -> "RepositoryInfo":
+        """
+        Creates repository record from raw API response data.
+        Args:
+            repository (dict): Raw repository data.
+
+        Returns:
+            RepositoryInfo: Parsed repository.
+        """
+        return cls(
+            id=repository["id"],
+            name=repository["name"],
+            project_id=(repository.get("project") or {}).get("id"),
+            default_branch=repository.get("defaultBranch"),
+            size=repository.get("size") or 0,
+            remote_url=repository.get("remoteUrl"),
+            ssh_url=repository.get("sshUrl"),
+            web_url=repository.get("webUrl"),
+            is_disabled=repository.get("isDisabled", False),
+        )
+
+
+class PullRequestReviewer(BaseModel):
+    """Represents reviewer of a Pull Request.
+
+    Attributes:
+        id (str): Reviewer's GUID.
+        unique_name (Optional[str]): Reviewer's unique name, usually email.
+        vote (int): Current vote, see `ReviewStateDef`.
+    """
+
+    id: str
+    unique_name: Optional[str] = None
+    vote: int = 0
+
+
+class PullRequest(BaseModel):
+    """Represents lightweight Pull Request record.
+
+    Attributes:
+        id (int): ID of Pull Request.
+        title (str): Title of Pull Request.
+        status (str): Status of Pull Request, see `PrStatusesDef`.
+        source_ref_name (str): Source branch with refs/heads/ prefix.
+        target_ref_name (str): Target branch with refs/heads/ prefix.
+        creation_date (datetime.datetime): Date and time when Pull Request was created.
+        closed_date (Optional[datetime.datetime]): Date and time when Pull Request was completed or abandoned.
+        created_by (Optional[str]): Unique name of creator, usually email.
+        is_draft (bool): True for draft Pull Requests.
+        reviewers (list[PullRequestReviewer]): Reviewers with their votes.
+    """
+
+    id: int
+    title: str
+    status: str
+    source_ref_name: str
+    target_ref_name: str
+    creation_date: datetime.datetime
+    closed_date: Optional[datetime.datetime] = None
+    created_by: Optional[str] = None
+    is_draft: bool = False
+    reviewers: list[PullRequestReviewer] = []
+
+    @classmethod
+    def from_response(cls, pr: dict) -> "PullRequest":
+        """
+        Creates Pull Request record from raw API response data.
+        Args:
+            pr (dict): Raw Pull Request data.
+
+        Returns:
+            PullRequest: Parsed Pull Request.
+        """
+        return cls(
+            id=pr["pullRequestId"],
+            title=pr["title"],
+            status=pr["status"],
+            source_ref_name=pr["sourceRefName"],
+            target_ref_name=pr["targetRefName"],
+            creation_date=pr["creationDate"],
+            closed_date=pr.get("closedDate"),
+            created_by=(pr.get("createdBy") or {}).get("uniqueName"),
+            is_draft=pr.get("isDraft", False),
+            reviewers=[
+                PullRequestReviewer(
+                    id=reviewer["id"], unique_name=reviewer.get("uniqueName"), vote=reviewer.get("vote", 0)
+                )
+                for reviewer in pr.get("reviewers") or []
+            ],
+        )
+
+
+class Commit(BaseModel):
+    """Represents lightweight commit record.
+
+    Attributes:
+        commit_id (str): SHA-1 of commit.
+        comment (str): Commit message, may be truncated by API.
+        author_name (Optional[str]): Name of author.
+        author_email (Optional[str]): Email of author.
+        author_date (Optional[datetime.datetime]): Date and time when commit was authored.
+        committer_date (Optional[datetime.datetime]): Date and time when commit was committed.
+        change_counts (dict[str, int]): Number of changed items by change type, e.g. {"Add": 1, "Edit": 3}.
+    """
+
+    commit_id: str
+    comment: str = ""
+    author_name: Optional[str] = None
+    author_email: Optional[str] = None
+    author_date: Optional[datetime.datetime] = None
+    committer_date: Optional[datetime.datetime] = None
+    change_counts: dict[str, int] = {}
+
+    @classmethod
+    def from_response(cls, commit: dict) -> "Commit":
+        """
+        Creates commit record from raw API response data.
+        Args:
+            commit (dict): Raw commit data.
+
+        Returns:
+            Commit: Parsed commit.
+        """
+        author = commit.get("author") or {}
+        return cls(
+            commit_id=commit["commitId"],
+            comment=commit.get("comment", ""),
+            author_name=author.get("name"),
+            author_email=author.get("email"),
+            author_date=author.get("date"),
+            committer_date=(commit.get("committer") or {}).get("date"),
+            change_counts=commit.get("changeCounts") or {},
+        )
+
+
+class PullRequestChange(BaseModel):
+    """Represents single changed item in Pull Request iteration.
+
+    Attributes:
+        path (str): Path of changed item.
+        change_type (str): Type of change, e.g. "add", "edit", "delete", "rename".
+        object_id (Optional[str]): Object ID of item after change.
+        original_object_id (Optional[str]): Object ID of item before change.
+        original_path (Optional[str]): Previous path of renamed item.
+    """
+
+    path: str
+    change_type: str
+    object_id: Optional[str] = None
+    original_object_id: Optional[str] = None
+    original_path: Optional[str] = None
+
+
+class PullRequestSpec(BaseModel):
+    """Describes Pull Request to be created by `create_prs`.
+
+    Attributes:
+        title (str): Pull Request title.
+        source_branch (str): Source branch name, with or without refs/heads.
+        target_branch (str): Target branch name, with or without refs/heads.
+        description (str): Description of Pull Request.
+        repository (Optional[str]): Repository name. Repository of the component is used by default.
+    """
+
+    title: str
+    source_branch: str
+    target_branch: str
+    description: str = ""
+    repository: Optional[str] = None
+
+
+class PullRequestCreationResult(BaseModel):
+    """Result of creating single Pull Request by `create_prs`.
+
+    Attributes:
+        spec (PullRequestSpec): Requested Pull Request.
+        pr_id (Optional[int]): ID of created or already existing Pull Request.
+        error (Optional[Exception]): Exception raised while creating Pull Request.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    spec: PullRequestSpec
+    pr_id: Optional[int] = None
+    error: Optional[Exception] = None
+
+
+class CloneSpec(BaseModel):
+    """Describes repository to be cloned by `clone_repositories`.
+
+    Attributes:
+        repository (Optional[str]): Repository name in the project. Repository of the component is used by default.
+        custom_url (Optional[str]): Link to repository, used instead of `repository`.
+        branch (Optional[str]): Name of branch to download if different from default.
+        depth (Optional[int]): Depth of downloaded history.
+        submodules (bool): Download submodules.
+        output_dir (Optional[str]): Output directory, common output directory is used by default.
+        partial_filter (Optional[Literal["blob:none", "tree:0"]]): Partial clone filter.
+        sparse_paths (Optional[list[str]]): Directories to check out in cone-mode sparse checkout.
+        single_branch (bool): Download history of a single branch only.
+        jobs (Optional[int]): Number of submodules fetched in parallel.
+    """
+
+    repository: Optional[str] = None
+    custom_url: Optional[str] = None
+    branch: Optional[str] = None
+    depth: Optional[int] = None
+    submodules: bool = False
+    output_dir: Optional[str] = None
+    partial_filter: Optional[Literal["blob:none", "tree:0"]] = None
+    sparse_paths: Optional[list[str]] = None
+    single_branch: bool = False
+    jobs: Optional[int] = None
+
+
+class CloneResult(BaseModel):
+    """Result of cloning single repository by `clone_repositories`.
+
+    Attributes:
+        spec (CloneSpec): Requested repository.
+        path (Optional[str]): Path to cloned repository.
+        duration (float): Time of cloning in seconds.
+        exit_code (Optional[int]): Return code of git process, None if process was not started.
+        error (Optional[Exception]): Exception raised while cloning.
+        progress (Optional[CloneProgress]): The last progress reported by git.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    spec: CloneSpec
+    path: Optional[str] = None
+    duration: float = 0
+    exit_code: Optional[int] = None
+    error: Optional[Exception] = None
+    progress: Optional[CloneProgress] = None
+
+
+class CloneError(RuntimeError):
+    def __init__(self, returncode: int, msg: Optional[str] = None):
+        super().__init__(msg or f"Error on cloning - Return code {returncode}")
+        self.returncode = returncode
+
+
+class CloneStallError(CloneError):
+    def __init__(self, returncode: int, stall_timeout: float):
+        super().__init__(returncode, f"Cloning stalled for {stall_timeout} seconds - process killed")
+        self.stall_timeout = stall_timeout
+
+
+def _to_branch_ref_name(branch: str) -> str:
+    """
+    Adds refs/heads/ prefix to branch name if missing.
+    Args:
+        branch (str): Branch name with or without refs/heads/ prefix.
+
+    Returns:
+        str: Branch name with refs/heads/ prefix.
+    """
+    if branch.startswith("refs/"):
+        return branch
+    return "refs/heads/" + branch
+
+
+def _to_git_version(ref: str) -> tuple[str, str]:
+    """
+    Converts git reference to version descriptor used by `searchCriteria` of Git API.
+    Args:
+        ref (str): Branch name with or without refs/heads/ prefix, tag with refs/tags/ prefix or full commit SHA-1.
+
+    Returns:
+        tuple[str, str]: version and version type - "branch", "tag" or "commit".
+    """
+    if ref.startswith("refs/heads/"):
+        return ref.removeprefix("refs/heads/"), "branch"
+    if ref.startswith("refs/tags/"):
+        return ref.removeprefix("refs/tags/"), "tag"
+    if len(ref) == 40 and all(char in "0123456789abcdefABCDEF" for char in ref):
+        return ref, "commit"
+    return ref, "branch"
+
+
+class _BranchIndex:
+    """Sorted in-memory index of branch names used for fast existence and prefix queries."""
+
+    def __init__(self, branches: dict[str, Optional[str]]):
+        """
+        Constructor for branch index.
+        Args:
+            branches (dict[str, Optional[str]]): branch names with refs/heads as keys, object IDs as values.
+        """
+        self.__object_ids = dict(branches)
+        self.__names = sorted(self.__object_ids)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__object_ids
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def get_object_id(self, name: str) -> Optional[str]:
+        """
+        Returns:
+            str: object ID of branch or None if branch is not indexed.
+        """
+        return self.__object_ids.get(name)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """
+        Finds branches starting with prefix with binary search over sorted names.
+        Args:
+            prefix (str): prefix of branch name with refs/heads.
+
+        Returns:
+            list[str]: sorted names of matching branches.
+        """
+        start = bisect.bisect_left(self.__names, prefix)
+        end = bisect.bisect_left(self.__names, prefix + "\U0010ffff", lo=start)
+        return self.__names[start:end]
+
+    def remove(self, name: str) -> None:
+        """
+        Removes branch from the index if present.
+        """
+        if self.__object_ids.pop(name, ...) is Ellipsis:
+            return
+        self.__names.pop(bisect.bisect_left(self.__names, name))
+
+
 class _AzRepos:
     def __init__(self, api: "azapidevops", repo_name):  # noqa: F821
         self.__repo_name = repo_name
         self.__azure_api = api
+        self.__repository = api.get_repository(repo_name) if isinstance(repo_name, str) and repo_name else None
+        if self.__repository is None and repo_name:
+            msg = f"Repository {repo_name} not found in project {api.project}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self.pull_requests_index_ttl: float = 60
+        self.__pr_index: dict[tuple[str, str], int] = {}
+        self.__pr_index_expires_at: float = 0
+        self.__pr_index_lock = threading.Lock()
+        self.branch_index_ttl: float = 60
+        self.__branch_index = _BranchIndex({})
+        self.__branch_index_expires_at: float = 0
+        self.__branch_index_lock = threading.Lock()
+        self.mirror_cache: Optional[GitMirrorCache] = None
         logger.info("SUCCESS: Repository Module initiated.")
 
+    @property
+    def repository(self) -> RepositoryInfo:
+        """
+        Getter for metadata of defined repository, resolved once when component was created.
+        Returns:
+            RepositoryInfo: GUID, default branch, size and urls of repository.
+        """
+        return self.__repository
+
     @_require_valid_repo_name
     def get_active_pull_requests(self, raw: bool = False) -> Union[dict[str, dict], list]:
         """
@@ -72,21 +461,20 @@ class _AzRepos:
                                 "vote": 10,},]
         """
         logger.info("Downloading list of active Pull Requests...")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/pullrequests?api-version=7.1"
-        response = requests.get(url, headers=self.__azure_api._headers())
-        if response.status_code != HTTPStatus.OK:
-            handle_incorrect_response(response)
-        logger.info("SUCCESS: Response received.")
-
-        response_json = response.json()
-        logger.info(f"SUCCESS: Detected {response_json['count']} active Pull Requests.")
-        for pr_ix, pr_params in enumerate(response_json["value"], 1):
+        all_prs = [
+            pr_params
+            for page in self.__iter_pull_requests_pages({"searchCriteria.status": PrStatusesDef.Active.value})
+            for pr_params in page
+        ]
+        logger.info(f"SUCCESS: Detected {len(all_prs)} active Pull Requests.")
+        self.__rebuild_pull_requests_index(all_prs)
+        for pr_ix, pr_params in enumerate(all_prs, 1):
             logger.debug(f"\t{pr_ix}. \t{pr_params['title']} | ID: {pr_params['pullRequestId']}")
             logger.debug(f"\t\tFrom: {pr_params['sourceRefName']} to {pr_params['targetRefName']}")
 
         # reviewers_data
         if raw:
-            return response_json["value"]
+            return all_prs
         return {
             pr_iter["pullRequestId"]: {
                 "title": pr_iter["title"],
@@ -96,9 +484,197 @@ class _AzRepos:
                 "targetRefName": pr_iter["targetRefName"],
                 "reviewers": pr_iter.get("reviewers"),
             }
-            for pr_iter in response_json["value"]
+            for pr_iter in all_prs
         }
 
+    @_require_valid_repo_name
+    def iter_pull_requests(
+        self,
+        status: Optional[PrStatusesDef] = PrStatusesDef.Active,
+        source_branch: Optional[str] = None,
+        target_branch: Optional[str] = None,
+        creator_id: Optional[str] = None,
+        reviewer_id: Optional[str] = None,
+        min_time: Optional[datetime.datetime] = None,
+        time_range_type: Literal["created", "closed"] = "created",
+        page_size: int = 100,
+        raw: bool = False,
+    ) -> Iterator[Union[PullRequest, dict]]:
+        """
+        Lazily iterates over Pull Requests in defined repository. Filters are applied server-side, pages are
+        requested with `$top`/`$skip` and the next page is downloaded in background while the current one is consumed.
+        Args:
+            status (Optional[PrStatusesDef]): Status of Pull Requests. None to list all statuses.
+            source_branch (Optional[str]): Source branch name, with or without refs/heads.
+            target_branch (Optional[str]): Target branch name, with or without refs/heads.
+            creator_id (Optional[str]): GUID of Pull Request's creator.
+            reviewer_id (Optional[str]): GUID of Pull Request's reviewer.
+            min_time (Optional[datetime.datetime]): Only Pull Requests created (or closed) after this time.
+            time_range_type (Literal["created", "closed"]): Date used by `min_time` filter.
+            page_size (int): Number of Pull Requests requested in a single call.
+            raw (bool): simplified or raw response.
+
+        Yields:
+            raw:
+                dict: Pull Request data returned by endpoint.
+            simplified:
+                PullRequest: lightweight Pull Request record.
+
+        Raises:
+            RequestException: When API Request was not successful.
+
+        Examples:
+            >>> for pr in api.Repos.iter_pull_requests(status=PrStatusesDef.Completed, target_branch="main"):
+            >>>     print(pr.id, pr.title, pr.closed_date)
+        """
+        logger.info(f"Iterating over {status.value if status else 'all'} Pull Requests...")
+        search_criteria = {"searchCriteria.status": status.value if status else "all"}
+        if source_branch:
+            search_criteria["searchCriteria.sourceRefName"] = _to_branch_ref_name(source_branch)
+        if target_branch:
+            search_criteria["searchCriteria.targetRefName"] = _to_branch_ref_name(target_branch)
+        if creator_id:
+            search_criteria["searchCriteria.creatorId"] = creator_id
+        if reviewer_id:
+            search_criteria["searchCriteria.reviewerId"] = reviewer_id
+        if min_time:
+            search_criteria["searchCriteria.minTime"] = min_time.isoformat()
+            search_criteria["searchCriteria.queryTimeRangeType"] = time_range_type
+        logger.debug(f"TRACE: Search criteria: {search_criteria}")
+
+        for page in self.__iter_pull_requests_pages(search_criteria, page_size):
+            for pr in page:
+                yield pr if raw else PullRequest.from_response(pr)
+
+    def __iter_pull_requests_pages(self, search_criteria: dict, page_size: int = 100) -> Iterator[list[dict]]:
+        """
+        Private generator which pages through Pull Requests list. The next page is requested in background while the
+        current one is processed.
+        Args:
+            search_criteria (dict): `searchCriteria.*` query parameters.
+            page_size (int): Number of Pull Requests requested in a single call.
+
+        Yields:
+            list[dict]: raw Pull Requests data from a single page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            skip = 0
+            future = executor.submit(self.__get_pull_requests_page, search_criteria, page_size, skip)
+            while future:
+                page = future.result()
+                skip += len(page)
+                future = None
+                if len(page) >= page_size:
+                    future = executor.submit(self.__get_pull_requests_page, search_criteria, page_size, skip)
+                yield page
+
+    def __get_pull_requests_page(self, search_criteria: dict, top: int, skip: int) -> list[dict]:
+        """
+        Private method to download single page of Pull Requests list.
+        Args:
+            search_criteria (dict): `searchCriteria.*` query parameters.
+            top (int): Number of Pull Requests to read.
+            skip (int): Number of Pull Requests to skip.
+
+        Returns:
+            list[dict]: raw Pull Requests data.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullrequests?api-version=7.1"
+        params = {**search_criteria, "$top": top, "$skip": skip}
+        response = requests.get(url, params=params, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        page = response.json()["value"]
+        logger.debug(f"TRACE: Received {len(page)} Pull Requests from {skip}.")
+        return page
+
+    @_require_valid_repo_name
+    def watch_pull_requests(
+        self,
+        callback: Callable[[PullRequestEvent], None],
+        min_interval: float = 5,
+        max_interval: float = 120,
+        backoff: float = 2.0,
+        start: bool = True,
+    ) -> PullRequestWatcher:
+        """
+        Creates watcher of Pull Requests in defined repository. Active Pull Requests are polled with conditional
+        requests and compared as compact snapshots, detected changes are passed to `callback` on a worker thread.
+        Args:
+            callback (Callable[[PullRequestEvent], None]): called for each created, updated, vote changed, completed
+                or abandoned Pull Request.
+            min_interval (float): shortest time between polls in seconds, used after activity.
+            max_interval (float): longest time between polls in seconds, reached when idle.
+            backoff (float): multiplier of interval after poll without changes.
+            start (bool): start polling immediately.
+
+        Returns:
+            PullRequestWatcher: watcher, stopped with `stop()`.
+
+        Examples:
+            >>> watcher = api.Repos.watch_pull_requests(lambda event: print(event.type, event.pr_id))
+            >>> watcher.stop()
+        """
+        logger.info(f"Creating Pull Requests watcher for {self.__repo_name}...")
+        watcher = PullRequestWatcher(
+            fetch_active=self.__get_active_pull_requests_if_modified,
+            fetch_one=self.__get_pull_request,
+            callback=callback,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+        )
+        return watcher.start() if start else watcher
+
+    def __get_active_pull_requests_if_modified(
+        self, etag: Optional[str] = None, page_size: int = 1000
+    ) -> Optional[tuple[list[dict], Optional[str]]]:
+        """
+        Private method to download active Pull Requests with `If-None-Match` header. ETag is only used when all
+        Pull Requests fit in the first page, as it does not describe other pages.
+        Args:
+            etag (Optional[str]): ETag from previous call.
+            page_size (int): Number of Pull Requests requested in a single call.
+
+        Returns:
+            tuple: raw Pull Requests and ETag of the response.
+            or
+            None: When Pull Requests were not modified.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullrequests?api-version=7.1"
+        search_criteria = {"searchCriteria.status": PrStatusesDef.Active.value}
+        headers = self.__azure_api._headers()
+        if etag:
+            headers = {**headers, "If-None-Match": etag}
+        response = requests.get(url, params={**search_criteria, "$top": page_size, "$skip": 0}, headers=headers)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return None
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        active_prs = response.json()["value"]
+        if len(active_prs) < page_size:
+            return active_prs, response.headers.get("ETag")
+        while True:
+            page = self.__get_pull_requests_page(search_criteria, page_size, len(active_prs))
+            active_prs.extend(page)
+            if len(page) < page_size:
+                return active_prs, None
+
+    def __get_pull_request(self, pr_id: int) -> dict:
+        """
+        Private method to download single Pull Request.
+        Args:
+            pr_id (int): ID of pull request.
+
+        Returns:
+            dict: raw Pull Request data.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullrequests/{pr_id}?api-version=7.1"
+        response = requests.get(url, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        return response.json()
+
     @_require_valid_repo_name
     def create_pr(self, pr_title: str, source_branch: str, target_branch: str, description: Optional[str] = "") -> int:
         """
@@ -116,21 +692,16 @@ class _AzRepos:
             >>> pr_id2 = api.Repos.create_pr("Test PullRequest2", "refs/heads/branch2", "refs/heads/main", "Testing API Request.")
         """  # noqa: E501
         logger.info(f"Creating new PR: {pr_title}")
-        if "refs/head" not in source_branch:
-            source_branch = "refs/heads/" + source_branch
-            logger.debug(f"TRACE: Adding prefix to source branch name: {source_branch}")
-        if "refs/head" not in target_branch:
-            target_branch = "refs/heads/" + target_branch
-            logger.debug(f"TRACE: Adding prefix to target branch name: {target_branch}")
-
-        active_prs = self.get_active_pull_requests()
-        for pr_id, pr_data in active_prs.items():
-            if pr_data.get("sourceRefName") == source_branch and pr_data.get("targetRefName") == target_branch:
-                logger.warning("This pull request already exists.")
-                return pr_id
+        source_branch = _to_branch_ref_name(source_branch)
+        target_branch = _to_branch_ref_name(target_branch)
+
+        existing_pr_id = self.find_active_pull_request(source_branch, target_branch)
+        if existing_pr_id is not None:
+            logger.warning("This pull request already exists.")
+            return existing_pr_id
 
         logger.debug(f"\t\tFrom: {source_branch} to {target_branch}")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/pullrequests?api-version=7.1"
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullrequests?api-version=7.1"
         logger.debug(f"TRACE: Requesting URL: {url}")
         payload = {
             "sourceRefName": source_branch,
@@ -144,9 +715,399 @@ class _AzRepos:
         if response.status_code != HTTPStatus.CREATED:
             handle_incorrect_response(response)
         pr_id = response.json()["pullRequestId"]
+        with self.__pr_index_lock:
+            self.__pr_index[(source_branch, target_branch)] = pr_id
         logger.info(f"SUCCESS: Response received. PR numer: {pr_id}")
         return pr_id
 
+    @_require_valid_repo_name
+    def create_prs(self, specs: list[PullRequestSpec], max_workers: int = 8) -> list[PullRequestCreationResult]:
+        """
+        Creates many Pull Requests concurrently, also in other repositories of the project. Duplicate detection is
+        shared per repository - when more than one Pull Request is requested for a repository, its active Pull
+        Requests index is downloaded once and reused. Failure of a single Pull Request does not stop the others.
+        Args:
+            specs (list[PullRequestSpec]): Pull Requests to create.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list[PullRequestCreationResult]: results in the same order as `specs`.
+
+        Examples:
+            >>> specs = [
+            >>>     PullRequestSpec(title="Backport", source_branch="fix", target_branch="release/1.0", repository=repo)
+            >>>     for repo in ["Repo1", "Repo2"]
+            >>> ]
+            >>> results = api.Repos.create_prs(specs, max_workers=4)
+            >>> failed = [result for result in results if result.error]
+        """
+        logger.info(f"Creating {len(specs)} Pull Requests...")
+        components: dict[str, _AzRepos] = {}
+        requested: dict[tuple[str, str, str], PullRequestSpec] = {}
+        spec_keys = []
+        component_errors: dict[str, Exception] = {}
+        for spec in specs:
+            repository = spec.repository or self.__repo_name
+            if repository not in components and repository not in component_errors:
+                try:
+                    components[repository] = (
+                        self if repository == self.__repo_name else _AzRepos(self.__azure_api, repository)
+                    )
+                except ValueError as e:
+                    component_errors[repository] = e
+            key = (repository, _to_branch_ref_name(spec.source_branch), _to_branch_ref_name(spec.target_branch))
+            requested.setdefault(key, spec)
+            spec_keys.append(key)
+        prs_per_repository = Counter(repository for repository, _, _ in requested)
+
+        def __refresh_index(repository: str):
+            try:
+                components[repository].refresh_pull_requests_index()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    f"Pull Requests index for {repository} not refreshed, falling back to filtered search: {e}"
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    __refresh_index,
+                    [repo for repo, count in prs_per_repository.items() if count > 1 and repo in components],
+                )
+            )
+            futures = {
+                key: executor.submit(components[key[0]].create_pr, spec.title, key[1], key[2], spec.description)
+                for key, spec in requested.items()
+                if key[0] in components
+            }
+
+        results = []
+        for spec, key in zip(specs, spec_keys, strict=True):
+            if key[0] in component_errors:
+                results.append(PullRequestCreationResult(spec=spec, error=component_errors[key[0]]))
+                continue
+            try:
+                results.append(PullRequestCreationResult(spec=spec, pr_id=futures[key].result()))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Pull Request {spec.title} in {key[0]} not created: {e}")
+                results.append(PullRequestCreationResult(spec=spec, error=e))
+        failed = sum(1 for result in results if result.error)
+        logger.info(f"SUCCESS: {len(results) - failed} Pull Requests created or found, {failed} failed.")
+        return results
+
+    @_require_valid_repo_name
+    def get_pr_iterations(self, pr_id: int) -> list[dict]:
+        """
+        Reads all iterations (pushes) of Pull Request.
+        Args:
+            pr_id (int): ID of pull request.
+
+        Returns:
+            list[dict]: raw iterations data returned by endpoint, ordered by iteration ID.
+
+        Raises:
+            RequestException: When API Request was not successful.
+        """
+        logger.info(f"Reading iterations of PR{pr_id}...")
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullRequests/{pr_id}/iterations?includeCommits=false&api-version=7.1"
+        response = requests.get(url, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        iterations = response.json()["value"]
+        logger.info(f"SUCCESS: Found {len(iterations)} iterations.")
+        return iterations
+
+    @_require_valid_repo_name
+    def get_pr_changes(
+        self,
+        pr_id: int,
+        iteration_id: Optional[int] = None,
+        compare_to: Optional[int] = None,
+        page_size: int = 2000,
+    ) -> list[PullRequestChange]:
+        """
+        Reads files changed in Pull Request iteration. Changes are requested with `$top`/`$skip` paging.
+        Args:
+            pr_id (int): ID of pull request.
+            iteration_id (Optional[int]): ID of iteration, the latest iteration by default.
+            compare_to (Optional[int]): ID of iteration to compare with, target branch by default.
+            page_size (int): number of changes requested in a single call.
+
+        Returns:
+            list[PullRequestChange]: compact change records.
+
+        Raises:
+            RequestException: When API Request was not successful.
+
+        Examples:
+            >>> [change.path for change in api.Repos.get_pr_changes(12)]
+            ["/src/main.py", "/README.md"]
+        """
+        if iteration_id is None:
+            iterations = self.get_pr_iterations(pr_id)
+            if not iterations:
+                return []
+            iteration_id = iterations[-1]["id"]
+        logger.info(f"Reading changes of PR{pr_id} iteration {iteration_id}...")
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullRequests/{pr_id}/iterations/{iteration_id}/changes?api-version=7.1"
+        params = {"$top": page_size, "$skip": 0}
+        if compare_to is not None:
+            params["$compareTo"] = compare_to
+
+        changes = []
+        while True:
+            response = requests.get(url, params=params, headers=self.__azure_api._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            response_json = response.json()
+            for entry in response_json.get("changeEntries", []):
+                item = entry.get("item") or {}
+                changes.append(
+                    PullRequestChange(
+                        path=item.get("path", ""),
+                        change_type=entry.get("changeType", ""),
+                        object_id=item.get("objectId"),
+                        original_object_id=item.get("originalObjectId"),
+                        original_path=entry.get("originalPath"),
+                    )
+                )
+            if not response_json.get("nextTop"):
+                break
+            params["$skip"] = response_json["nextSkip"]
+            params["$top"] = response_json["nextTop"]
+        logger.info(f"SUCCESS: Found {len(changes)} changes.")
+        return changes
+
+    @_require_valid_repo_name
+    def get_prs_changes(
+        self, pr_ids: list[int], max_workers: int = 8
+    ) -> dict[int, Union[list[PullRequestChange], Exception]]:
+        """
+        Reads files changed in the latest iteration of many Pull Requests concurrently.
+        Args:
+            pr_ids (list[int]): IDs of pull requests.
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict: keys are PR IDs, values are lists of changes or exception raised while reading them.
+
+        Examples:
+            >>> changes = api.Repos.get_prs_changes(list(api.Repos.get_active_pull_requests()))
+        """
+        logger.info(f"Reading changes of {len(pr_ids)} Pull Requests...")
+        pr_ids = list(dict.fromkeys(pr_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {pr_id: executor.submit(self.get_pr_changes, pr_id) for pr_id in pr_ids}
+        results = {}
+        for pr_id, future in futures.items():
+            try:
+                results[pr_id] = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Changes of PR{pr_id} not read: {e}")
+                results[pr_id] = e
+        logger.info("SUCCESS: Pull Requests changes read.")
+        return results
+
+    @_require_valid_repo_name
+    def find_active_pull_request(self, source_branch: str, target_branch: str) -> Optional[int]:
+        """
+        Searches active Pull Request for pair of branches. When Pull Requests index is fresh lookup is done locally
+        without any request, otherwise a single request filtered server-side by branch names is sent.
+        Args:
+            source_branch (str): Source branch name, with or without refs/heads.
+            target_branch (str): Target branch name, with or without refs/heads.
+
+        Returns:
+            int: ID of active Pull Request.
+            or
+            None: When there is no active Pull Request for these branches.
+
+        Examples:
+            >>> api.Repos.refresh_pull_requests_index()
+            >>> api.Repos.find_active_pull_request("TestBranch", "main")
+            12
+        """
+        key = (_to_branch_ref_name(source_branch), _to_branch_ref_name(target_branch))
+        with self.__pr_index_lock:
+            if time.monotonic() < self.__pr_index_expires_at:
+                logger.debug(f"TRACE: Pull Requests index lookup for {key}.")
+                return self.__pr_index.get(key)
+
+        logger.debug(f"TRACE: Pull Requests index expired, searching {key} server-side.")
+        search_criteria = {
+            "searchCriteria.status": PrStatusesDef.Active.value,
+            "searchCriteria.sourceRefName": key[0],
+            "searchCriteria.targetRefName": key[1],
+        }
+        page = self.__get_pull_requests_page(search_criteria, top=1, skip=0)
+        if not page:
+            return None
+        with self.__pr_index_lock:
+            self.__pr_index[key] = page[0]["pullRequestId"]
+        return page[0]["pullRequestId"]
+
+    @_require_valid_repo_name
+    def refresh_pull_requests_index(self) -> None:
+        """
+        Downloads all active Pull Requests and rebuilds index used by `find_active_pull_request` and `create_pr`.
+        Index stays fresh for `pull_requests_index_ttl` seconds and is updated by Pull Requests created or changed by
+        this client.
+
+        Examples:
+            >>> api.Repos.pull_requests_index_ttl = 300
+            >>> api.Repos.refresh_pull_requests_index()
+            >>> for branch in branches:
+            >>>     api.Repos.create_pr(f"Merge {branch}", branch, "main")
+        """
+        logger.info("Refreshing active Pull Requests index...")
+        all_prs = [
+            pr_params
+            for page in self.__iter_pull_requests_pages({"searchCriteria.status": PrStatusesDef.Active.value})
+            for pr_params in page
+        ]
+        self.__rebuild_pull_requests_index(all_prs)
+        logger.info(f"SUCCESS: Pull Requests index refreshed with {len(all_prs)} active Pull Requests.")
+
+    def __rebuild_pull_requests_index(self, active_prs: list[dict]) -> None:
+        """
+        Private method to replace Pull Requests index with complete list of active Pull Requests.
+        Args:
+            active_prs (list[dict]): raw data of all active Pull Requests.
+        """
+        with self.__pr_index_lock:
+            self.__pr_index = {(pr["sourceRefName"], pr["targetRefName"]): pr["pullRequestId"] for pr in active_prs}
+            self.__pr_index_expires_at = time.monotonic() + self.pull_requests_index_ttl
+
+    @_require_valid_repo_name
+    def iter_commits(
+        self,
+        item_version: Optional[str] = None,
+        compare_version: Optional[str] = None,
+        author: Optional[str] = None,
+        from_date: Optional[datetime.datetime] = None,
+        to_date: Optional[datetime.datetime] = None,
+        item_path: Optional[str] = None,
+        page_size: int = 1000,
+        repository: Optional[str] = None,
+    ) -> Iterator[Commit]:
+        """
+        Lazily iterates over commits history. Filters are applied server-side, pages are requested with
+        `searchCriteria.$top`/`searchCriteria.$skip` and the next page is downloaded in background while the current
+        one is consumed.
+        Args:
+            item_version (Optional[str]): Branch, tag (refs/tags/...) or commit SHA-1 which history is read. Default
+                branch by default. With `compare_version` it is the base - its commits are excluded.
+            compare_version (Optional[str]): Branch, tag or commit SHA-1 compared with `item_version`. Only commits
+                reachable from `compare_version` and not from `item_version` are returned.
+            author (Optional[str]): Name or email of commits author.
+            from_date (Optional[datetime.datetime]): Only commits after this time.
+            to_date (Optional[datetime.datetime]): Only commits before this time.
+            item_path (Optional[str]): Only commits changing this path.
+            page_size (int): Number of commits requested in a single call.
+            repository (Optional[str]): Other repository of the project, defined repository by default.
+
+        Yields:
+            Commit: lightweight commit record, newest first.
+
+        Raises:
+            RequestException: When API Request was not successful.
+
+        Examples:
+            >>> for commit in api.Repos.iter_commits(item_version="refs/tags/v1.0", compare_version="main"):
+            >>>     print(commit.commit_id[:8], commit.comment)
+        """
+        repository = repository or self.__repo_name
+        logger.info(f"Iterating over commits of {repository}...")
+        repository_info = self.__azure_api.get_repository(repository)
+        repository = repository_info.id if repository_info else repository
+        search_criteria = {}
+        if item_version:
+            version, version_type = _to_git_version(item_version)
+            search_criteria["searchCriteria.itemVersion.version"] = version
+            search_criteria["searchCriteria.itemVersion.versionType"] = version_type
+        if compare_version:
+            version, version_type = _to_git_version(compare_version)
+            search_criteria["searchCriteria.compareVersion.version"] = version
+            search_criteria["searchCriteria.compareVersion.versionType"] = version_type
+        if author:
+            search_criteria["searchCriteria.author"] = author
+        if from_date:
+            search_criteria["searchCriteria.fromDate"] = from_date.isoformat()
+        if to_date:
+            search_criteria["searchCriteria.toDate"] = to_date.isoformat()
+        if item_path:
+            search_criteria["searchCriteria.itemPath"] = item_path
+        logger.debug(f"TRACE: Search criteria: {search_criteria}")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            skip = 0
+            future = executor.submit(self.__get_commits_page, repository, search_criteria, page_size, skip)
+            while future:
+                page = future.result()
+                skip += len(page)
+                future = None
+                if len(page) >= page_size:
+                    future = executor.submit(self.__get_commits_page, repository, search_criteria, page_size, skip)
+                for commit in page:
+                    yield Commit.from_response(commit)
+
+    @_require_valid_repo_name
+    def get_commits_between(
+        self, base: str, target: str, repositories: Optional[list[str]] = None, max_workers: int = 4
+    ) -> dict[str, Union[list[Commit], Exception]]:
+        """
+        Reads commits reachable from `target` but not from `base` in many repositories concurrently.
+        Args:
+            base (str): Base branch, tag (refs/tags/...) or commit SHA-1, e.g. previous release.
+            target (str): Target branch, tag or commit SHA-1, e.g. current release.
+            repositories (Optional[list[str]]): Repositories of the project, defined repository by default.
+            max_workers (int): Maximum number of concurrent repositories.
+
+        Returns:
+            dict: keys are repositories names, values are lists of commits or exception raised while reading them.
+
+        Examples:
+            >>> notes = api.Repos.get_commits_between("refs/tags/v1.0", "refs/tags/v1.1", ["Repo1", "Repo2"])
+        """
+        repositories = list(dict.fromkeys(repositories or [self.__repo_name]))
+        logger.info(f"Reading commits between {base} and {target} in {len(repositories)} repositories...")
+
+        def __read_commits(repository: str) -> list[Commit]:
+            return list(self.iter_commits(item_version=base, compare_version=target, repository=repository))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {repository: executor.submit(__read_commits, repository) for repository in repositories}
+        results = {}
+        for repository, future in futures.items():
+            try:
+                results[repository] = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Commits of {repository} not read: {e}")
+                results[repository] = e
+        logger.info("SUCCESS: Commits read.")
+        return results
+
+    def __get_commits_page(self, repository: str, search_criteria: dict, top: int, skip: int) -> list[dict]:
+        """
+        Private method to download single page of commits.
+        Args:
+            repository (str): Repository GUID or name.
+            search_criteria (dict): `searchCriteria.*` query parameters.
+            top (int): Number of commits to read.
+            skip (int): Number of commits to skip.
+
+        Returns:
+            list[dict]: raw commits data.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{repository}/commits?api-version=7.1"
+        params = {**search_criteria, "searchCriteria.$top": top, "searchCriteria.$skip": skip}
+        response = requests.get(url, params=params, headers=self.__azure_api._headers())
+        if response.status_code != HTTPStatus.OK:
+            handle_incorrect_response(response)
+        page = response.json()["value"]
+        logger.debug(f"TRACE: Received {len(page)} commits from {skip}.")
+        return page
+
     @_require_valid_repo_name
     def get_all_branches(self, raw: bool = False) -> Union[dict[str, dict], list]:
         """
@@ -165,13 +1126,14 @@ class _AzRepos:
             {"refs/heads/master": {"creator": "NameUser SurnameUser"}}
         """
         logger.info("Reading list of all branches...")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/refs?filter=heads/&api-version=7.1"
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/refs?filter=heads/&api-version=7.1"
         response = requests.get(url, headers=self.__azure_api._headers())
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
         logger.info("SUCCESS: Response received.")
         for index, branch in enumerate(response.json()["value"], 1):
             logger.debug(f"\t\t{index}:\t {branch['name']}")
+        self.__rebuild_branch_index(response.json()["value"])
         if raw:
             return response.json()["value"]
         return {
@@ -182,6 +1144,121 @@ class _AzRepos:
             for branch_iter in response.json()["value"]
         }
 
+    @_require_valid_repo_name
+    def iter_branches(
+        self, prefix: Optional[str] = None, contains: Optional[str] = None, page_size: int = 1000
+    ) -> Iterator[dict]:
+        """
+        Lazily iterates over branches filtered server-side. Pages are requested with `$top` and continuation token.
+        Args:
+            prefix (Optional[str]): prefix of branch name, with or without refs/heads, e.g. "release/".
+            contains (Optional[str]): text which must be contained in branch name.
+            page_size (int): number of branches requested in a single call.
+
+        Yields:
+            dict: raw branch data returned by endpoint.
+
+        Examples:
+            >>> [branch["name"] for branch in api.Repos.iter_branches(prefix="release/")]
+            ["refs/heads/release/1.0", "refs/heads/release/1.1"]
+        """
+        ref_filter = _to_branch_ref_name(prefix or "")[len("refs/") :]
+        logger.info(f"Iterating over branches matching {ref_filter}{f' containing {contains}' if contains else ''}...")
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/refs?api-version=7.1"
+        params = {"filter": ref_filter, "$top": page_size}
+        if contains:
+            params["filterContains"] = contains
+        while True:
+            response = requests.get(url, params=params, headers=self.__azure_api._headers())
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            yield from response.json()["value"]
+            continuation_token = response.headers.get("x-ms-continuationtoken")
+            logger.debug(f"TRACE: Next page token: {continuation_token}")
+            if not continuation_token:
+                return
+            params["continuationToken"] = continuation_token
+
+    @_require_valid_repo_name
+    def refresh_branch_index(self) -> None:
+        """
+        Downloads names and object IDs of all branches and rebuilds index used by `branch_exists`, `find_branches`
+        and `get_branch_object_id`. Index stays fresh for `branch_index_ttl` seconds.
+        """
+        logger.info("Refreshing branch index...")
+        self.__rebuild_branch_index(list(self.iter_branches()))
+        logger.info(f"SUCCESS: Branch index refreshed with {len(self.__branch_index)} branches.")
+
+    @_require_valid_repo_name
+    def find_branches(self, prefix: str) -> list[str]:
+        """
+        Finds branches with names starting with prefix. Uses branch index when fresh, otherwise a request filtered
+        server-side is sent.
+        Args:
+            prefix (str): prefix of branch name, with or without refs/heads, e.g. "release/".
+
+        Returns:
+            list[str]: sorted names of matching branches with refs/heads.
+
+        Examples:
+            >>> api.Repos.refresh_branch_index()
+            >>> api.Repos.find_branches("release/")
+            ["refs/heads/release/1.0", "refs/heads/release/1.1"]
+        """
+        ref_prefix = _to_branch_ref_name(prefix)
+        with self.__branch_index_lock:
+            if time.monotonic() < self.__branch_index_expires_at:
+                return self.__branch_index.with_prefix(ref_prefix)
+        return sorted(branch["name"] for branch in self.iter_branches(prefix=ref_prefix))
+
+    @_require_valid_repo_name
+    def get_branch_object_id(self, branch_name: str) -> Optional[str]:
+        """
+        Reads object ID of the branch. Uses branch index when fresh, otherwise a request filtered server-side is sent.
+        Args:
+            branch_name (str): branch name, with or without refs/heads.
+
+        Returns:
+            str: object ID of the last commit on branch.
+            or
+            None: When branch does not exist.
+        """
+        ref_name = _to_branch_ref_name(branch_name)
+        with self.__branch_index_lock:
+            if time.monotonic() < self.__branch_index_expires_at:
+                return self.__branch_index.get_object_id(ref_name)
+        for branch in self.iter_branches(prefix=ref_name):
+            if branch["name"] == ref_name:
+                return branch.get("objectId")
+        return None
+
+    @_require_valid_repo_name
+    def branch_exists(self, branch_name: str) -> bool:
+        """
+        Checks if branch exists. Uses branch index when fresh, otherwise a request filtered server-side is sent.
+        Args:
+            branch_name (str): branch name, with or without refs/heads.
+
+        Returns:
+            bool: True if branch exists.
+        """
+        ref_name = _to_branch_ref_name(branch_name)
+        with self.__branch_index_lock:
+            if time.monotonic() < self.__branch_index_expires_at:
+                return ref_name in self.__branch_index
+        return any(branch["name"] == ref_name for branch in self.iter_branches(prefix=ref_name))
+
+    def __rebuild_branch_index(self, branches: list[dict]) -> None:
+        """
+        Private method to replace branch index with complete list of branches.
+        Args:
+            branches (list[dict]): raw data of all branches.
+        """
+        index = _BranchIndex({branch["name"]: branch.get("objectId") for branch in branches})
+        with self.__branch_index_lock:
+            self.__branch_index = index
+            self.__branch_index_expires_at = time.monotonic() + self.branch_index_ttl
+
     @_require_valid_repo_name
     def get_pullrequest_url(self, pr_id: int) -> str:
         """
@@ -211,50 +1288,112 @@ class _AzRepos:
             branch (Optional[str]): name of branch to download if different from default
             **kwargs:
                 custom_url (Optional[str]): link to different repository then defined in parent azapidevops class.
+                partial_filter (Optional[Literal["blob:none", "tree:0"]]): partial clone filter, blobs (or trees) are
+                    downloaded on demand.
+                sparse_paths (Optional[list[str]]): directories to check out in cone-mode sparse checkout.
+                single_branch (bool): download history of a single branch only.
+                jobs (Optional[int]): number of submodules fetched in parallel.
+                progress_callback (Optional[Callable[[CloneProgress], None]]): called with each progress update
+                    parsed from git output: stage, objects, received bytes, throughput and submodule.
+                stall_timeout (Optional[float]): git process is killed when no progress (or only transfer slower than
+                    `min_throughput`) is reported for this number of seconds.
+                min_throughput (float): minimum transfer speed in bytes per second counted as progress.
         Returns:
             str: Path to repository dir.
             or
             None: When directory to cloned repo was not found in output.
+        Raises:
+            CloneError: When git process failed.
+            CloneStallError: When git process was killed after `stall_timeout`.
+        Examples:
+            >>> api.Repos.mirror_cache = GitMirrorCache("/var/cache/git-mirrors", max_size=50 * 1024**3)
+            >>> api.Repos.clone_repository(tempfile.gettempdir(), branch="main")
+            >>> api.Repos.clone_repository(
+            >>>     tempfile.gettempdir(), partial_filter="blob:none", sparse_paths=["src/app"], single_branch=True
+            >>> )
+            >>> api.Repos.clone_repository(
+            >>>     tempfile.gettempdir(), progress_callback=print, stall_timeout=120, min_throughput=10 * 1024
+            >>> )
+
+        When `mirror_cache` is set, a local bare mirror of the repository is updated with `git fetch` and used as
+        `--reference` with `--dissociate`, so only objects missing in the mirror are transferred from the server.
         """
         custom_url = kwargs.get("custom_url")
         repo_log_name = custom_url if custom_url is not None else self.__repo_name
         logger.info(f"Cloning repository {repo_log_name}...")
         logger.debug(f"TRACE: \tOutput directory: {output_dir}, Depth {depth}, Branch: {branch}")
-        git_url_std = f"https://{self.__azure_api.organization}@dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_git/{self.__repo_name}"  # noqa: E501
-        repo_url = custom_url if custom_url else git_url_std
-        command = ["git", "clone", repo_url]
+        repo_url = custom_url if custom_url else self.__get_clone_url(self.__repo_name)
+        command = ["git", "clone", "--progress", repo_url]
         if submodules:
             command.extend(["--recurse-submodules", "--shallow-submodules"])
         if branch:
             command.extend(["--branch", branch])
         if depth:
             command.extend(["--depth", str(depth)])
+        partial_filter = kwargs.get("partial_filter")
+        sparse_paths = kwargs.get("sparse_paths")
+        if partial_filter:
+            command.append(f"--filter={partial_filter}")
+        if sparse_paths:
+            command.append("--sparse")
+        if kwargs.get("single_branch"):
+            command.append("--single-branch")
+        if jobs := kwargs.get("jobs"):
+            command.extend(["--jobs", str(jobs)])
         env = os.environ.copy()
 
-        proc = subprocess.Popen(
-            command,
-            cwd=output_dir,
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-        )
+        stall_timeout = kwargs.get("stall_timeout")
+        parser = CloneProgressParser(kwargs.get("progress_callback"), kwargs.get("min_throughput", 0))
 
         def __thread_pool_stream_reader(stream, log_function):
             for line in iter(stream.readline, ""):
                 log_function(line.rstrip())
             stream.close()
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            executor.submit(__thread_pool_stream_reader, proc.stdout, logger.info)
-            logger.debug("Reading stdout initialized...")
-            executor.submit(__thread_pool_stream_reader, proc.stderr, logger.debug)
-            logger.debug("Reading stderr initialized...")
+        def __progress_stream_reader(stream):
+            for line in iter(stream.readline, ""):
+                line = line.rstrip()
+                if parser.feed(line) is None or line.endswith("done."):
+                    logger.debug(line)
+            stream.close()
+
+        mirror_context = self.mirror_cache.reference(repo_url) if self.mirror_cache else contextlib.nullcontext()
+        with mirror_context as mirror_path:
+            if mirror_path:
+                command.extend(["--reference", mirror_path, "--dissociate"])
+            proc = subprocess.Popen(
+                command,
+                cwd=output_dir,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                start_new_session=bool(stall_timeout),
+            )
 
-        if proc.wait():
-            logger.error(f"Error on cloning - Return code {proc.wait()}")
-            raise RuntimeError
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                try:
+                    executor.submit(__thread_pool_stream_reader, proc.stdout, logger.info)
+                    logger.debug("Reading stdout initialized...")
+                    executor.submit(__progress_stream_reader, proc.stderr)
+                    logger.debug("Reading stderr initialized...")
+                    stalled = bool(stall_timeout) and self.__kill_on_stall(proc, parser, stall_timeout)
+                    return_code = proc.wait()
+                except BaseException:
+                    logger.warning("Cloning interrupted. Killing process.")
+                    self.__kill_process_tree(proc, new_session=bool(stall_timeout))
+                    proc.wait()
+                    raise
+
+        if parser.progress:
+            logger.debug(f"TRACE: Received {parser.progress.received_bytes} bytes in {parser.progress.elapsed:.1f}s.")
+        if stalled:
+            logger.error(f"Cloning stalled for {stall_timeout} seconds - process killed.")
+            raise CloneStallError(return_code, stall_timeout)
+        if return_code:
+            logger.error(f"Error on cloning - Return code {return_code}")
+            raise CloneError(return_code)
         logger.info("SUCCESS: Cloning finished.")
         try:
             proc.terminate()
@@ -267,14 +1406,280 @@ class _AzRepos:
 
         url_splitted = repo_url.split(sep="/")
         last_part = url_splitted[-1].lower().replace(".git", "")
+        repo_path = None
         try:
             matched_dirs = [directory for directory in os.listdir(output_dir) if directory.lower() == last_part]
             if matched_dirs:
-                return os.path.join(output_dir, matched_dirs[0])
+                repo_path = os.path.join(output_dir, matched_dirs[0])
         except FileNotFoundError:
             pass
-        logger.warning("Directory not found.")
-        return
+        if not repo_path:
+            logger.warning("Directory not found.")
+            return
+        if sparse_paths:
+            self.__set_sparse_checkout(repo_path, sparse_paths)
+        return repo_path
+
+    @staticmethod
+    def __kill_on_stall(proc: subprocess.Popen, parser: CloneProgressParser, stall_timeout: float) -> bool:
+        """
+        Private method to watch git process until it ends and kill it when progress stalls. Whole process tree is
+        killed, as git helpers (`git-remote-https`, `index-pack`) inherit output pipes and would keep readers blocked.
+        Args:
+            proc (subprocess.Popen): git process.
+            parser (CloneProgressParser): parser of git progress output.
+            stall_timeout (float): maximum time in seconds without progress.
+
+        Returns:
+            bool: True if process was killed.
+        """
+        while proc.poll() is None:
+            if parser.idle_time > stall_timeout:
+                logger.warning(f"No clone progress for {parser.idle_time:.1f} seconds. Killing process.")
+                _AzRepos.__kill_process_tree(proc, new_session=True)
+                return True
+            time.sleep(min(1.0, stall_timeout / 4))
+        return False
+
+    @staticmethod
+    def __kill_process_tree(proc: subprocess.Popen, new_session: bool) -> None:
+        """
+        Private method to kill git process. Process started in a new session is killed with its whole process group.
+        Args:
+            proc (subprocess.Popen): git process.
+            new_session (bool): process was started with `start_new_session`.
+        """
+        if new_session:
+            if os.name == "posix":
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True, check=False)
+        proc.kill()
+
+    @staticmethod
+    def __set_sparse_checkout(repo_path: str, sparse_paths: list[str]) -> None:
+        """
+        Private method to limit working tree of cloned repository to defined directories with cone-mode sparse
+        checkout. Missing blobs of partial clone are downloaded by git at this step.
+        Args:
+            repo_path (str): path to cloned repository.
+            sparse_paths (list[str]): directories to check out.
+
+        Raises:
+            CloneError: When git process failed.
+        """
+        logger.info(f"Setting sparse checkout: {sparse_paths}")
+        result = subprocess.run(
+            ["git", "sparse-checkout", "set", "--cone", *sparse_paths],
+            cwd=repo_path,
+            env=os.environ.copy(),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        logger.debug(result.stderr.rstrip())
+        if result.returncode:
+            logger.error(f"Error on sparse checkout - Return code {result.returncode}")
+            raise CloneError(result.returncode)
+        logger.info("SUCCESS: Sparse checkout set.")
+
+    def clone_repositories(
+        self,
+        specs: list[CloneSpec],
+        output_dir: str,
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[CloneSpec, CloneProgress], None]] = None,
+        stall_timeout: Optional[float] = None,
+        min_throughput: float = 0,
+    ) -> list[CloneResult]:
+        """
+        Clones many repositories concurrently with bounded number of git processes. Each process is handled by
+        `clone_repository`, so its output is streamed to logger and `mirror_cache` is used when set.
+        Args:
+            specs (list[CloneSpec]): Repositories to clone.
+            output_dir (str): Common output directory for specs without own `output_dir`.
+            max_workers (int): Maximum number of concurrent git processes.
+            progress_callback (Optional[Callable[[CloneSpec, CloneProgress], None]]): called with each progress update
+                of each repository.
+            stall_timeout (Optional[float]): git process is killed when no progress is reported for this number of
+                seconds, see `clone_repository`.
+            min_throughput (float): minimum transfer speed in bytes per second counted as progress.
+
+        Returns:
+            list[CloneResult]: results in the same order as `specs`, with the last progress reported by git.
+
+        Examples:
+            >>> results = api.Repos.clone_repositories(
+            >>>     [CloneSpec(repository=name, depth=1) for name in ["Repo1", "Repo2", "Repo3"]],
+            >>>     output_dir=tempfile.gettempdir(),
+            >>>     max_workers=8,
+            >>> )
+            >>> failed = [result.spec.repository for result in results if result.exit_code != 0]
+        """
+        logger.info(f"Cloning {len(specs)} repositories with {max_workers} workers...")
+
+        def __clone(spec: CloneSpec) -> CloneResult:
+            start = time.monotonic()
+            url = spec.custom_url or self.__get_clone_url(spec.repository or self.__repo_name)
+            last_progress: list[CloneProgress] = []
+
+            def __on_progress(progress: CloneProgress):
+                last_progress[:] = [progress]
+                if progress_callback:
+                    progress_callback(spec, progress)
+
+            try:
+                path = self.clone_repository(
+                    spec.output_dir or output_dir,
+                    submodules=spec.submodules,
+                    depth=spec.depth,
+                    branch=spec.branch,
+                    custom_url=url,
+                    partial_filter=spec.partial_filter,
+                    sparse_paths=spec.sparse_paths,
+                    single_branch=spec.single_branch,
+                    jobs=spec.jobs,
+                    progress_callback=__on_progress,
+                    stall_timeout=stall_timeout,
+                    min_throughput=min_throughput,
+                )
+                result = CloneResult(spec=spec, path=path, exit_code=0)
+            except CloneError as e:
+                result = CloneResult(spec=spec, exit_code=e.returncode, error=e)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Cloning {url} failed: {e}")
+                result = CloneResult(spec=spec, error=e)
+            result.duration = time.monotonic() - start
+            result.progress = last_progress[0] if last_progress else None
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(__clone, specs))
+        failed = sum(1 for result in results if result.exit_code != 0)
+        logger.info(f"SUCCESS: {len(results) - failed} repositories cloned, {failed} failed.")
+        return results
+
+    def __get_clone_url(self, repo_name: str) -> str:
+        """
+        Private method to generate HTTPS clone url of repository in the project.
+        Args:
+            repo_name (str): Repository name.
+
+        Returns:
+            str: url for `git clone`.
+        """
+        repository_info = self.__azure_api.get_repository(repo_name)
+        if repository_info and repository_info.remote_url:
+            return repository_info.remote_url
+        return f"https://{self.__azure_api.organization}@dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_git/{repo_name}"
+
+    @_require_valid_repo_name
+    def download_archive(
+        self,
+        output_path: str,
+        path: str = "/",
+        version: Optional[str] = None,
+        version_type: Literal["branch", "commit", "tag"] = "branch",
+        extract_to: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> str:
+        """
+        Downloads zip archive of repository's directory through Git Items API, git is not required. Response is
+        streamed to disk in fixed-size chunks, so archive is never held in memory.
+        Args:
+            output_path (str): path to output zip file.
+            path (str): directory in repository, whole repository by default.
+            version (Optional[str]): branch name, commit ID or tag. Default branch by default.
+            version_type (Literal["branch", "commit", "tag"]): type of `version`.
+            extract_to (Optional[str]): directory where archive is extracted member by member after download.
+            chunk_size (int): size of chunks written to disk in bytes.
+
+        Returns:
+            str: path to zip file, or to `extract_to` directory if set.
+
+        Raises:
+            RequestException: When API Request was not successful.
+
+        Examples:
+            >>> api.Repos.download_archive("/tmp/repo.zip", version="b79abb61", version_type="commit", extract_to="/tmp/repo")
+        """  # noqa: E501
+        logger.info(f"Downloading archive of {self.__repo_name}{path} at {version or 'default branch'}...")
+        params = {"path": path, "$format": "zip", "download": "true", "recursionLevel": "full"}
+        self.__download_item(params, version, version_type, output_path, chunk_size)
+        if not extract_to:
+            return output_path
+
+        logger.info(f"Extracting archive to {extract_to}...")
+        with zipfile.ZipFile(output_path) as archive:
+            for member in archive.infolist():
+                archive.extract(member, extract_to)
+        logger.info("SUCCESS: Archive extracted.")
+        return extract_to
+
+    @_require_valid_repo_name
+    def download_file(
+        self,
+        path: str,
+        output_path: str,
+        version: Optional[str] = None,
+        version_type: Literal["branch", "commit", "tag"] = "branch",
+        chunk_size: int = 1024 * 1024,
+    ) -> str:
+        """
+        Downloads single file from repository through Git Items API. Response is streamed to disk in fixed-size chunks.
+        Args:
+            path (str): path to file in repository.
+            output_path (str): path to output file.
+            version (Optional[str]): branch name, commit ID or tag. Default branch by default.
+            version_type (Literal["branch", "commit", "tag"]): type of `version`.
+            chunk_size (int): size of chunks written to disk in bytes.
+
+        Returns:
+            str: path to downloaded file.
+
+        Raises:
+            RequestException: When API Request was not successful.
+
+        Examples:
+            >>> api.Repos.download_file("/build/config.json", "config.json", version="release/1.0")
+        """
+        logger.info(f"Downloading file {path} from {self.__repo_name} at {version or 'default branch'}...")
+        params = {"path": path, "$format": "octetStream", "download": "true"}
+        return self.__download_item(params, version, version_type, output_path, chunk_size)
+
+    def __download_item(
+        self, params: dict, version: Optional[str], version_type: str, output_path: str, chunk_size: int
+    ) -> str:
+        """
+        Private method to stream Git Items API response to file. Data is written to temporary `.part` file which
+        replaces `output_path` when download is complete.
+        Returns:
+            str: path to downloaded file.
+        """
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/items?api-version=7.1"
+        if version:
+            params = {**params, "versionDescriptor.version": version, "versionDescriptor.versionType": version_type}
+        response = requests.get(url, params=params, headers=self.__azure_api._headers(), stream=True)
+        try:
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response)
+            part_path = output_path + ".part"
+            downloaded = 0
+            try:
+                with open(part_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        file.write(chunk)
+                        downloaded += len(chunk)
+                os.replace(part_path, output_path)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(part_path)
+                raise
+        finally:
+            response.close()
+        logger.info(f"SUCCESS: Downloaded {downloaded} bytes to {output_path}.")
+        return output_path
 
     @_require_valid_repo_name
     @beartype
@@ -298,7 +1703,7 @@ class _AzRepos:
         else:
             guid = user
 
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/pullRequests/{pr_id}/reviewers/{guid}?api-version=7.2-preview.1"
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullRequests/{pr_id}/reviewers/{guid}?api-version=7.2-preview.1"
         payload = {
             "id": guid,
             "vote": state.value,
@@ -308,6 +1713,73 @@ class _AzRepos:
             handle_incorrect_response(response)
         logger.info(f"SUCCESS: Response: {response.status_code}, User added as reviewer.")
 
+    @_require_valid_repo_name
+    def add_pr_reviewers(
+        self,
+        pr_ids: list[int],
+        users: list[str],
+        by: Literal["email", "guid"] = "email",
+        state: ReviewStateDef = ReviewStateDef.No_vote,
+        max_workers: int = 8,
+    ) -> dict[int, Union[list[dict], Exception]]:
+        """
+        Adds many reviewers to many Pull Requests. Users are resolved to GUIDs once and all of them are added to each
+        Pull Request with a single request to reviewers collection. Pull Requests are updated concurrently.
+        Args:
+            pr_ids (list[int]): IDs of pull requests.
+            users (list[str]): user identifiers. By default emails, but also can be GUIDs. Configured by `by` attribute
+            by (Literal["email", "guid"]): type of identifiers in `users`.
+            state (ReviewStateDef): initial vote of reviewers.
+            max_workers (int): maximum number of concurrent requests.
+
+        Returns:
+            dict: keys are PR IDs, values are reviewers returned by API or exception raised while adding them.
+
+        Raises:
+            ValueError: When any of emails was not found in organization users. No Pull Request is changed then.
+
+        Examples:
+            >>> api.Repos.add_pr_reviewers([101, 102], ["user1@gmail.com", "user2@gmail.com"])
+        """
+        logger.info(f"Adding {len(users)} reviewers to {len(pr_ids)} Pull Requests...")
+        users = list(dict.fromkeys(users))
+        if by == "email":
+            guids = []
+            not_found = []
+            for user in users:
+                descriptor = self.__azure_api.search_user_aad_descriptor_by_email(user)
+                if descriptor is None:
+                    not_found.append(user)
+                    continue
+                guids.append(self.__azure_api.get_guid_by_descriptor(descriptor))
+            if not_found:
+                msg = f"Users not found: {not_found}"
+                logger.error(msg)
+                raise ValueError(msg)
+        else:
+            guids = users
+        payload = [{"id": guid, "vote": state.value} for guid in guids]
+
+        def __add_reviewers(pr_id: int) -> list[dict]:
+            url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullRequests/{pr_id}/reviewers?api-version=7.1"
+            response = requests.post(url, json=payload, headers=self.__azure_api._headers("application/json"))
+            if response.status_code not in [HTTPStatus.OK, HTTPStatus.CREATED]:
+                handle_incorrect_response(response)
+            return response.json().get("value", [])
+
+        pr_ids = list(dict.fromkeys(pr_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {pr_id: executor.submit(__add_reviewers, pr_id) for pr_id in pr_ids}
+        results = {}
+        for pr_id, future in futures.items():
+            try:
+                results[pr_id] = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Reviewers not added to PR{pr_id}: {e}")
+                results[pr_id] = e
+        logger.info(f"SUCCESS: Reviewers added to {sum(not isinstance(r, Exception) for r in results.values())} PRs.")
+        return results
+
     @_require_valid_repo_name
     def delete_branch(self, branch_name: str):
         """
@@ -316,7 +1788,7 @@ class _AzRepos:
             branch_name: string with branch name
         """
         logger.info(f"Deleting {branch_name}")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/refs?api-version=7.2-preview.2"
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/refs?api-version=7.2-preview.2"
         if not branch_name.startswith("refs/heads/"):
             branch_name = "refs/heads/" + branch_name
             logger.debug("Adding refs/heads/ to branch name.")
@@ -339,8 +1811,73 @@ class _AzRepos:
         )
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
+        with self.__branch_index_lock:
+            self.__branch_index.remove(branch_name)
         logger.info("SUCCESS: Branch deleted.")
 
+    @_require_valid_repo_name
+    def delete_branches(self, branch_names: list[str], chunk_size: int = 100) -> dict[str, dict]:
+        """
+        Deletes many branches from repository. Object IDs of all branches are resolved from a single branches
+        listing and deletions are sent in chunks, each chunk as a single refs update request.
+        Args:
+            branch_names (list[str]): names of branches, with or without refs/heads.
+            chunk_size (int): maximum number of branches deleted in a single request.
+
+        Returns:
+            dict: keys are branch names with refs/heads, values are dicts with `success` flag and `updateStatus`.
+                Branches missing in repository are reported with `notFound` status.
+
+        Examples:
+            >>> api.Repos.delete_branches(["feature/old1", "refs/heads/feature/old2", "missing"])
+            {"refs/heads/feature/old1": {"success": True, "updateStatus": "succeeded"},
+             "refs/heads/feature/old2": {"success": True, "updateStatus": "succeeded"},
+             "refs/heads/missing": {"success": False, "updateStatus": "notFound"}}
+        """
+        logger.info(f"Deleting {len(branch_names)} branches...")
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/refs?api-version=7.2-preview.2"
+        all_branches = self.get_all_branches()
+
+        results = {}
+        ref_updates = []
+        for branch_name in dict.fromkeys(_to_branch_ref_name(name) for name in branch_names):
+            branch = all_branches.get(branch_name)
+            if branch is None:
+                logger.warning(f"Branch {branch_name} not found.")
+                results[branch_name] = {"success": False, "updateStatus": "notFound"}
+                continue
+            ref_updates.append(
+                {
+                    "name": branch_name,
+                    "oldObjectId": branch.get("objectId"),
+                    "newObjectId": "0000000000000000000000000000000000000000",
+                }
+            )
+
+        for index in range(0, len(ref_updates), chunk_size):
+            chunk = ref_updates[index : index + chunk_size]
+            logger.debug(f"TRACE: Deleting branches {index + 1}-{index + len(chunk)} of {len(ref_updates)}.")
+            response = requests.post(
+                url=url, headers=self.__azure_api._headers("application/json"), data=json.dumps(chunk)
+            )
+            if response.status_code != HTTPStatus.OK:
+                handle_incorrect_response(response, raise_exception=False)
+                for ref_update in chunk:
+                    results[ref_update["name"]] = {"success": False, "updateStatus": f"HTTP {response.status_code}"}
+                continue
+            for ref_result in response.json()["value"]:
+                results[ref_result["name"]] = {
+                    "success": ref_result.get("success", False),
+                    "updateStatus": ref_result.get("updateStatus"),
+                }
+                if ref_result.get("success"):
+                    with self.__branch_index_lock:
+                        self.__branch_index.remove(ref_result["name"])
+
+        deleted = sum(1 for result in results.values() if result["success"])
+        logger.info(f"SUCCESS: {deleted} branches deleted, {len(results) - deleted} failed.")
+        return results
+
     def change_pr_status(self, pr_id: int, status: PrStatusesDef):
         """
         Changes status of Pull Request.
@@ -349,11 +1886,16 @@ class _AzRepos:
             status (PrStatusesDef): new status of PR.
         """
         logger.info(f"Changing status of PR{pr_id} to {status}")
-        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repo_name}/pullRequests/{pr_id}?api-version=7.2-preview.1"
+        url = f"https://dev.azure.com/{self.__azure_api.organization}/{self.__azure_api.project}/_apis/git/repositories/{self.__repository.id}/pullRequests/{pr_id}?api-version=7.2-preview.1"
         payload = {
             "status": status,
         }
         response = requests.patch(url, json=payload, headers=self.__azure_api._headers("application/json"))
         if response.status_code != HTTPStatus.OK:
             handle_incorrect_response(response)
+        with self.__pr_index_lock:
+            self.__pr_index = {key: index_pr_id for key, index_pr_id in self.__pr_index.items() if index_pr_id != pr_id}
+            response_json = response.json()
+            if status == PrStatusesDef.Active and "sourceRefName" in response_json:
+                self.__pr_index[(response_json["sourceRefName"], response_json["targetRefName"])] = pr_id
         logger.info(f"Response: {response.status_code}, PR status changed to {status}.")
@@ -0,0 +1,205 @@
+import bisect
+import logging
+import re
+from enum import Enum
+from typing import Iterable, Optional
+
+from pydantic import BaseModel, model_validator
+
+logger = logging.getLogger(__name__)
+
+_VERSION_PATTERN = re.compile(r"^\d+(\.\d+)*$")
+
+
+class DemandOperator(str, Enum):
+    Exists = "exists"
+    Equals = "-equals"
+    Gt_Version = "-gtVersion"
+    Ge_Version = "-geVersion"
+    Lt_Version = "-ltVersion"
+    Le_Version = "-leVersion"
+
+
+_OPERATORS = {operator.value.lower(): operator for operator in DemandOperator if operator != DemandOperator.Exists}
+
+
+def _parse_version(value: str) -> Optional[tuple[int, ...]]:
+    """
+    Parses dotted version, shorter versions are padded with zeros so "4.255" equals "4.255.0.0".
+    Returns:
+        tuple[int, ...]: comparable version.
+        or
+        None: When value is not a version.
+    """
+    value = value.strip()
+    if not _VERSION_PATTERN.match(value):
+        return None
+    parts = [int(part) for part in value.split(".")]
+    return tuple(parts + [0] * (4 - len(parts)))
+
+
+class Demand(BaseModel):
+    """Single Azure Pipelines demand, e.g. `Agent.OS -equals Windows_NT` or `Agent.Version -gtVersion 4.200`.
+
+    Attributes:
+        name (str): Name of capability.
+        operator (DemandOperator): Comparison of capability value.
+        value (Optional[str]): Expected value, None for `exists` demands.
+    """
+
+    name: str
+    operator: DemandOperator = DemandOperator.Exists
+    value: Optional[str] = None
+
+    @model_validator(mode="after")
+    def __validate_value(self) -> "Demand":
+        """
+        Checks that comparison demands have a value and version demands have a valid version.
+        Raises:
+            ValueError: When value is missing or is not a version.
+        """
+        if self.operator == DemandOperator.Exists:
+            return self
+        if self.value is None:
+            raise ValueError(f"Demand '{self.name} {self.operator.value}' requires a value.")
+        if self.operator != DemandOperator.Equals and _parse_version(self.value) is None:
+            raise ValueError(f"Demand '{self.name} {self.operator.value} {self.value}' has invalid version.")
+        return self
+
+    @classmethod
+    def parse(cls, demand: str) -> "Demand":
+        """
+        Creates demand from Azure Pipelines syntax: `name` or `name -operator value`.
+        Args:
+            demand (str): demand text.
+
+        Returns:
+            Demand: parsed demand.
+
+        Raises:
+            ValueError: When operator is not supported or version demand has no valid version.
+        """
+        parts = demand.split(maxsplit=2)
+        if len(parts) == 1:
+            return cls(name=parts[0])
+        if len(parts) != 3 or parts[1].lower() not in _OPERATORS:
+            raise ValueError(f"Demand '{demand}' is not supported.")
+        return cls(name=parts[0], operator=_OPERATORS[parts[1].lower()], value=parts[2])
+
+
+class CapabilitiesIndex:
+    """Inverted index of agents capabilities. Capability names and `equals` values are matched case-insensitively
+    like in Azure Pipelines, user capabilities override system capabilities of the same name. Version values are
+    kept sorted per capability, so version demands are answered with binary search."""
+
+    def __init__(self):
+        """
+        Constructor for empty capabilities index.
+        """
+        self.__capabilities: dict[str, dict[str, str]] = {}
+        self.__online: set[str] = set()
+        self.__by_name: dict[str, set[str]] = {}
+        self.__by_value: dict[tuple[str, str], set[str]] = {}
+        self.__versions: dict[str, list[tuple[tuple[int, ...], str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__capabilities)
+
+    def set_agent(self, agent_name: str, status: Optional[str], capabilities: Optional[dict]) -> None:
+        """
+        Adds agent to the index or replaces its previous entries.
+        Args:
+            agent_name (str): Name of agent.
+            status (Optional[str]): Status of agent, only "online" agents are matched by default.
+            capabilities (Optional[dict]): dict with `systemCapabilities` and `userCapabilities`.
+        """
+        self.remove_agent(agent_name)
+        capabilities = capabilities or {}
+        merged = {
+            name.lower(): str(value)
+            for source in ("systemCapabilities", "userCapabilities")
+            for name, value in (capabilities.get(source) or {}).items()
+        }
+        self.__capabilities[agent_name] = merged
+        if status == "online":
+            self.__online.add(agent_name)
+        for name, value in merged.items():
+            self.__by_name.setdefault(name, set()).add(agent_name)
+            self.__by_value.setdefault((name, value.lower()), set()).add(agent_name)
+            if (version := _parse_version(value)) is not None:
+                bisect.insort(self.__versions.setdefault(name, []), (version, agent_name))
+
+    def remove_agent(self, agent_name: str) -> None:
+        """
+        Removes agent from the index. Does nothing for agents not in the index.
+        Args:
+            agent_name (str): Name of agent.
+        """
+        merged = self.__capabilities.pop(agent_name, None)
+        if merged is None:
+            return
+        self.__online.discard(agent_name)
+        for name, value in merged.items():
+            self.__discard(self.__by_name, name, agent_name)
+            self.__discard(self.__by_value, (name, value.lower()), agent_name)
+            if (version := _parse_version(value)) is not None:
+                versions = self.__versions[name]
+                del versions[bisect.bisect_left(versions, (version, agent_name))]
+                if not versions:
+                    del self.__versions[name]
+
+    def match(self, demands: Iterable[Demand], online_only: bool = True) -> set[str]:
+        """
+        Finds agents meeting all demands.
+        Args:
+            demands (Iterable[Demand]): demands to meet.
+            online_only (bool): match only online agents.
+
+        Returns:
+            set[str]: names of matching agents.
+        """
+        candidates = [self.__match_demand(demand) for demand in demands]
+        if online_only:
+            candidates.append(self.__online)
+        if not candidates:
+            return set(self.__capabilities)
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def __match_demand(self, demand: Demand) -> set[str]:
+        """
+        Private method to find agents meeting single demand.
+        Returns:
+            set[str]: names of matching agents, must not be modified.
+        """
+        name = demand.name.lower()
+        if demand.operator == DemandOperator.Exists:
+            return self.__by_name.get(name, set())
+        if demand.operator == DemandOperator.Equals:
+            return self.__by_value.get((name, demand.value.lower()), set())
+
+        versions = self.__versions.get(name, [])
+        version = _parse_version(demand.value)
+        lower = bisect.bisect_left(versions, version, key=lambda item: item[0])
+        upper = bisect.bisect_right(versions, version, key=lambda item: item[0])
+        match demand.operator:
+            case DemandOperator.Gt_Version:
+                matching = versions[upper:]
+            case DemandOperator.Ge_Version:
+                matching = versions[lower:]
+            case DemandOperator.Lt_Version:
+                matching = versions[:lower]
+            case _:
+                matching = versions[:upper]
+        return {agent_name for _, agent_name in matching}
+
+    @staticmethod
+    def __discard(index: dict, key, agent_name: str) -> None:
+        """
+        Private method to remove agent from posting set and drop empty sets.
+        """
+        agents = index.get(key)
+        if agents is not None:
+            agents.discard(agent_name)
+            if not agents:
+                del index[key]
@@ -0,0 +1,133 @@
+import logging
+import re
+import time
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_PROGRESS_PATTERN = re.compile(
+    r"^(?:remote: )?(?P<stage>[A-Z][a-z]+ [a-z]+):\s+(?P<percent>\d+)% \((?P<current>\d+)/(?P<total>\d+)\)"
+    r"(?:, (?P<size>[\d.]+) (?P<size_unit>bytes|[KMG]iB))?"
+    r"(?: \| (?P<rate>[\d.]+) (?P<rate_unit>bytes|[KMG]iB)/s)?"
+)
+_CLONING_INTO_PATTERN = re.compile(r"^Cloning into '(?P<path>.+)'\.\.\.$")
+_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3}
+
+
+class CloneProgress(BaseModel):
+    """Structured state of `git clone --progress` output.
+
+    Attributes:
+        stage (str): Current stage, e.g. "counting objects", "receiving objects", "resolving deltas".
+        percent (int): Completion of current stage in percent.
+        current (int): Number of processed objects (or deltas, files) in current stage.
+        total (int): Number of all objects (or deltas, files) in current stage.
+        received_bytes (int): Bytes received so far, as reported by git.
+        throughput (float): Transfer speed in bytes per second, as reported by git or average since start.
+        submodule (Optional[str]): Path of submodule being cloned, None for the main repository.
+        elapsed (float): Time since start of cloning in seconds.
+    """
+
+    stage: str
+    percent: int = 0
+    current: int = 0
+    total: int = 0
+    received_bytes: int = 0
+    throughput: float = 0
+    submodule: Optional[str] = None
+    elapsed: float = 0
+
+
+class CloneProgressParser:
+    """Parses git progress lines into `CloneProgress` records and tracks time since the last transfer activity."""
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[CloneProgress], None]] = None,
+        min_throughput: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Constructor for clone progress parser.
+        Args:
+            callback (Optional[Callable[[CloneProgress], None]]): called for each parsed progress update.
+            min_throughput (float): transfer slower than this number of bytes per second is not counted as activity.
+            clock (Callable[[], float]): Source of time, `time.monotonic` by default.
+        """
+        self.__callback = callback
+        self.__min_throughput = min_throughput
+        self.__clock = clock
+        self.__started_at = clock()
+        self.__last_activity = self.__started_at
+        self.__submodule: Optional[str] = None
+        self.__main_repository_seen = False
+        self.progress: Optional[CloneProgress] = None
+
+    @property
+    def idle_time(self) -> float:
+        """
+        Returns:
+            float: time in seconds since the last progress with sufficient throughput.
+        """
+        return self.__clock() - self.__last_activity
+
+    def feed(self, line: str) -> Optional[CloneProgress]:
+        """
+        Parses single line of git stderr.
+        Args:
+            line (str): line without trailing newline.
+
+        Returns:
+            CloneProgress: parsed progress update.
+            or
+            None: When line is not a progress line.
+        """
+        line = line.strip()
+        if cloning_into := _CLONING_INTO_PATTERN.match(line):
+            if self.__main_repository_seen:
+                self.__submodule = cloning_into["path"]
+            self.__main_repository_seen = True
+            self.__last_activity = self.__clock()
+            return None
+        match = _PROGRESS_PATTERN.match(line)
+        if not match:
+            return None
+
+        now = self.__clock()
+        elapsed = now - self.__started_at
+        previous = self.progress
+        received_bytes = previous.received_bytes if previous else 0
+        if match["size"]:
+            received_bytes = int(float(match["size"]) * _UNITS[match["size_unit"]])
+        if match["rate"]:
+            throughput = float(match["rate"]) * _UNITS[match["rate_unit"]]
+        else:
+            throughput = received_bytes / elapsed if elapsed > 0 else 0
+        progress = CloneProgress(
+            stage=match["stage"].lower(),
+            percent=int(match["percent"]),
+            current=int(match["current"]),
+            total=int(match["total"]),
+            received_bytes=received_bytes,
+            throughput=throughput,
+            submodule=self.__submodule,
+            elapsed=elapsed,
+        )
+        advanced = previous is None or (progress.stage, progress.current, progress.received_bytes) != (
+            previous.stage,
+            previous.current,
+            previous.received_bytes,
+        )
+        transferring = progress.stage == "receiving objects"
+        if advanced and (not transferring or throughput >= self.__min_throughput):
+            self.__last_activity = now
+        self.progress = progress
+
+        if self.__callback:
+            try:
+                self.__callback(progress)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Clone progress callback failed: {e}")
+        return progress
@@ -0,0 +1,323 @@
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.contextmanager
+def _heartbeat(path: str, interval: float) -> Iterator[None]:
+    """
+    Keeps modification time of the file fresh while the context is active, so it is not treated as stale.
+    Args:
+        path (str): path to the file.
+        interval (float): time in seconds between updates.
+    """
+    stop = threading.Event()
+
+    def __touch():
+        while not stop.wait(interval):
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(path)
+
+    thread = threading.Thread(target=__touch, name="file-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+class _FileLock:
+    """Inter-process lock based on exclusive creation of a lock file. Modification time of the lock file is refreshed
+    while the lock is held, so only locks of dead owners become stale. Lock file holds unique owner token, so stale
+    lock is broken only once and owners never remove lock of other owner."""
+
+    def __init__(self, path: str, timeout: float = 600, stale_after: float = 3600):
+        """
+        Constructor for file lock.
+        Args:
+            path (str): path to lock file.
+            timeout (float): maximum time in seconds to wait for the lock.
+            stale_after (float): lock files older than this number of seconds are treated as abandoned.
+        """
+        self.__path = path
+        self.__timeout = timeout
+        self.__stale_after = stale_after
+        self.__owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self.__heartbeat: Optional[contextlib.ExitStack] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquires the lock.
+        Args:
+            blocking (bool): wait until the lock is released by other owner.
+
+        Returns:
+            bool: True if lock was acquired.
+
+        Raises:
+            TimeoutError: When lock was not acquired within timeout.
+        """
+        deadline = time.monotonic() + self.__timeout
+        while True:
+            try:
+                fd = os.open(self.__path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, self.__owner.encode())
+                os.close(fd)
+                self.__heartbeat = contextlib.ExitStack()
+                self.__heartbeat.enter_context(_heartbeat(self.__path, self.__stale_after / 4))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.__path) > self.__stale_after:
+                        self.__break_stale_lock(self.__read_owner(self.__path))
+                        continue
+                except FileNotFoundError:
+                    continue
+            if not blocking:
+                return False
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Lock {self.__path} not acquired in {self.__timeout} seconds.")
+            time.sleep(0.2)
+
+    def release(self) -> None:
+        """
+        Releases the lock. Lock file taken over by other owner is kept.
+        """
+        if self.__heartbeat is not None:
+            self.__heartbeat.close()
+            self.__heartbeat = None
+        with contextlib.suppress(FileNotFoundError):
+            if self.__read_owner(self.__path) == self.__owner:
+                os.remove(self.__path)
+
+    def __break_stale_lock(self, stale_owner: str) -> None:
+        """
+        Private method to remove lock file of dead owner. Lock file is first moved to a unique name, so only one of
+        waiters moves it. When moved file belongs to other owner (lock was broken and taken meanwhile), it is put back.
+        Args:
+            stale_owner (str): owner token read from the stale lock file.
+
+        Raises:
+            FileNotFoundError: When lock file was already removed by other waiter.
+        """
+        moved = f"{self.__path}.stale-{uuid.uuid4().hex}"
+        os.rename(self.__path, moved)
+        try:
+            if self.__read_owner(moved) == stale_owner:
+                logger.warning(f"Removed stale lock {self.__path}.")
+            else:
+                with contextlib.suppress(FileExistsError):
+                    os.link(moved, self.__path)
+        finally:
+            os.remove(moved)
+
+    @staticmethod
+    def __read_owner(path: str) -> str:
+        """
+        Private method to read owner token of lock file.
+        Returns:
+            str: owner token.
+
+        Raises:
+            FileNotFoundError: When lock file does not exist.
+        """
+        with open(path, encoding="utf-8") as lock_file:
+            return lock_file.read()
+
+    def __enter__(self) -> "_FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.release()
+
+
+class GitMirrorCache:
+    """Managed directory of bare mirrors used as a local reference by `clone_repository`. Mirror is locked
+    exclusively only to update or evict it. Clones using the mirror register as readers, so they run concurrently
+    and the mirror is not updated or evicted while any of them is active."""
+
+    def __init__(
+        self, cache_dir: str, max_size: Optional[int] = None, lock_timeout: float = 600, stale_after: float = 3600
+    ):
+        """
+        Constructor for mirror cache.
+        Args:
+            cache_dir (str): directory where mirrors are stored. Created if missing.
+            max_size (Optional[int]): maximum size of all mirrors in bytes. The least recently used mirrors are removed
+                when exceeded. No limit by default.
+            lock_timeout (float): maximum time in seconds to wait for other process updating the same mirror.
+            stale_after (float): locks and readers not refreshed for this number of seconds belong to dead processes
+                and are removed.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.lock_timeout = lock_timeout
+        self.stale_after = stale_after
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def mirror_path(self, repo_url: str) -> str:
+        """
+        Returns:
+            str: path to mirror of the repository, it does not have to exist yet.
+        """
+        name = repo_url.rstrip("/").split("/")[-1].removesuffix(".git")
+        digest = hashlib.sha1(repo_url.encode(), usedforsecurity=False).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.git")
+
+    @contextlib.contextmanager
+    def reference(self, repo_url: str) -> Iterator[Optional[str]]:
+        """
+        Updates mirror of the repository and registers caller as its reader while the context is active. Mirror in
+        use by other readers is updated additively (no prune, no gc), so objects they reference stay in place and
+        concurrent clones of the same repository do not wait for each other.
+        Args:
+            repo_url (str): url of the repository.
+
+        Yields:
+            str: path to up to date mirror, to be used with `git clone --reference`.
+            or
+            None: When mirror could not be updated.
+
+        Examples:
+            >>> cache = GitMirrorCache("/var/cache/git-mirrors", max_size=50 * 1024**3)
+            >>> with cache.reference("https://org@dev.azure.com/org/project/_git/repo") as mirror:
+            >>>     subprocess.run(["git", "clone", "--reference", mirror, "--dissociate", url])
+        """
+        path = self.mirror_path(repo_url)
+        reader = os.path.join(path + ".readers", f"{os.getpid()}-{uuid.uuid4().hex}")
+        with self.__lock(path, self.lock_timeout):
+            try:
+                self.__update_mirror(repo_url, path, prune=not self.__active_readers(path))
+            except RuntimeError as e:
+                logger.warning(f"Mirror {path} not updated, cloning without reference: {e}")
+                reader = None
+            else:
+                os.makedirs(os.path.dirname(reader), exist_ok=True)
+                open(reader, "w").close()
+                os.utime(path)
+        if reader is None:
+            yield None
+            return
+        try:
+            with _heartbeat(reader, self.stale_after / 4):
+                yield path
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(reader)
+        self.evict()
+
+    def evict(self) -> list[str]:
+        """
+        Removes the least recently used mirrors until total size is below `max_size`. Mirrors locked or read by other
+        callers are skipped.
+        Returns:
+            list[str]: paths to removed mirrors.
+        """
+        if self.max_size is None:
+            return []
+        mirrors = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".git")]
+        sizes = {mirror: self.__get_dir_size(mirror) for mirror in mirrors}
+        total = sum(sizes.values())
+        removed = []
+        for mirror in sorted(mirrors, key=os.path.getmtime):
+            if total <= self.max_size:
+                break
+            lock = self.__lock(mirror, timeout=0)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                if self.__active_readers(mirror):
+                    continue
+                logger.info(f"Evicting mirror {mirror} ({sizes[mirror]} bytes).")
+                shutil.rmtree(mirror, ignore_errors=True)
+                shutil.rmtree(mirror + ".readers", ignore_errors=True)
+                total -= sizes[mirror]
+                removed.append(mirror)
+            finally:
+                lock.release()
+        return removed
+
+    def __lock(self, path: str, timeout: float) -> _FileLock:
+        """
+        Private method to create exclusive lock of the mirror.
+        Returns:
+            _FileLock: lock, not acquired yet.
+        """
+        return _FileLock(path + ".lock", timeout=timeout, stale_after=self.stale_after)
+
+    def __active_readers(self, path: str) -> int:
+        """
+        Private method to count readers of the mirror. Readers not refreshed within `stale_after` are removed. Must
+        be called with mirror lock held, so no reader registers meanwhile.
+        Returns:
+            int: number of active readers.
+        """
+        readers_dir = path + ".readers"
+        if not os.path.isdir(readers_dir):
+            return 0
+        active = 0
+        for name in os.listdir(readers_dir):
+            reader = os.path.join(readers_dir, name)
+            try:
+                if time.time() - os.path.getmtime(reader) > self.stale_after:
+                    logger.warning(f"Removing stale mirror reader {reader}.")
+                    os.remove(reader)
+                else:
+                    active += 1
+            except FileNotFoundError:
+                continue
+        return active
+
+    @staticmethod
+    def __update_mirror(repo_url: str, path: str, prune: bool = True) -> None:
+        """
+        Private method to create mirror with `git clone --mirror` or update it with `git fetch`.
+        Args:
+            repo_url (str): url of the repository.
+            path (str): path to mirror.
+            prune (bool): remove refs deleted on remote. If False, fetch only adds objects and automatic gc is
+                disabled, which is safe for clones reading the mirror meanwhile.
+        Raises:
+            RuntimeError: When git command failed.
+        """
+        exists = os.path.isdir(path)
+        if exists:
+            logger.info(f"Updating mirror {path}{'' if prune else ' without pruning'}...")
+            if prune:
+                command = ["git", "--git-dir", path, "fetch", "--prune", "--quiet"]
+            else:
+                command = ["git", "-c", "gc.auto=0", "--git-dir", path, "fetch", "--no-prune", "--quiet"]
+        else:
+            logger.info(f"Creating mirror {path}...")
+            command = ["git", "clone", "--mirror", "--quiet", repo_url, path]
+        result = subprocess.run(command, env=os.environ.copy(), capture_output=True, text=True, check=False)
+        if result.returncode:
+            logger.debug(result.stderr)
+            if not exists:
+                shutil.rmtree(path, ignore_errors=True)
+            raise RuntimeError(f"Git mirror command failed with return code {result.returncode}.")
+        logger.info("SUCCESS: Mirror up to date.")
+
+    @staticmethod
+    def __get_dir_size(path: str) -> int:
+        """
+        Returns:
+            int: size of all files in the directory in bytes.
+        """
+        return sum(
+            os.path.getsize(os.path.join(root, file))
+            for root, _, files in os.walk(path)
+            for file in files
+            if not os.path.islink(os.path.join(root, file))
+        )
@@ -0,0 +1,286 @@
+import logging
+import queue
+import threading
+from enum import Enum
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class PullRequestEventType(str, Enum):
+    Created = "created"
+    Updated = "updated"
+    Vote_Changed = "voteChanged"
+    Completed = "completed"
+    Abandoned = "abandoned"
+
+
+class PullRequestSnapshot(BaseModel):
+    """Compact state of a Pull Request compared between polls.
+
+    Attributes:
+        id (int): Pull Request ID.
+        title (str): Pull Request title.
+        status (str): Pull Request status.
+        source_ref_name (str): Source branch with refs/heads prefix.
+        target_ref_name (str): Target branch with refs/heads prefix.
+        source_commit (Optional[str]): Last merge source commit ID.
+        is_draft (bool): True for draft Pull Requests.
+        votes (dict[str, int]): Votes of reviewers, keys are reviewers GUIDs.
+    """
+
+    id: int
+    title: str
+    status: str
+    source_ref_name: str
+    target_ref_name: str
+    source_commit: Optional[str] = None
+    is_draft: bool = False
+    votes: dict[str, int] = {}
+
+    @classmethod
+    def from_response(cls, data: dict) -> "PullRequestSnapshot":
+        """
+        Creates snapshot from raw Pull Request data returned by endpoint.
+        Args:
+            data (dict): Pull Request data.
+
+        Returns:
+            PullRequestSnapshot: compact Pull Request state.
+        """
+        return cls(
+            id=data["pullRequestId"],
+            title=data.get("title", ""),
+            status=data.get("status", ""),
+            source_ref_name=data.get("sourceRefName", ""),
+            target_ref_name=data.get("targetRefName", ""),
+            source_commit=(data.get("lastMergeSourceCommit") or {}).get("commitId"),
+            is_draft=data.get("isDraft", False),
+            votes={reviewer["id"]: reviewer.get("vote", 0) for reviewer in data.get("reviewers") or []},
+        )
+
+
+class PullRequestEvent(BaseModel):
+    """Change of a Pull Request detected by `PullRequestWatcher`.
+
+    Attributes:
+        type (PullRequestEventType): Type of change.
+        pr_id (int): Pull Request ID.
+        snapshot (PullRequestSnapshot): Current state of Pull Request.
+        previous (Optional[PullRequestSnapshot]): State from previous poll, None for created Pull Requests.
+    """
+
+    type: PullRequestEventType
+    pr_id: int
+    snapshot: PullRequestSnapshot
+    previous: Optional[PullRequestSnapshot] = None
+
+
+class PullRequestWatcher:
+    """Polls active Pull Requests and emits events by diffing compact snapshots. Polling interval is adaptive: it is
+    reset to `min_interval` after activity and multiplied by `backoff` up to `max_interval` when idle. Callback is
+    called on a separate worker thread, so slow handlers do not delay polls."""
+
+    def __init__(
+        self,
+        fetch_active: Callable[[Optional[str]], Optional[tuple[list[dict], Optional[str]]]],
+        fetch_one: Callable[[int], dict],
+        callback: Callable[[PullRequestEvent], None],
+        min_interval: float = 5,
+        max_interval: float = 120,
+        backoff: float = 2.0,
+    ):
+        """
+        Constructor for Pull Requests watcher.
+        Args:
+            fetch_active (Callable): returns raw active Pull Requests and ETag of the response. Receives ETag from
+                previous call and returns None when data was not modified.
+            fetch_one (Callable[[int], dict]): returns raw data of single Pull Request, used for Pull Requests which
+                are no longer active.
+            callback (Callable[[PullRequestEvent], None]): called for each detected event.
+            min_interval (float): shortest time between polls in seconds.
+            max_interval (float): longest time between polls in seconds.
+            backoff (float): multiplier of interval after poll without changes.
+        """
+        self.__fetch_active = fetch_active
+        self.__fetch_one = fetch_one
+        self.__callback = callback
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.__interval = min_interval
+        self.__etag: Optional[str] = None
+        self.__snapshots: Optional[dict[int, PullRequestSnapshot]] = None
+        self.__events: queue.Queue = queue.Queue()
+        self.__stop_event = threading.Event()
+        self.__threads: list[threading.Thread] = []
+
+    @property
+    def interval(self) -> float:
+        """
+        Returns:
+            float: time in seconds to the next poll.
+        """
+        return self.__interval
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns:
+            bool: True if watcher threads are alive.
+        """
+        return any(thread.is_alive() for thread in self.__threads)
+
+    def start(self) -> "PullRequestWatcher":
+        """
+        Starts polling and callback threads. Pull Requests active at start are the baseline and do not emit events,
+        the baseline is read before this method returns.
+        Returns:
+            PullRequestWatcher: self, to allow chaining.
+
+        Raises:
+            Exception: Any exception raised by `fetch_active` while reading the baseline.
+        """
+        if self.running:
+            return self
+        logger.info("Starting Pull Requests watcher...")
+        self.__stop_event.clear()
+        self.__drain_events()
+        self.__etag = None
+        self.__snapshots = None
+        self.__interval = self.min_interval
+        self.poll()
+        self.__threads = [
+            threading.Thread(target=self.__poll_loop, name="pr-watcher-poll", daemon=True),
+            threading.Thread(target=self.__dispatch_loop, name="pr-watcher-dispatch", daemon=True),
+        ]
+        for thread in self.__threads:
+            thread.start()
+        logger.info("SUCCESS: Pull Requests watcher started.")
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops polling. Events already detected are still delivered to the callback.
+        Args:
+            timeout (Optional[float]): maximum time in seconds to wait for each thread.
+        """
+        logger.info("Stopping Pull Requests watcher...")
+        self.__stop_event.set()
+        self.__events.put(None)
+        for thread in self.__threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        logger.info("SUCCESS: Pull Requests watcher stopped.")
+
+    def poll(self) -> list[PullRequestEvent]:
+        """
+        Runs single poll and updates interval. The first poll only stores the baseline.
+        Returns:
+            list[PullRequestEvent]: detected events, also queued for the callback only when watcher is running.
+        """
+        result = self.__fetch_active(self.__etag)
+        if result is None:
+            logger.debug("TRACE: Pull Requests not modified.")
+            self.__slow_down()
+            return []
+        active_prs, self.__etag = result
+        current = {pr["pullRequestId"]: PullRequestSnapshot.from_response(pr) for pr in active_prs}
+        previous, self.__snapshots = self.__snapshots, current
+        if previous is None:
+            logger.debug(f"TRACE: Baseline of {len(current)} active Pull Requests stored.")
+            return []
+
+        events = []
+        for pr_id, snapshot in current.items():
+            old = previous.get(pr_id)
+            if old is None:
+                events.append(PullRequestEvent(type=PullRequestEventType.Created, pr_id=pr_id, snapshot=snapshot))
+                continue
+            if old.model_dump(exclude={"votes"}) != snapshot.model_dump(exclude={"votes"}):
+                events.append(
+                    PullRequestEvent(type=PullRequestEventType.Updated, pr_id=pr_id, snapshot=snapshot, previous=old)
+                )
+            if old.votes != snapshot.votes:
+                events.append(
+                    PullRequestEvent(
+                        type=PullRequestEventType.Vote_Changed, pr_id=pr_id, snapshot=snapshot, previous=old
+                    )
+                )
+        for pr_id in previous.keys() - current.keys():
+            events.extend(self.__closed_event(previous[pr_id]))
+
+        if events:
+            logger.info(f"Detected {len(events)} Pull Requests events.")
+            self.__interval = self.min_interval
+        else:
+            self.__slow_down()
+        if self.running and not self.__stop_event.is_set():
+            for event in events:
+                self.__events.put(event)
+        return events
+
+    def __closed_event(self, old: PullRequestSnapshot) -> list[PullRequestEvent]:
+        """
+        Private method to create event for Pull Request which is no longer active.
+        Returns:
+            list[PullRequestEvent]: single completed, abandoned or updated event, or empty list when Pull Request
+                could not be read.
+        """
+        try:
+            snapshot = PullRequestSnapshot.from_response(self.__fetch_one(old.id))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"PR{old.id} is no longer active but could not be read: {e}")
+            return []
+        event_types = {"completed": PullRequestEventType.Completed, "abandoned": PullRequestEventType.Abandoned}
+        event_type = event_types.get(snapshot.status, PullRequestEventType.Updated)
+        return [PullRequestEvent(type=event_type, pr_id=old.id, snapshot=snapshot, previous=old)]
+
+    def __drain_events(self) -> None:
+        """
+        Private method to drop events left in the queue after previous run, so they are not delivered as new.
+        """
+        while True:
+            try:
+                self.__events.get_nowait()
+            except queue.Empty:
+                return
+
+    def __slow_down(self) -> None:
+        """
+        Private method to increase interval after poll without changes.
+        """
+        self.__interval = min(self.__interval * self.backoff, self.max_interval)
+
+    def __poll_loop(self) -> None:
+        """
+        Private method polling until watcher is stopped. The first poll is done by `start`.
+        """
+        while not self.__stop_event.wait(self.__interval):
+            try:
+                self.poll()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Pull Requests poll failed: {e}")
+                self.__slow_down()
+            logger.debug(f"TRACE: Next poll in {self.__interval} seconds.")
+
+    def __dispatch_loop(self) -> None:
+        """
+        Private method passing queued events to the callback until watcher is stopped.
+        """
+        while True:
+            event = self.__events.get()
+            if event is None:
+                return
+            try:
+                self.__callback(event)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Pull Request event callback failed for {event.type.value} PR{event.pr_id}: {e}")
+
+    def __enter__(self) -> "PullRequestWatcher":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache where each entry expires after defined time to live."""
+
+    def __init__(self, ttl: float, max_size: int = 128, clock: Callable[[], float] = time.monotonic):
+        """
+        Constructor for TTL cache.
+        Args:
+            ttl (float): Time to live of each entry in seconds. 0 or less disables the cache.
+            max_size (int): Maximum number of entries. The least recently used entry is removed when exceeded.
+            clock (Callable[[], float]): Source of time, `time.monotonic` by default.
+        """
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__clock = clock
+        self.__data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__generation = 0
+
+    @property
+    def ttl(self) -> float:
+        """
+        Getter for time to live of entries in seconds.
+        Returns:
+            float: TTL in seconds.
+        """
+        return self.__ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float) -> None:
+        """
+        Setter for time to live of entries. Cache is cleared, as already stored entries could outlive new TTL.
+        Args:
+            ttl (float): Time to live in seconds. 0 or less disables the cache.
+        """
+        self.__ttl = ttl
+        self.clear()
+
+    @property
+    def max_size(self) -> int:
+        """
+        Getter for maximum number of entries.
+        Returns:
+            int: Maximum number of entries.
+        """
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        """
+        Setter for maximum number of entries. The least recently used entries above the limit are removed.
+        Args:
+            max_size (int): Maximum number of entries.
+        """
+        with self.__lock:
+            self.__max_size = max_size
+            self.__trim()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: True if entries are stored in the cache.
+        """
+        return self.__ttl > 0 and self.__max_size > 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Getter for number of invalidations of the cache. Snapshot it before computing a value and pass it to `set`, so
+        value computed from data changed meanwhile is not stored.
+        Returns:
+            int: Current generation.
+        """
+        with self.__lock:
+            return self.__generation
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Reads value from the cache.
+        Args:
+            key (Hashable): Key of the entry.
+            default (Optional[Any]): Value returned when key is missing or expired.
+
+        Returns:
+            Any: Cached value or `default`.
+        """
+        with self.__lock:
+            entry = self.__data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self.__clock():
+                del self.__data[key]
+                return default
+            self.__data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Stores value in the cache. Does nothing when cache is disabled.
+        Args:
+            key (Hashable): Key of the entry.
+            value (Any): Value to store.
+            generation (Optional[int]): `generation` read before the value was computed. Value is discarded when the
+                cache was invalidated since then.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                logger.debug(f"TRACE: Discarding value of {key} computed before cache invalidation.")
+                return
+            self.__data[key] = (self.__clock() + self.__ttl, value)
+            self.__data.move_to_end(key)
+            self.__trim()
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes single entry from the cache.
+        Args:
+            key (Hashable): Key of the entry.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        with self.__lock:
+            if self.__data:
+                logger.debug(f"TRACE: Clearing cache with {len(self.__data)} entries.")
+            self.__generation += 1
+            self.__data.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__data)
+
+    def __trim(self) -> None:
+        """
+        Private method to remove the least recently used entries above `max_size`. Must be called with lock acquired.
+        """
+        while len(self.__data) > max(self.__max_size, 0):
+            self.__data.popitem(last=False)
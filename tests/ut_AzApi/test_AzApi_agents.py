@@ -3,9 +3,10 @@ from unittest.mock import MagicMock, patch
 
 import beartype
 import pytest
+from requests import RequestException
 
 from azapidevops.AzApi import AzApi
-from azapidevops.utils.AzApi_agents import AgentsBy, _AzAgents
+from azapidevops.utils.AzApi_agents import AgentsBy, AgentsDiff, _AzAgents
 from tests.ut_AzApi.testdata import (
     get_agent_capabilities_mock,
     get_agents_list_mock,
@@ -74,6 +75,39 @@ def test_AzApi_agents_init_negative(api_mock, pool_name):
         _ = api.Agents
 
 
+class Tests_AzApi_agent_pools:
+    @pytest.fixture(autouse=True)
+    def setup(self, api_mock):
+        self.api_mock = api_mock
+        self.api = AzApi("Org", "Pro", "123")
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].return_value = get_pools_list_mock
+
+    def test_get_agent_pools_cached(self):
+        pools = self.api.get_agent_pools()
+        assert pools["Project_pool"].id == 10
+        assert pools["Azure Pipelines"].is_hosted
+        assert self.api.get_agent_pools() is pools
+        self.api_mock["get"].assert_called_once()
+
+    def test_load_agent_pools(self):
+        with patch.object(_AzAgents, "_AzAgents__get_all_agents") as mock_get_all_agents:
+            mock_get_all_agents.side_effect = lambda pool_id, **_kwargs: {
+                f"Agent{pool_id}": {"id": pool_id, "pc_name": f"PC{pool_id}", "capabilities": {}, "status": "online"}
+            }
+            results = self.api.load_agent_pools(["Default", "Project_pool", "Missing"])
+            self.api.agent_pool_name = "Hosted"
+        assert isinstance(results["Missing"], NameError)
+        assert all(call.kwargs["max_workers"] == 1 for call in mock_get_all_agents.call_args_list[:2])
+        assert list(self.api.get_agents("Project_pool").all_agents) == ["Agent10"]
+        assert self.api.get_agents("Default").pool_name == "Default"
+        assert set(self.api.agent_pools) == {"Default", "Project_pool", "Hosted"}
+        assert self.api.get_agents("Hosted") is self.api.Agents
+        assert self.api_mock["get"].call_count == 2
+        with pytest.raises(AzApi.ComponentException):
+            self.api.get_agents("Missing")
+
+
 class Tests_AzApi_agents:
     @pytest.fixture(autouse=True)
     def setup(self, api_mock):
@@ -114,7 +148,7 @@ class Tests_AzApi_agents:
     def test__get_all_agents(self):
         with (
             patch.object(_AzAgents, "_AzAgents__get_all_pools") as mock_get_all_pools,
-            patch.object(_AzAgents, "get_agent_capabilities") as mock_capabilities,
+            patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities,
         ):
             mock_capabilities.return_value = {
                 "userCapabilities": {"hardware_available": "true"},
@@ -134,10 +168,64 @@ class Tests_AzApi_agents:
             assert agents["Asus"].get("capabilities")
             assert agents["Asus"].get("status")
 
+    def test__get_all_agents_include_capabilities(self):
+        def __agent(agent_id, with_capabilities=True):
+            agent = {"id": agent_id, "name": f"Agent{agent_id}", "status": "online"}
+            if with_capabilities:
+                agent["systemCapabilities"] = {"Agent.ComputerName": f"PC{agent_id}"}
+                agent["userCapabilities"] = {"flag": "true"}
+            return agent
+
+        pages = [
+            MagicMock(
+                status_code=200,
+                headers={"x-ms-continuationtoken": "token"},
+                json=MagicMock(return_value={"count": 2, "value": [__agent(1), __agent(2)]}),
+            ),
+            MagicMock(
+                status_code=200,
+                headers={},
+                json=MagicMock(return_value={"count": 1, "value": [__agent(3, with_capabilities=False)]}),
+            ),
+        ]
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = pages
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            mock_capabilities.return_value = {
+                "systemCapabilities": {"Agent.ComputerName": "PC3"},
+                "userCapabilities": {},
+            }
+            agents = self.api.Agents._AzAgents__get_all_agents(10, page_size=2)
+        mock_capabilities.assert_called_once_with(3)
+        assert self.api_mock["get"].call_count == 2
+        assert "includeCapabilities=true" in self.api_mock["get"].call_args.args[0]
+        assert self.api_mock["get"].call_args.kwargs["params"] == {"$top": 2, "continuationToken": "token"}
+        assert [agent["pc_name"] for agent in agents.values()] == ["PC1", "PC2", "PC3"]
+        assert agents["Agent1"]["capabilities"]["userCapabilities"] == {"flag": "true"}
+
     @pytest.mark.parametrize("key,by", [(9, AgentsBy.ID), ("Asus", AgentsBy.Agent_Name), ("ASUS-MR", AgentsBy.PC_Name)])
     def test__resolve_agent_key(self, key, by):
         assert self.api.Agents._AzAgents__resolve_agent_key(key, by) == 9
 
+    @pytest.mark.parametrize("key,by", [(404, AgentsBy.ID), ("Missing", AgentsBy.Agent_Name), ("PC", AgentsBy.PC_Name)])
+    def test__resolve_agent_key_not_found(self, key, by):
+        with pytest.raises(KeyError):
+            self.api.Agents._AzAgents__resolve_agent_key(key, by)
+
+    def test__resolve_agent_key_many_agents(self):
+        with (
+            patch.object(_AzAgents, "_AzAgents__get_all_pools") as mock_get_all_pools,
+            patch.object(_AzAgents, "_AzAgents__get_all_agents") as mock_get_all_agents,
+        ):
+            mock_get_all_pools.return_value = {"Project_pool": 10}
+            mock_get_all_agents.return_value = {
+                f"Agent{i}": {"id": i, "pc_name": f"PC{i}", "capabilities": {"userCapabilities": {}}} for i in range(50)
+            }
+            self.api.agent_pool_name = "Project_pool"
+        assert self.api.Agents._AzAgents__resolve_agent_key("PC42", AgentsBy.PC_Name) == 42
+        assert self.api.Agents._AzAgents__resolve_agent_key("Agent7", AgentsBy.Agent_Name) == 7
+        assert self.api.Agents._AzAgents__get_agent_name(13) == "Agent13"
+
     @pytest.mark.parametrize("key,by", [(9, AgentsBy.ID), ("Asus", AgentsBy.Agent_Name), ("ASUS-MR", AgentsBy.PC_Name)])
     def test_get_agent_capabilities(self, key, by):
         self.api_mock["get"].return_value = get_agent_capabilities_mock
@@ -173,3 +261,214 @@ class Tests_AzApi_agents:
         else:
             expected = {}
         assert self.api.Agents._AzAgents__all_agents["Asus"]["capabilities"]["userCapabilities"] == expected
+
+
+class Tests_AzApi_agents_bulk:
+    @pytest.fixture(autouse=True)
+    def setup(self, api_mock):
+        with (
+            patch.object(_AzAgents, "_AzAgents__get_all_pools") as mock_get_all_pools,
+            patch.object(_AzAgents, "_AzAgents__get_all_agents") as mock_get_all_agents,
+        ):
+            mock_get_all_pools.return_value = {"Project_pool": 10}
+            mock_get_all_agents.return_value = {
+                f"Agent{i}": {"id": i, "pc_name": f"PC{i}", "capabilities": {"userCapabilities": {"flag": f"{i}"}}}
+                for i in range(1, 5)
+            }
+            self.api_mock = api_mock
+            self.api = AzApi("Org", "Pro", "123")
+            self.api.agent_pool_name = "Project_pool"
+        self.api_mock["put"].return_value = MagicMock(status_code=200)
+
+    def __user_capabilities(self, name):
+        return self.api.Agents._AzAgents__all_agents[name]["capabilities"]["userCapabilities"]
+
+    def test_add_user_capabilities_to_agents_by_keys(self):
+        results = self.api.Agents.add_user_capabilities_to_agents(
+            {"new": "true"}, ["PC1", "PC3", "PC1"], by=AgentsBy.PC_Name
+        )
+        assert self.api_mock["put"].call_count == 2
+        assert [(result.agent_name, result.error) for result in results] == [("Agent1", None), ("Agent3", None)]
+        assert self.__user_capabilities("Agent1") == {"flag": "1", "new": "true"}
+        assert self.__user_capabilities("Agent2") == {"flag": "2"}
+
+    def test_remove_user_capabilities_from_agents_by_predicate(self):
+        results = self.api.Agents.remove_user_capabilities_from_agents(
+            "flag", predicate=lambda _name, agent: agent["id"] % 2 == 0
+        )
+        assert {result.agent_id for result in results} == {2, 4}
+        assert all(result.user_capabilities == {} for result in results)
+        assert self.__user_capabilities("Agent2") == {}
+        assert self.__user_capabilities("Agent3") == {"flag": "3"}
+
+    def test_update_user_capabilities_of_agents_partial_failure(self):
+        def __put(url, *_args, **_kwargs):
+            return MagicMock(status_code=500 if "/agents/2/" in url else 200, text="error")
+
+        self.api_mock["put"].side_effect = __put
+        results = self.api.Agents.add_user_capabilities_to_agents({"new": "true"}, [1, 2], by=AgentsBy.ID)
+        assert results[0].error is None
+        assert isinstance(results[1].error, Exception)
+        assert results[1].user_capabilities is None
+        assert self.__user_capabilities("Agent1") == {"flag": "1", "new": "true"}
+        assert self.__user_capabilities("Agent2") == {"flag": "2"}
+
+    def test_update_user_capabilities_of_agents_unknown_key(self):
+        with pytest.raises(KeyError):
+            self.api.Agents.add_user_capabilities_to_agents({"new": "true"}, ["Agent1", "Missing"])
+        self.api_mock["put"].assert_not_called()
+
+    def test_update_user_capabilities_of_agents_no_selection(self):
+        with pytest.raises(ValueError):
+            self.api.Agents.add_user_capabilities_to_agents({"new": "true"})
+
+
+class Tests_AzApi_agents_refresh:
+    @staticmethod
+    def __listing(*agents):
+        return MagicMock(status_code=200, headers={}, json=MagicMock(return_value={"value": list(agents)}))
+
+    @staticmethod
+    def __agent(agent_id, status="online", version="4.255.0"):
+        return {
+            "id": agent_id,
+            "name": f"Agent{agent_id}",
+            "status": status,
+            "version": version,
+            "statusChangedOn": f"2025-06-0{agent_id}T00:00:00Z",
+            "systemCapabilities": {"Agent.ComputerName": f"PC{agent_id}"},
+            "userCapabilities": {"flag": "true"},
+        }
+
+    @pytest.fixture(autouse=True)
+    def setup(self, api_mock):
+        with patch.object(_AzAgents, "_AzAgents__get_all_pools") as mock_get_all_pools:
+            mock_get_all_pools.return_value = {"Project_pool": 10}
+            api_mock["get"].return_value = self.__listing(self.__agent(1), self.__agent(2), self.__agent(3))
+            self.api_mock = api_mock
+            self.api = AzApi("Org", "Pro", "123")
+            self.api.agent_pool_name = "Project_pool"
+        self.api_mock["get"].reset_mock()
+
+    def test_refresh(self):
+        changed = self.__agent(2, status="offline")
+        changed["statusChangedOn"] = "2025-07-01T00:00:00Z"
+        self.api_mock["get"].return_value = self.__listing(self.__agent(1), changed, self.__agent(4))
+        unchanged = self.api.Agents._AzAgents__all_agents["Agent1"]
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            mock_capabilities.side_effect = lambda agent_id: {
+                "systemCapabilities": {"Agent.ComputerName": f"NEW-PC{agent_id}"},
+                "userCapabilities": {},
+            }
+            diff = self.api.Agents.refresh()
+        assert diff.model_dump() == {"added": ["Agent4"], "removed": ["Agent3"], "changed": ["Agent2"]}
+        assert sorted(call.args[0] for call in mock_capabilities.call_args_list) == [2, 4]
+        assert "includeCapabilities=false" in self.api_mock["get"].call_args.args[0]
+        agents = self.api.Agents._AzAgents__all_agents
+        assert list(agents) == ["Agent1", "Agent2", "Agent4"]
+        assert agents["Agent1"] is unchanged
+        assert agents["Agent2"]["status"] == "offline"
+        assert self.api.Agents._AzAgents__resolve_agent_key("NEW-PC4", AgentsBy.PC_Name) == 4
+        with pytest.raises(KeyError):
+            self.api.Agents._AzAgents__resolve_agent_key("Agent3", AgentsBy.Agent_Name)
+
+    def test_refresh_swaps_indexes_with_database(self):
+        agents = self.api.Agents
+        lock = agents._AzAgents__capabilities_lock
+        released_states = []
+
+        class __CheckingLock:
+            def __enter__(self):
+                return lock.__enter__()
+
+            def __exit__(self, *exc):
+                released_states.append(
+                    set(agents._AzAgents__ids_by_name) == set(agents._AzAgents__all_agents)
+                    and set(agents._AzAgents__names_by_id) == {a["id"] for a in agents._AzAgents__all_agents.values()}
+                )
+                return lock.__exit__(*exc)
+
+        agents._AzAgents__capabilities_lock = __CheckingLock()
+        self.api_mock["get"].return_value = self.__listing(self.__agent(1), self.__agent(4))
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            mock_capabilities.return_value = {"systemCapabilities": {}, "userCapabilities": {}}
+            agents.refresh()
+        assert released_states and all(released_states)
+        assert agents._AzAgents__resolve_agent_key("Agent4", AgentsBy.Agent_Name) == 4
+
+    def test_find_agents_follows_changes(self):
+        assert self.api.Agents.find_agents("flag -equals true") == ["Agent1", "Agent2", "Agent3"]
+        self.api_mock["put"].return_value = MagicMock(status_code=200)
+        self.api.Agents.remove_user_capabilities("Agent1", AgentsBy.Agent_Name, "flag")
+        assert self.api.Agents.find_agents(["flag", "Agent.ComputerName -equals pc2"]) == ["Agent2"]
+
+        self.api_mock["get"].return_value = self.__listing(self.__agent(2, status="offline"), self.__agent(3))
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            mock_capabilities.return_value = {"systemCapabilities": {}, "userCapabilities": {"flag": "true"}}
+            self.api.Agents.refresh()
+        assert self.api.Agents.find_agents("flag") == ["Agent3"]
+        assert self.api.Agents.find_agents("flag", online_only=False) == ["Agent2", "Agent3"]
+
+    def test_find_agents_does_not_scan_loaded_agents(self):
+        with patch.object(_AzAgents, "_AzAgents__load_capabilities") as mock_load:
+            assert self.api.Agents.find_agents("flag") == ["Agent1", "Agent2", "Agent3"]
+        mock_load.assert_not_called()
+
+    def test_refresh_without_changes(self):
+        self.api_mock["get"].return_value = self.__listing(self.__agent(1), self.__agent(2), self.__agent(3))
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            diff = self.api.Agents.refresh()
+        mock_capabilities.assert_not_called()
+        assert diff == AgentsDiff()
+
+    def test_refresh_failed_keeps_database(self):
+        self.api_mock["get"].return_value = self.__listing(self.__agent(1), self.__agent(5))
+        with patch.object(_AzAgents, "_AzAgents__fetch_capabilities") as mock_capabilities:
+            mock_capabilities.side_effect = RequestException("error")
+            with pytest.raises(RequestException):
+                self.api.Agents.refresh()
+        assert list(self.api.Agents._AzAgents__all_agents) == ["Agent1", "Agent2", "Agent3"]
+
+
+class Tests_AzApi_agents_lazy:
+    @pytest.fixture(autouse=True)
+    def setup(self, api_mock):
+        with patch.object(_AzAgents, "_AzAgents__get_all_pools") as mock_get_all_pools:
+            mock_get_all_pools.return_value = {"Project_pool": 10}
+            api_mock["get"].return_value = get_agents_list_mock
+            self.api_mock = api_mock
+            self.api = AzApi("Org", "Pro", "123")
+            self.api.lazy_agent_capabilities = True
+            self.api.agent_pool_name = "Project_pool"
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].return_value = get_agent_capabilities_mock
+
+    def test_lazy_init(self):
+        assert self.api.Agents.lazy_capabilities
+        assert self.api.Agents._AzAgents__all_agents["Asus"] == {
+            "id": 9,
+            "pc_name": None,
+            "capabilities": None,
+            "status": "online",
+        }
+
+    def test_lazy_get_agent_capabilities_memoized(self):
+        first = self.api.Agents.get_agent_capabilities("Asus", AgentsBy.Agent_Name)
+        second = self.api.Agents.get_agent_capabilities(9, AgentsBy.ID)
+        self.api_mock["get"].assert_called_once()
+        assert first is second
+        assert first["systemCapabilities"].get("Agent.ComputerName") == "ASUS-MR"
+        assert self.api.Agents.all_agents["Asus"]["pc_name"] == "ASUS-MR"
+        self.api_mock["get"].assert_called_once()
+
+    def test_lazy_all_agents(self):
+        agents = self.api.Agents.all_agents
+        self.api_mock["get"].assert_called_once()
+        assert agents["Asus"]["capabilities"]["userCapabilities"].get("testflag") == "2"
+
+    def test_lazy_find_agents_loads_missing_once(self):
+        assert self.api.Agents.find_agents("testflag -equals 2") == ["Asus"]
+        with patch.object(_AzAgents, "_AzAgents__load_capabilities") as mock_load:
+            assert self.api.Agents.find_agents("Agent.ComputerName -equals ASUS-MR") == ["Asus"]
+        mock_load.assert_not_called()
+        self.api_mock["get"].assert_called_once()
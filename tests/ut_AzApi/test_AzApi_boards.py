@@ -1,11 +1,20 @@
-from unittest.mock import MagicMock, patch
+import re
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from beartype.door import is_bearable
 from loguru import logger
+from requests import RequestException
 
 from azapidevops.AzApi import AzApi
-from azapidevops.utils.AzApi_boards import WorkItem, WorkItemsDef, WorkItemsStatesDef
+from azapidevops.utils.AzApi_boards import (
+    WorkItem,
+    WorkItemGraph,
+    WorkItemRelationsDef,
+    WorkItemRevision,
+    WorkItemsDef,
+    WorkItemsStatesDef,
+)
 from tests.ut_AzApi.testdata import create_workitem_mock, id_details_response_mock, wiql_response_mock
 
 logger.configure(handlers={})
@@ -65,3 +74,167 @@ class Tests_AzApi_boards:
             WorkItemsDef.Task, allowed_states=[WorkItemsStatesDef.Task.To_Do, WorkItemsStatesDef.Task.Doing]
         )
         assert is_bearable(items, dict[int, WorkItem])
+
+    def test_get_work_items_cache(self, api_mock):
+        api_mock["post"].return_value = wiql_response_mock
+        api_mock["get"].return_value = id_details_response_mock
+        self.api.Boards.query_cache.ttl = 60
+        items = self.api.Boards.get_work_items(
+            WorkItemsDef.Task, allowed_states=[WorkItemsStatesDef.Task.To_Do, WorkItemsStatesDef.Task.Doing]
+        )
+        cached = self.api.Boards.get_work_items(
+            WorkItemsDef.Task, allowed_states=[WorkItemsStatesDef.Task.Doing, WorkItemsStatesDef.Task.To_Do]
+        )
+        assert cached == items
+        assert api_mock["post"].call_count == 1
+        self.api.Boards.get_work_items(WorkItemsDef.Task, allowed_states=WorkItemsStatesDef.Task.Doing)
+        self.api.Boards.get_work_items(WorkItemsDef.Task, allowed_states=[WorkItemsStatesDef.Task.Doing])
+        assert api_mock["post"].call_count == 2
+        self.api.Boards.get_work_items(
+            WorkItemsDef.Task,
+            allowed_states=[WorkItemsStatesDef.Task.Doing, WorkItemsStatesDef.Task.To_Do],
+            use_cache=False,
+        )
+        assert api_mock["post"].call_count == 3
+
+    def test_get_work_items_cache_invalidation(self, api_mock):
+        api_mock["post"].return_value = wiql_response_mock
+        api_mock["get"].return_value = id_details_response_mock
+        self.api.Boards.query_cache.ttl = 60
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        assert len(self.api.Boards.query_cache) == 1
+        self.api.Boards.change_work_item_state(4, WorkItemsStatesDef.Task.Done)
+        assert len(self.api.Boards.query_cache) == 0
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        api_mock["post"].return_value = create_workitem_mock
+        self.api.Boards.create_new_item(work_item_type=WorkItemsDef.Task, item_name="Item")
+        assert len(self.api.Boards.query_cache) == 0
+
+    def test_get_work_items_cache_invalidated_during_fetch(self, api_mock):
+        api_mock["post"].return_value = wiql_response_mock
+        self.api.Boards.query_cache.ttl = 60
+
+        def __change_state_during_fetch(*_args, **_kwargs):
+            self.api.Boards.change_work_item_state(4, WorkItemsStatesDef.Task.Done)
+            return id_details_response_mock
+
+        api_mock["get"].side_effect = __change_state_during_fetch
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        assert len(self.api.Boards.query_cache) == 0
+        api_mock["get"].side_effect = None
+        api_mock["get"].return_value = id_details_response_mock
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        assert api_mock["post"].call_count == 2
+        assert len(self.api.Boards.query_cache) == 1
+
+    def test_get_work_items_cache_disabled_by_default(self, api_mock):
+        api_mock["post"].return_value = wiql_response_mock
+        api_mock["get"].return_value = id_details_response_mock
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        self.api.Boards.get_work_items(WorkItemsDef.Task)
+        assert api_mock["post"].call_count == 2
+
+    @staticmethod
+    def _work_items_tree_mock(url, **_kwargs):
+        # 1 -> 2, 3; 2 -> 4; 3 -> 4 (shared child); 4 -> parent link back to 2
+        tree = {1: [2, 3], 2: [4], 3: [4], 4: []}
+        ids = [int(item_id) for item_id in re.search(r"ids=([\d,]+)", url).group(1).split(",")]
+        value = []
+        for item_id in ids:
+            relations = [
+                {"rel": WorkItemRelationsDef.Child.value, "url": f"https://dev.azure.com/Org/_apis/wit/workItems/{c}"}
+                for c in tree[item_id]
+            ]
+            relations.append({"rel": "ArtifactLink", "url": "vstfs:///Git/Commit/abc"})
+            if item_id == 4:
+                relations.append(
+                    {"rel": WorkItemRelationsDef.Parent.value, "url": "https://dev.azure.com/Org/_apis/wit/workItems/2"}
+                )
+            value.append(
+                {
+                    "id": item_id,
+                    "fields": {"System.Title": f"Item {item_id}", "System.State": "New", "System.WorkItemType": "Task"},
+                    "relations": relations,
+                }
+            )
+        return MagicMock(status_code=200, json=Mock(return_value={"count": len(value), "value": value}))
+
+    def test_get_work_item_graph(self):
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = self._work_items_tree_mock
+        graph = self.api.Boards.get_work_item_graph(1)
+        assert is_bearable(graph, WorkItemGraph)
+        assert set(graph.nodes) == {1, 2, 3, 4}
+        assert graph.nodes[4].depth == 2
+        assert [node.id for node in graph.get_linked(1, WorkItemRelationsDef.Child)] == [2, 3]
+        assert not graph.truncated
+        assert self.api_mock["get"].call_count == 3
+        assert "$expand=relations" in self.api_mock["get"].call_args[0][0]
+
+    def test_get_work_item_graph_limits(self):
+        self.api_mock["get"].side_effect = self._work_items_tree_mock
+        graph = self.api.Boards.get_work_item_graph([1], max_depth=1)
+        assert set(graph.nodes) == {1, 2, 3}
+        assert graph.truncated
+        graph = self.api.Boards.get_work_item_graph([1], max_items=2)
+        assert set(graph.nodes) == {1, 2}
+        assert graph.truncated
+
+    def test_get_work_item_graph_batches(self):
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = lambda *_args, **_kwargs: MagicMock(
+            status_code=200, json=Mock(return_value={"value": []})
+        )
+        self.api.Boards.get_work_item_graph(list(range(1, 451)))
+        assert self.api_mock["get"].call_count == 3
+
+    @staticmethod
+    def _revisions_mock(url, **_kwargs):
+        # Work item N has N * 3 revisions
+        work_item_id = int(re.search(r"workItems/(\d+)/revisions", url).group(1))
+        top = int(re.search(r"\$top=(\d+)", url).group(1))
+        skip = int(re.search(r"\$skip=(\d+)", url).group(1))
+        value = [
+            {"id": work_item_id, "rev": rev, "fields": {"System.ChangedDate": "2025-06-04T14:07:16.317Z"}}
+            for rev in range(skip + 1, min(skip + top, work_item_id * 3) + 1)
+        ]
+        return MagicMock(status_code=200, json=Mock(return_value={"count": len(value), "value": value}))
+
+    def test_iter_revisions(self):
+        self.api_mock["get"].side_effect = self._revisions_mock
+        revisions = list(self.api.Boards.iter_revisions([1, 2, 3], page_size=2, buffer_size=2))
+        assert all(is_bearable(revision, WorkItemRevision) for revision in revisions)
+        assert len(revisions) == 18
+        for work_item_id in [1, 2, 3]:
+            assert [rev.rev for rev in revisions if rev.id == work_item_id] == list(range(1, work_item_id * 3 + 1))
+
+    def test_iter_revisions_watermark(self):
+        self.api_mock["get"].side_effect = self._revisions_mock
+        revisions = list(self.api.Boards.iter_revisions(2, watermark={2: 4}))
+        assert [rev.rev for rev in revisions] == [5, 6]
+
+    def test_iter_revisions_error(self):
+        self.api_mock["get"].side_effect = lambda *_args, **_kwargs: MagicMock(status_code=404)
+        with pytest.raises(RequestException):
+            list(self.api.Boards.iter_revisions([1, 2]))
+
+    def test_iter_reporting_revisions(self):
+        batches = {
+            None: {
+                "values": [{"id": 1, "rev": 1}, {"id": 2, "rev": 1}],
+                "continuationToken": "t1",
+                "isLastBatch": False,
+            },
+            "t1": {"values": [{"id": 1, "rev": 2}], "continuationToken": "t2", "isLastBatch": True},
+        }
+        self.api_mock["get"].side_effect = lambda *_args, params, **_kwargs: MagicMock(
+            status_code=200, json=Mock(return_value=batches[params.get("continuationToken")])
+        )
+        revisions = list(self.api.Boards.iter_reporting_revisions())
+        assert [(rev.id, rev.rev, rev.watermark) for rev in revisions] == [(1, 1, None), (2, 1, None), (1, 2, "t1")]
+        revisions = list(self.api.Boards.iter_reporting_revisions(watermark="t1"))
+        assert [(rev.id, rev.rev) for rev in revisions] == [(1, 2)]
+        assert self.api_mock["get"].call_args.args[0].startswith("https://dev.azure.com/Org/Pro/_apis/wit/reporting/")
+
+        list(self.api.Boards.iter_reporting_revisions(watermark="t1", project_scoped=False))
+        assert self.api_mock["get"].call_args.args[0].startswith("https://dev.azure.com/Org/_apis/wit/reporting/")
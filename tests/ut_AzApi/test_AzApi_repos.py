@@ -1,12 +1,39 @@
-from unittest.mock import MagicMock, patch
+import copy
+import datetime
+import io
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import zipfile
+from unittest.mock import MagicMock, Mock, patch
 
 import beartype
 import pytest
 from loguru import logger
+from requests import RequestException
 
 from azapidevops.AzApi import AzApi
-from azapidevops.utils.AzApi_repos import PrStatusesDef, _AzRepos
-from tests.ut_AzApi.testdata import branch_list_response_mock, create_pr_response_mock, get_active_prs_mock
+from azapidevops.utils.AzApi_repos import (
+    CloneSpec,
+    CloneStallError,
+    Commit,
+    PrStatusesDef,
+    PullRequest,
+    PullRequestSpec,
+    _AzRepos,
+    _BranchIndex,
+)
+from azapidevops.utils.git_mirror_cache import GitMirrorCache
+from tests.ut_AzApi.testdata import (
+    _get_active_prs_raw,
+    branch_list_response_mock,
+    create_pr_response_mock,
+    get_active_prs_mock,
+    repositories_list_response_mock,
+)
 
 logger.configure(handlers={})
 
@@ -45,6 +72,7 @@ def api_mock():
 
 
 def test_AzApi_repo_init_positivie(api_mock):
+    api_mock["get"].return_value = repositories_list_response_mock
     api = AzApi("Org", "Pro", "123")
     assert api.repository_name is Ellipsis
     with pytest.raises(AzApi.ComponentException):
@@ -68,14 +96,40 @@ class Tests_AzApi_repos:
     @pytest.fixture(autouse=True)
     def setup_method(self, api_mock):
         self.api_mock = api_mock
+        self.api_mock["get"].return_value = repositories_list_response_mock
         self.api = AzApi("Org", "Pro", "123")
         self.api.repository_name = "Repo"
+        self.api_mock["get"].return_value = self.api_mock["response"]
 
     def test_change_repo_name_positive(self):
         self.api.repository_name = "Repos2"
         assert self.api.repository_name == "Repos2"
         assert self.api.Repos is not Ellipsis
 
+    def test_change_repo_name_resolves_repository_once(self):
+        self.api_mock["get"].reset_mock()
+        self.api.repository_name = "repos2"
+        self.api.repository_name = "Repo1"
+        self.api_mock["get"].assert_not_called()
+        assert self.api.Repos.repository.id == "guid-Repo1"
+        assert self.api.Repos.repository.default_branch == "refs/heads/main"
+        assert self.api.Repos.repository.remote_url == "https://Org@dev.azure.com/Org/Pro/_git/Repo1"
+
+    def test_change_repo_name_not_found(self):
+        old_repo_instance = self.api.Repos
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].return_value = repositories_list_response_mock
+        with pytest.raises(ValueError):
+            self.api.repository_name = "Missing"
+        self.api_mock["get"].assert_called_once()
+        assert self.api.repository_name == "Repo"
+        assert self.api.Repos is old_repo_instance
+
+    def test_repository_id_route(self):
+        self.api_mock["response"].json.return_value = {"count": 0, "value": []}
+        self.api.Repos.get_pr_iterations(1)
+        assert "/_apis/git/repositories/guid-Repo/pullRequests/1/" in self.api_mock["get"].call_args.args[0]
+
     @pytest.mark.parametrize("repo_name", [None, 123])
     def test_change_repo_name_negative(self, repo_name):
         old_repo_instance = self.api.Repos
@@ -99,6 +153,85 @@ class Tests_AzApi_repos:
         assert active_prs[1]["sourceRefName"] == "refs/heads/test2"
         assert active_prs[1]["targetRefName"] == "refs/heads/main"
 
+    @staticmethod
+    def _prs_pages_mock(total: int):
+        template = json.loads(_get_active_prs_raw)["value"][0]
+
+        def __get(*_args, params, **_kwargs):
+            value = []
+            for pr_id in range(params["$skip"] + 1, min(params["$skip"] + params["$top"], total) + 1):
+                pr = copy.deepcopy(template)
+                pr["pullRequestId"] = pr_id
+                value.append(pr)
+            return MagicMock(status_code=200, json=Mock(return_value={"count": len(value), "value": value}))
+
+        return __get
+
+    def test_get_active_pull_requests_paging(self):
+        self.api_mock["get"].side_effect = self._prs_pages_mock(250)
+        active_prs = self.api.Repos.get_active_pull_requests()
+        assert sorted(active_prs.keys()) == list(range(1, 251))
+
+    def test_iter_pull_requests(self):
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = self._prs_pages_mock(5)
+        prs = list(self.api.Repos.iter_pull_requests(page_size=2))
+        assert [pr.id for pr in prs] == [1, 2, 3, 4, 5]
+        assert isinstance(prs[0], PullRequest)
+        assert prs[0].source_ref_name == "refs/heads/test2"
+        assert prs[0].created_by == "user197@gil.com"
+        assert self.api_mock["get"].call_count == 3
+
+    def test_iter_pull_requests_filters(self):
+        self.api_mock["get"].side_effect = self._prs_pages_mock(1)
+        min_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        prs = list(
+            self.api.Repos.iter_pull_requests(
+                status=None,
+                source_branch="feature",
+                target_branch="refs/heads/main",
+                creator_id="creator-guid",
+                reviewer_id="reviewer-guid",
+                min_time=min_time,
+                raw=True,
+            )
+        )
+        assert prs[0]["pullRequestId"] == 1
+        params = self.api_mock["get"].call_args.kwargs["params"]
+        assert params["searchCriteria.status"] == "all"
+        assert params["searchCriteria.sourceRefName"] == "refs/heads/feature"
+        assert params["searchCriteria.targetRefName"] == "refs/heads/main"
+        assert params["searchCriteria.creatorId"] == "creator-guid"
+        assert params["searchCriteria.reviewerId"] == "reviewer-guid"
+        assert params["searchCriteria.minTime"] == min_time.isoformat()
+        assert params["searchCriteria.queryTimeRangeType"] == "created"
+
+    def test_create_prs(self):
+        def __post(url, json, **_kwargs):
+            if "Broken" in url:
+                return MagicMock(status_code=404)
+            pr_id = 100 + len(json["sourceRefName"]) if "Repo2" in url else len(json["sourceRefName"])
+            return MagicMock(status_code=201, json=Mock(return_value={"pullRequestId": pr_id}))
+
+        self.api_mock["get"].side_effect = lambda url, **_kwargs: (
+            get_active_prs_mock
+            if "repositories/guid-Repo/" in url
+            else MagicMock(status_code=200, json=Mock(return_value={"count": 0, "value": []}))
+        )
+        self.api_mock["post"].side_effect = __post
+        specs = [
+            PullRequestSpec(title="PR", source_branch="test2", target_branch="main"),
+            PullRequestSpec(title="PR", source_branch="aa", target_branch="main"),
+            PullRequestSpec(title="PR", source_branch="refs/heads/aa", target_branch="main"),
+            PullRequestSpec(title="PR", source_branch="aaa", target_branch="main", repository="Repo2"),
+            PullRequestSpec(title="PR", source_branch="aaa", target_branch="main", repository="Broken"),
+        ]
+        results = self.api.Repos.create_prs(specs, max_workers=3)
+        assert [result.spec for result in results] == specs
+        assert [result.pr_id for result in results] == [1, len("refs/heads/aa"), len("refs/heads/aa"), 114, None]
+        assert isinstance(results[4].error, ValueError)
+        assert self.api_mock["post"].call_count == 2
+
     def test_get_all_branches_raw(self):
         self.api_mock["get"].return_value = branch_list_response_mock
         branches = self.api.Repos.get_all_branches(raw=True)
@@ -115,12 +248,95 @@ class Tests_AzApi_repos:
         assert branches["refs/heads/test1"]["creator"] == "MRosi"
         assert branches["refs/heads/test2"]["creator"] == "MRosi"
 
+    def test_iter_branches_paging(self):
+        pages = {
+            None: MagicMock(
+                status_code=200,
+                headers={"x-ms-continuationtoken": "token1"},
+                json=Mock(return_value={"value": [{"name": "refs/heads/release/1.0", "objectId": "1" * 40}]}),
+            ),
+            "token1": MagicMock(
+                status_code=200,
+                headers={},
+                json=Mock(return_value={"value": [{"name": "refs/heads/release/1.1", "objectId": "2" * 40}]}),
+            ),
+        }
+        self.api_mock["get"].side_effect = lambda *_args, params, **_kwargs: pages[params.get("continuationToken")]
+        branches = list(self.api.Repos.iter_branches(prefix="release/", contains="1.", page_size=1))
+        assert [branch["name"] for branch in branches] == ["refs/heads/release/1.0", "refs/heads/release/1.1"]
+        params = self.api_mock["get"].call_args.kwargs["params"]
+        assert params["filter"] == "heads/release/"
+        assert params["filterContains"] == "1."
+        assert params["$top"] == 1
+
+    def test_branch_index(self):
+        self.api_mock["get"].return_value = branch_list_response_mock
+        self.api.Repos.refresh_branch_index()
+        self.api_mock["get"].reset_mock()
+        assert self.api.Repos.find_branches("test") == ["refs/heads/test1", "refs/heads/test2"]
+        assert self.api.Repos.find_branches("refs/heads/") == [
+            "refs/heads/main",
+            "refs/heads/test1",
+            "refs/heads/test2",
+        ]
+        assert self.api.Repos.branch_exists("main")
+        assert not self.api.Repos.branch_exists("mai")
+        assert self.api.Repos.get_branch_object_id("main") == "b79abb61b343476a200e007860db537e85"
+        self.api_mock["get"].assert_not_called()
+        self.api.Repos.delete_branch("test1")
+        self.api_mock["get"].reset_mock()
+        assert not self.api.Repos.branch_exists("test1")
+        self.api_mock["get"].assert_not_called()
+
+    def test_branch_index_expired(self):
+        self.api_mock["get"].return_value = branch_list_response_mock
+        self.api.Repos.branch_index_ttl = 0
+        self.api.Repos.refresh_branch_index()
+        self.api_mock["get"].reset_mock()
+        assert self.api.Repos.branch_exists("test1")
+        assert self.api_mock["get"].call_args.kwargs["params"]["filter"] == "heads/test1"
+
+    def test_branch_index_prefix_search(self):
+        index = _BranchIndex({f"refs/heads/feature/{i:05}": str(i) for i in range(20000)})
+        index.remove("refs/heads/feature/00100")
+        index.remove("refs/heads/missing")
+        assert len(index) == 19999
+        assert index.with_prefix("refs/heads/feature/0010") == [f"refs/heads/feature/{i:05}" for i in range(101, 110)]
+        assert index.with_prefix("refs/heads/release/") == []
+        assert index.get_object_id("refs/heads/feature/00042") == "42"
+
     def test_create_pr(self):
         self.api_mock["post"].return_value = create_pr_response_mock
-        with patch.object(_AzRepos, "get_active_pull_requests") as mck:
-            mck.return_value = {}
-            pr_number = self.api.Repos.create_pr("Test PR", "test2", "main")
+        self.api_mock["response"].json.return_value = {"count": 0, "value": []}
+        pr_number = self.api.Repos.create_pr("Test PR", "test2", "main")
+        assert pr_number == 1
+        params = self.api_mock["get"].call_args.kwargs["params"]
+        assert params["searchCriteria.sourceRefName"] == "refs/heads/test2"
+        assert params["searchCriteria.targetRefName"] == "refs/heads/main"
+        assert params["$top"] == 1
+
+    def test_create_pr_existing(self):
+        self.api_mock["get"].return_value = get_active_prs_mock
+        pr_number = self.api.Repos.create_pr("Test PR", "refs/heads/test2", "main")
         assert pr_number == 1
+        self.api_mock["post"].assert_not_called()
+
+    def test_create_pr_with_fresh_index(self):
+        self.api_mock["get"].return_value = get_active_prs_mock
+        self.api.Repos.refresh_pull_requests_index()
+        self.api_mock["get"].reset_mock()
+        self.api_mock["post"].return_value = create_pr_response_mock
+        assert self.api.Repos.create_pr("Test PR", "test2", "main") == 1
+        assert self.api.Repos.find_active_pull_request("test1", "main") is None
+        self.api_mock["post"].assert_not_called()
+        self.api_mock["get"].assert_not_called()
+
+        self.api_mock["post"].return_value = MagicMock(status_code=201, json=Mock(return_value={"pullRequestId": 7}))
+        assert self.api.Repos.create_pr("Test PR", "test1", "main") == 7
+        assert self.api.Repos.find_active_pull_request("test1", "main") == 7
+        self.api.Repos.change_pr_status(7, PrStatusesDef.Abandoned)
+        assert self.api.Repos.find_active_pull_request("test1", "main") is None
+        self.api_mock["get"].assert_not_called()
 
     @pytest.mark.parametrize(
         "method, params",
@@ -170,7 +386,8 @@ class Tests_AzApi_repos:
             args, kwargs = mck_subprocess.call_args
             cmd_submodules = "--recurse-submodules --shallow-submodules "
             assert " ".join(args[0]) + " " == (
-                f"git clone https://Org@dev.azure.com/Org/Pro/_git/Repo {cmd_submodules if submodules else ''}"
+                "git clone --progress https://Org@dev.azure.com/Org/Pro/_git/Repo "
+                f"{cmd_submodules if submodules else ''}"
                 f"{'--branch ' + branch + ' ' if branch else ''}{'--depth ' + str(depth) + ' ' if depth else ''}"
             )
 
@@ -202,10 +419,196 @@ class Tests_AzApi_repos:
             args, kwargs = mck_subprocess.call_args
             cmd_submodules = "--recurse-submodules --shallow-submodules "
             assert " ".join(args[0]) + " " == (
-                f"git clone https://gitrepolink.git {cmd_submodules if submodules else ''}"
+                f"git clone --progress https://gitrepolink.git {cmd_submodules if submodules else ''}"
                 f"{'--branch ' + branch + ' ' if branch else ''}{'--depth ' + str(depth) + ' ' if depth else ''}"
             )
 
+    def test_clone_repo_partial_options(self):
+        with (
+            patch("subprocess.Popen") as mck_subprocess,
+            patch("azapidevops.utils.AzApi_repos.ThreadPoolExecutor"),
+        ):
+            mck_subprocess.return_value = MagicMock(wait=MagicMock(return_value=0))
+            self.api.Repos.clone_repository(
+                "test", submodules=True, partial_filter="tree:0", single_branch=True, jobs=8
+            )
+            args, _ = mck_subprocess.call_args
+            assert " ".join(args[0]) == (
+                "git clone --progress https://Org@dev.azure.com/Org/Pro/_git/Repo "
+                "--recurse-submodules --shallow-submodules "
+                "--filter=tree:0 --single-branch --jobs 8"
+            )
+
+    def test_clone_repo_sparse_checkout(self, tmp_path):
+        origin = tmp_path / "origin" / "Monorepo"
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@test.com", "-C", str(origin)]
+        for directory in ["app", "docs"]:
+            (origin / directory).mkdir(parents=True)
+            (origin / directory / "file.txt").write_text(directory)
+        subprocess.run(["git", "init", "-q", str(origin)], check=True)
+        subprocess.run([*git, "add", "."], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+        output = tmp_path / "output"
+        output.mkdir()
+
+        path = self.api.Repos.clone_repository(
+            str(output), custom_url=f"file://{origin}", partial_filter="blob:none", sparse_paths=["app"]
+        )
+        assert path == str(output / "Monorepo")
+        assert (output / "Monorepo" / "app" / "file.txt").exists()
+        assert not (output / "Monorepo" / "docs").exists()
+
+    def test_clone_repo_mirror_cache(self, tmp_path):
+        with (
+            patch("subprocess.Popen") as mck_subprocess,
+            patch("azapidevops.utils.AzApi_repos.ThreadPoolExecutor"),
+            patch.object(GitMirrorCache, "reference") as mck_reference,
+        ):
+            mck_reference.return_value.__enter__.return_value = "/cache/Repo.git"
+            mck_subprocess.return_value = MagicMock(wait=MagicMock(return_value=0))
+            self.api.Repos.mirror_cache = GitMirrorCache(str(tmp_path))
+            self.api.Repos.clone_repository(str(tmp_path))
+
+            mck_reference.assert_called_once_with("https://Org@dev.azure.com/Org/Pro/_git/Repo")
+            args, _ = mck_subprocess.call_args
+            assert args[0][-3:] == ["--reference", "/cache/Repo.git", "--dissociate"]
+
+    def test_clone_repositories(self, tmp_path):
+        def __popen(command, cwd, **_kwargs):
+            url = command[3]
+            (tmp_path / url.split("/")[-1].removesuffix(".git")).mkdir()
+            return MagicMock(
+                stdout=io.StringIO("Cloning...\n"),
+                stderr=io.StringIO("Receiving objects: 100% (10/10), 2.00 KiB | 1.00 KiB/s, done.\n"),
+                wait=MagicMock(return_value=128 if "Broken" in url else 0),
+            )
+
+        specs = [
+            CloneSpec(repository="Repo1", depth=1),
+            CloneSpec(),
+            CloneSpec(repository="Broken"),
+            CloneSpec(custom_url="https://gitrepolink/Custom.git", output_dir=str(tmp_path)),
+        ]
+        with patch("subprocess.Popen", side_effect=__popen) as mck_subprocess:
+            results = self.api.Repos.clone_repositories(specs, str(tmp_path), max_workers=2)
+        assert mck_subprocess.call_count == 4
+        assert [result.spec for result in results] == specs
+        assert [result.exit_code for result in results] == [0, 0, 128, 0]
+        assert results[0].path == str(tmp_path / "Repo1")
+        assert results[1].path == str(tmp_path / "Repo")
+        assert results[2].path is None and results[2].error is not None
+        assert results[3].path == str(tmp_path / "Custom")
+        assert all(result.duration >= 0 for result in results)
+        assert all(result.progress.received_bytes == 2048 for result in results)
+
+    def test_clone_repo_stall_timeout(self, tmp_path):
+        proc = MagicMock(
+            stdout=io.StringIO(""),
+            stderr=io.StringIO("Receiving objects:  10% (1/10), 1.00 KiB | 0 bytes/s\n"),
+            poll=MagicMock(return_value=None),
+            wait=MagicMock(return_value=-9),
+        )
+        received = []
+        with (
+            patch("subprocess.Popen", return_value=proc) as mck_subprocess,
+            patch("os.killpg") as mck_killpg,
+            patch("subprocess.run"),
+        ):
+            with pytest.raises(CloneStallError) as error:
+                self.api.Repos.clone_repository(
+                    str(tmp_path), progress_callback=received.append, stall_timeout=0.05, min_throughput=1024
+                )
+        assert "--progress" in mck_subprocess.call_args.args[0]
+        assert mck_subprocess.call_args.kwargs["start_new_session"]
+        if os.name == "posix":
+            mck_killpg.assert_called_once_with(proc.pid, signal.SIGKILL)
+        proc.kill.assert_called_once()
+        assert error.value.returncode == -9
+        assert received[0].stage == "receiving objects"
+
+    @pytest.mark.parametrize("stall_timeout", [None, 30])
+    def test_clone_repo_interrupted_kills_process(self, tmp_path, stall_timeout):
+        proc = MagicMock(
+            stdout=io.StringIO(""),
+            stderr=io.StringIO(""),
+            poll=MagicMock(side_effect=KeyboardInterrupt),
+            wait=MagicMock(side_effect=[KeyboardInterrupt, -9]),
+        )
+        with (
+            patch("subprocess.Popen", return_value=proc) as mck_subprocess,
+            patch("os.killpg") as mck_killpg,
+            patch("subprocess.run"),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                self.api.Repos.clone_repository(str(tmp_path), stall_timeout=stall_timeout)
+        assert mck_subprocess.call_args.kwargs["start_new_session"] == bool(stall_timeout)
+        if os.name == "posix":
+            assert mck_killpg.called == bool(stall_timeout)
+        proc.kill.assert_called_once()
+
+    def test_clone_repo_stall_timeout_kills_children(self, tmp_path):
+        script = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "sys.stderr.write('Receiving objects:  10% (1/10)\\n')\n"
+            "sys.stderr.flush()\n"
+            "time.sleep(30)\n"
+        )
+        popen = subprocess.Popen
+        with patch(
+            "subprocess.Popen", side_effect=lambda _command, **kwargs: popen([sys.executable, "-c", script], **kwargs)
+        ):
+            started = time.monotonic()
+            with pytest.raises(CloneStallError):
+                self.api.Repos.clone_repository(str(tmp_path), stall_timeout=0.5)
+        assert time.monotonic() - started < 10
+
+    def test_download_archive(self, tmp_path):
+        archive_buffer = io.BytesIO()
+        with zipfile.ZipFile(archive_buffer, "w") as archive:
+            archive.writestr("src/main.py", "print('hello')")
+            archive.writestr("README.md", "readme")
+        data = archive_buffer.getvalue()
+        response = MagicMock(status_code=200)
+        response.iter_content.side_effect = lambda chunk_size: (
+            data[i : i + chunk_size] for i in range(0, len(data), chunk_size)
+        )
+        self.api_mock["get"].return_value = response
+
+        result = self.api.Repos.download_archive(
+            str(tmp_path / "repo.zip"),
+            version="abc",
+            version_type="commit",
+            extract_to=str(tmp_path / "out"),
+            chunk_size=16,
+        )
+        assert result == str(tmp_path / "out")
+        assert (tmp_path / "out" / "src" / "main.py").read_text() == "print('hello')"
+        assert (tmp_path / "repo.zip").read_bytes() == data
+        assert not (tmp_path / "repo.zip.part").exists()
+        kwargs = self.api_mock["get"].call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["params"]["$format"] == "zip"
+        assert kwargs["params"]["versionDescriptor.version"] == "abc"
+        assert kwargs["params"]["versionDescriptor.versionType"] == "commit"
+        response.close.assert_called_once()
+
+    def test_download_file(self, tmp_path):
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([b"line1\n", b"line2\n"])
+        self.api_mock["get"].return_value = response
+        result = self.api.Repos.download_file("/config.json", str(tmp_path / "config.json"))
+        assert (tmp_path / "config.json").read_bytes() == b"line1\nline2\n"
+        assert result == str(tmp_path / "config.json")
+        assert "versionDescriptor.version" not in self.api_mock["get"].call_args.kwargs["params"]
+
+    def test_download_file_error(self, tmp_path):
+        self.api_mock["get"].return_value = MagicMock(status_code=404)
+        with pytest.raises(RequestException):
+            self.api.Repos.download_file("/missing.json", str(tmp_path / "missing.json"))
+        assert not (tmp_path / "missing.json").exists()
+        assert not (tmp_path / "missing.json.part").exists()
+
     def test_add_pr_reviewer(self):
         with (
             patch.object(self.api, "search_user_aad_descriptor_by_email") as mock_search,
@@ -225,15 +628,173 @@ class Tests_AzApi_repos:
                 "vote": 0,
             }
 
+    def test_add_pr_reviewers(self):
+        def __post(url, *_args, json, **_kwargs):
+            if "/pullRequests/2/" in url:
+                return MagicMock(status_code=500)
+            return MagicMock(status_code=200, json=Mock(return_value={"count": len(json), "value": json}))
+
+        self.api_mock["post"].side_effect = __post
+        with (
+            patch.object(self.api, "search_user_aad_descriptor_by_email") as mock_search,
+            patch.object(self.api, "get_guid_by_descriptor") as mock_get_guid,
+        ):
+            mock_search.side_effect = lambda email: f"descriptor-{email}"
+            mock_get_guid.side_effect = lambda descriptor: f"guid-{descriptor}"
+            results = self.api.Repos.add_pr_reviewers([1, 2, 3], ["a@gmail.com", "b@gmail.com", "a@gmail.com"])
+
+        assert mock_search.call_count == 2
+        assert mock_get_guid.call_count == 2
+        assert self.api_mock["post"].call_count == 3
+        assert results[1] == [
+            {"id": "guid-descriptor-a@gmail.com", "vote": 0},
+            {"id": "guid-descriptor-b@gmail.com", "vote": 0},
+        ]
+        assert isinstance(results[2], RequestException)
+        assert results[3] == results[1]
+
+    def test_add_pr_reviewers_user_not_found(self):
+        with patch.object(self.api, "search_user_aad_descriptor_by_email") as mock_search:
+            mock_search.return_value = None
+            with pytest.raises(ValueError):
+                self.api.Repos.add_pr_reviewers([1], ["missing@gmail.com"])
+        self.api_mock["post"].assert_not_called()
+
+    def test_watch_pull_requests_conditional_request(self):
+        responses = [
+            MagicMock(
+                status_code=200, headers={"ETag": '"v1"'}, json=Mock(return_value=json.loads(_get_active_prs_raw))
+            ),
+            MagicMock(status_code=304),
+        ]
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = responses
+        watcher = self.api.Repos.watch_pull_requests(lambda _event: None, start=False)
+        watcher.poll()
+        assert watcher.poll() == []
+        assert self.api_mock["get"].call_count == 2
+        assert self.api_mock["get"].call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_iter_commits(self):
+        def __get(*_args, params, **_kwargs):
+            skip = params["searchCriteria.$skip"]
+            count = min(params["searchCriteria.$top"], 5 - skip)
+            value = [
+                {
+                    "commitId": f"{skip + i}" * 40,
+                    "comment": f"Commit {skip + i}",
+                    "author": {"name": "User", "email": "user@gmail.com", "date": "2025-06-04T06:58:04Z"},
+                    "changeCounts": {"Edit": 1},
+                }
+                for i in range(count)
+            ]
+            return MagicMock(status_code=200, json=Mock(return_value={"count": count, "value": value}))
+
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = __get
+        commits = list(self.api.Repos.iter_commits("refs/tags/v1.0", "main", author="user@gmail.com", page_size=2))
+        assert [commit.comment for commit in commits] == [f"Commit {i}" for i in range(5)]
+        assert commits[0].author_email == "user@gmail.com"
+        assert commits[0].change_counts == {"Edit": 1}
+        assert self.api_mock["get"].call_count == 3
+        params = self.api_mock["get"].call_args.kwargs["params"]
+        assert params["searchCriteria.itemVersion.version"] == "v1.0"
+        assert params["searchCriteria.itemVersion.versionType"] == "tag"
+        assert params["searchCriteria.compareVersion.version"] == "main"
+        assert params["searchCriteria.compareVersion.versionType"] == "branch"
+        assert params["searchCriteria.author"] == "user@gmail.com"
+
+    def test_get_commits_between(self):
+        def __iter_commits(item_version, compare_version, repository):
+            if repository == "Broken":
+                raise RequestException("error")
+            return iter([Commit(commit_id=f"{item_version}-{compare_version}-{repository}")])
+
+        with patch.object(self.api.Repos, "iter_commits") as mck:
+            mck.side_effect = __iter_commits
+            results = self.api.Repos.get_commits_between("v1", "v2", ["Repo1", "Broken", "Repo1"])
+        assert mck.call_count == 2
+        assert results["Repo1"] == [Commit(commit_id="v1-v2-Repo1")]
+        assert isinstance(results["Broken"], RequestException)
+
     @pytest.mark.parametrize("branch_name", ["test1", "refs/heads/test1"])
     def test_delete_branch(self, branch_name):
         with patch.object(self.api.Repos, "get_all_branches") as mck:
             mck.return_value = {"refs/heads/test1": {"objectId": "11111111111111111111111111111111111111"}}
             self.api.Repos.delete_branch(branch_name)
 
+    def test_delete_branches(self):
+        def __post(*_args, data, **_kwargs):
+            chunk = json.loads(data)
+            if chunk[0]["name"] == "refs/heads/branch4":
+                return MagicMock(status_code=500)
+            value = [
+                {"name": ref["name"], "success": True, "updateStatus": "succeeded"}
+                if ref["name"] != "refs/heads/branch2"
+                else {"name": ref["name"], "success": False, "updateStatus": "staleOldObjectId"}
+                for ref in chunk
+            ]
+            return MagicMock(status_code=200, json=Mock(return_value={"count": len(value), "value": value}))
+
+        self.api_mock["post"].side_effect = __post
+        with patch.object(self.api.Repos, "get_all_branches") as mck:
+            mck.return_value = {f"refs/heads/branch{i}": {"objectId": f"{i}" * 40} for i in range(1, 5)}
+            results = self.api.Repos.delete_branches(
+                ["branch1", "refs/heads/branch2", "branch3", "branch4", "missing", "branch1"], chunk_size=3
+            )
+        mck.assert_called_once()
+        assert self.api_mock["post"].call_count == 2
+        assert results == {
+            "refs/heads/branch1": {"success": True, "updateStatus": "succeeded"},
+            "refs/heads/branch2": {"success": False, "updateStatus": "staleOldObjectId"},
+            "refs/heads/branch3": {"success": True, "updateStatus": "succeeded"},
+            "refs/heads/branch4": {"success": False, "updateStatus": "HTTP 500"},
+            "refs/heads/missing": {"success": False, "updateStatus": "notFound"},
+        }
+        first_chunk = json.loads(self.api_mock["post"].call_args_list[0].kwargs["data"])
+        assert first_chunk[0] == {
+            "name": "refs/heads/branch1",
+            "oldObjectId": "1" * 40,
+            "newObjectId": "0" * 40,
+        }
+
     @pytest.mark.parametrize("status", [PrStatusesDef.Abandoned, PrStatusesDef.Completed, PrStatusesDef.Active])
     def test_change_pr_status(self, status):
         self.api.Repos.change_pr_status(1, status)
         self.api_mock["patch"].assert_called_once()
         args, kwargs = self.api_mock["patch"].call_args
         assert kwargs.get("json") == {"status": status}
+
+    def test_get_pr_changes(self):
+        def __get(url, *_args, params=None, **_kwargs):
+            if url.split("?")[0].endswith("/iterations"):
+                return MagicMock(status_code=200, json=Mock(return_value={"value": [{"id": 1}, {"id": 2}]}))
+            entries = [
+                {"changeType": "edit", "item": {"path": f"/file{params['$skip'] + i}", "objectId": "a" * 40}}
+                for i in range(2)
+            ]
+            next_page = {"nextSkip": 2, "nextTop": 2} if params["$skip"] == 0 else {}
+            return MagicMock(status_code=200, json=Mock(return_value={"changeEntries": entries, **next_page}))
+
+        self.api_mock["get"].reset_mock()
+        self.api_mock["get"].side_effect = __get
+        changes = self.api.Repos.get_pr_changes(7, page_size=2)
+        assert [change.path for change in changes] == ["/file0", "/file1", "/file2", "/file3"]
+        assert changes[0].change_type == "edit"
+        assert changes[0].object_id == "a" * 40
+        assert self.api_mock["get"].call_count == 3
+        assert "/pullRequests/7/iterations/2/changes" in self.api_mock["get"].call_args.args[0]
+
+    def test_get_prs_changes(self):
+        def __get_pr_changes(pr_id):
+            if pr_id == 3:
+                raise RequestException("error")
+            return []
+
+        with patch.object(self.api.Repos, "get_pr_changes") as mck:
+            mck.side_effect = __get_pr_changes
+            results = self.api.Repos.get_prs_changes([1, 2, 3, 1])
+        assert mck.call_count == 3
+        assert results[1] == []
+        assert results[2] == []
+        assert isinstance(results[3], RequestException)
@@ -0,0 +1,86 @@
+import pytest
+
+from azapidevops.utils.agent_demands import CapabilitiesIndex, Demand, DemandOperator
+
+
+def _capabilities(version, os="Windows_NT", **user):
+    return {"systemCapabilities": {"Agent.Version": version, "Agent.OS": os}, "userCapabilities": user}
+
+
+@pytest.fixture
+def index():
+    index = CapabilitiesIndex()
+    index.set_agent("Bench1", "online", _capabilities("4.255.0", hardware="true"))
+    index.set_agent("Bench2", "online", _capabilities("4.200", os="Linux", hardware="false"))
+    index.set_agent("Bench3", "offline", _capabilities("4.255.0", hardware="true"))
+    index.set_agent("Bench4", "online", _capabilities("3.9.1"))
+    return index
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("hardware", Demand(name="hardware")),
+        ("Agent.OS -equals Windows NT", Demand(name="Agent.OS", operator=DemandOperator.Equals, value="Windows NT")),
+        ("Agent.Version -gtversion 4.1", Demand(name="Agent.Version", operator=DemandOperator.Gt_Version, value="4.1")),
+    ],
+)
+def test_demand_parse(text, expected):
+    assert Demand.parse(text) == expected
+
+
+@pytest.mark.parametrize("text", ["Agent.OS -contains Windows", "Agent.Version -gtVersion latest", "a -equals"])
+def test_demand_parse_invalid(text):
+    with pytest.raises(ValueError):
+        Demand.parse(text)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"name": "v", "operator": DemandOperator.Gt_Version, "value": "x"},
+        {"name": "v", "operator": DemandOperator.Equals},
+        {"name": "v", "operator": DemandOperator.Le_Version},
+    ],
+)
+def test_demand_invalid(fields):
+    with pytest.raises(ValueError):
+        Demand(**fields)
+
+
+@pytest.mark.parametrize(
+    "demands,expected",
+    [
+        ([], {"Bench1", "Bench2", "Bench4"}),
+        (["HARDWARE"], {"Bench1", "Bench2"}),
+        (["hardware -equals TRUE"], {"Bench1"}),
+        (["Agent.Version -gtVersion 4.200"], {"Bench1"}),
+        (["Agent.Version -geVersion 4.200.0"], {"Bench1", "Bench2"}),
+        (["Agent.Version -ltVersion 4.255"], {"Bench2", "Bench4"}),
+        (["Agent.Version -leVersion 4.200", "Agent.OS -equals linux"], {"Bench2"}),
+        (["missing"], set()),
+    ],
+)
+def test_capabilities_index_match(index, demands, expected):
+    assert index.match([Demand.parse(demand) for demand in demands]) == expected
+
+
+def test_capabilities_index_offline(index):
+    assert index.match([Demand.parse("hardware -equals true")], online_only=False) == {"Bench1", "Bench3"}
+
+
+def test_capabilities_index_update(index):
+    index.set_agent("Bench1", "online", _capabilities("4.100", hardware="false"))
+    index.remove_agent("Bench2")
+    index.remove_agent("Missing")
+    assert len(index) == 3
+    assert index.match([Demand.parse("hardware -equals false")]) == {"Bench1"}
+    assert index.match([Demand.parse("Agent.Version -geVersion 4.0")]) == {"Bench1"}
+    assert index.match([Demand.parse("Agent.OS -equals Linux")]) == set()
+
+
+def test_capabilities_index_user_overrides_system():
+    index = CapabilitiesIndex()
+    index.set_agent("Bench", "online", {"systemCapabilities": {"Java": "8"}, "userCapabilities": {"java": "17"}})
+    assert index.match([Demand.parse("Java -equals 17")]) == {"Bench"}
+    assert index.match([Demand.parse("java -ltVersion 10")]) == set()
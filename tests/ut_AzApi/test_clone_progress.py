@@ -0,0 +1,46 @@
+from azapidevops.utils.clone_progress import CloneProgressParser
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_clone_progress_parser():
+    received = []
+    parser = CloneProgressParser(callback=received.append)
+    assert parser.feed("Cloning into 'Repo'...") is None
+    assert parser.feed("remote: Counting objects: 50% (5/10)").stage == "counting objects"
+    progress = parser.feed("Receiving objects:  45% (450/1000), 1.50 MiB | 512.00 KiB/s")
+    assert progress.percent == 45
+    assert (progress.current, progress.total) == (450, 1000)
+    assert progress.received_bytes == int(1.5 * 1024**2)
+    assert progress.throughput == 512 * 1024
+    assert progress.submodule is None
+
+    parser.feed("Cloning into '/tmp/Repo/libs/sub'...")
+    progress = parser.feed("Resolving deltas: 100% (20/20), done.")
+    assert progress.stage == "resolving deltas"
+    assert progress.submodule == "/tmp/Repo/libs/sub"
+    assert progress.received_bytes == int(1.5 * 1024**2)
+    assert len(received) == 3
+    assert parser.progress is progress
+
+
+def test_clone_progress_parser_idle_time():
+    clock = FakeClock()
+    parser = CloneProgressParser(min_throughput=1024, clock=clock)
+    clock.now = 5
+    parser.feed("Receiving objects:  10% (1/10), 10.00 KiB | 2.00 KiB/s")
+    assert parser.idle_time == 0
+    clock.now = 10
+    parser.feed("Receiving objects:  20% (2/10), 12.00 KiB | 512 bytes/s")
+    assert parser.idle_time == 5
+    clock.now = 12
+    parser.feed("Receiving objects:  20% (2/10), 12.00 KiB | 0 bytes/s")
+    assert parser.idle_time == 7
+    parser.feed("Resolving deltas:   0% (0/5)")
+    assert parser.idle_time == 0
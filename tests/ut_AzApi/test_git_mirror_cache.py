@@ -0,0 +1,126 @@
+import os
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+
+from azapidevops.utils.git_mirror_cache import GitMirrorCache, _FileLock
+
+
+@pytest.fixture
+def origin_repo(tmp_path):
+    repo = tmp_path / "origin" / "Repo"
+    repo.mkdir(parents=True)
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@test.com", "-C", str(repo)]
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "file.txt").write_text("content")
+    subprocess.run([*git, "add", "file.txt"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+    yield str(repo), git
+
+
+def test_mirror_created_and_updated(tmp_path, origin_repo):
+    repo, git = origin_repo
+    cache = GitMirrorCache(str(tmp_path / "cache"))
+    with cache.reference(repo) as mirror:
+        assert mirror == cache.mirror_path(repo)
+        assert os.path.isdir(os.path.join(mirror, "objects"))
+        assert not os.path.exists(mirror + ".lock")
+        assert len(os.listdir(mirror + ".readers")) == 1
+    assert os.listdir(mirror + ".readers") == []
+
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "second"], check=True)
+    head = subprocess.run([*git, "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    with cache.reference(repo) as mirror:
+        mirror_head = subprocess.run(
+            ["git", "--git-dir", mirror, "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    assert mirror_head == head
+
+
+def test_mirror_failure_yields_none(tmp_path):
+    cache = GitMirrorCache(str(tmp_path / "cache"))
+    with cache.reference(str(tmp_path / "missing")) as mirror:
+        assert mirror is None
+    assert not os.path.exists(cache.mirror_path(str(tmp_path / "missing")))
+
+
+def test_mirror_eviction(tmp_path, origin_repo):
+    repo, _ = origin_repo
+    cache = GitMirrorCache(str(tmp_path / "cache"))
+    with cache.reference(repo) as mirror:
+        pass
+    cache.max_size = 0
+    lock = _FileLock(mirror + ".lock")
+    lock.acquire()
+    assert cache.evict() == []
+    lock.release()
+    assert cache.evict() == [mirror]
+    assert not os.path.exists(mirror)
+
+
+def test_file_lock_non_blocking(tmp_path):
+    lock = _FileLock(str(tmp_path / "test.lock"))
+    assert lock.acquire()
+    assert not _FileLock(str(tmp_path / "test.lock")).acquire(blocking=False)
+    lock.release()
+    assert _FileLock(str(tmp_path / "test.lock")).acquire(blocking=False)
+
+
+def test_file_lock_heartbeat(tmp_path):
+    lock = _FileLock(str(tmp_path / "test.lock"), stale_after=0.4)
+    assert lock.acquire()
+    time.sleep(1)
+    assert not _FileLock(str(tmp_path / "test.lock"), stale_after=0.4).acquire(blocking=False)
+    lock.release()
+    assert not os.path.exists(tmp_path / "test.lock")
+
+
+def test_mirror_concurrent_readers(tmp_path, origin_repo):
+    repo, _ = origin_repo
+    cache = GitMirrorCache(str(tmp_path / "cache"))
+
+    def __update_mirror(_repo_url, path, prune=True):
+        assert prune == (mck_update.call_count == 1)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "HEAD"), "w") as head:
+            head.write("ref: refs/heads/main")
+
+    with patch.object(GitMirrorCache, "_GitMirrorCache__update_mirror", side_effect=__update_mirror) as mck_update:
+        with cache.reference(repo) as first, cache.reference(repo) as second:
+            assert first == second
+            assert mck_update.call_count == 2
+            cache.max_size = 0
+            assert cache.evict() == []
+        assert not os.path.exists(first)
+
+
+def test_mirror_updated_while_in_use(tmp_path, origin_repo):
+    repo, git = origin_repo
+    cache = GitMirrorCache(str(tmp_path / "cache"))
+    with cache.reference(repo):
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "second"], check=True)
+        head = subprocess.run([*git, "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        with cache.reference(repo) as mirror:
+            mirror_head = subprocess.run(
+                ["git", "--git-dir", mirror, "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+            ).stdout.strip()
+    assert mirror_head == head
+
+
+def test_file_lock_stale_lock_broken_once(tmp_path):
+    path = str(tmp_path / "test.lock")
+    with open(path, "w") as lock_file:
+        lock_file.write("dead-owner")
+    os.utime(path, (0, 0))
+    first, second = _FileLock(path), _FileLock(path)
+    assert first.acquire(blocking=False)
+
+    second._FileLock__break_stale_lock("dead-owner")
+    assert os.listdir(tmp_path) == ["test.lock"]
+    assert not second.acquire(blocking=False)
+    second.release()
+    assert os.path.exists(path)
+    first.release()
+    assert not os.path.exists(path)
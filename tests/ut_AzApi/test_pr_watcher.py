@@ -0,0 +1,106 @@
+import threading
+import time
+
+from azapidevops.utils.pr_watcher import PullRequestEventType, PullRequestWatcher
+
+
+def _pr(pr_id, title="PR", commit="a", votes=None, status="active"):
+    return {
+        "pullRequestId": pr_id,
+        "title": title,
+        "status": status,
+        "sourceRefName": "refs/heads/feature",
+        "targetRefName": "refs/heads/main",
+        "lastMergeSourceCommit": {"commitId": commit},
+        "reviewers": [{"id": guid, "vote": vote} for guid, vote in (votes or {}).items()],
+    }
+
+
+class FakeServer:
+    def __init__(self, prs):
+        self.prs = prs
+        self.closed = {}
+        self.version = 0
+        self.calls = 0
+
+    def fetch_active(self, etag):
+        self.calls += 1
+        if etag == str(self.version):
+            return None
+        return list(self.prs), str(self.version)
+
+    def fetch_one(self, pr_id):
+        return self.closed[pr_id]
+
+
+def test_pr_watcher_events():
+    server = FakeServer([_pr(1), _pr(2)])
+    watcher = PullRequestWatcher(server.fetch_active, server.fetch_one, lambda _event: None, 1, 8)
+    assert watcher.poll() == []
+
+    server.prs = [_pr(1, title="New title", votes={"user": 10}), _pr(3)]
+    server.closed[2] = _pr(2, status="completed")
+    server.version += 1
+    events = watcher.poll()
+    assert sorted((event.type, event.pr_id) for event in events) == sorted(
+        [
+            (PullRequestEventType.Updated, 1),
+            (PullRequestEventType.Vote_Changed, 1),
+            (PullRequestEventType.Created, 3),
+            (PullRequestEventType.Completed, 2),
+        ]
+    )
+    vote_event = next(event for event in events if event.type == PullRequestEventType.Vote_Changed)
+    assert vote_event.previous.votes == {}
+    assert vote_event.snapshot.votes == {"user": 10}
+
+
+def test_pr_watcher_adaptive_interval():
+    server = FakeServer([_pr(1)])
+    watcher = PullRequestWatcher(server.fetch_active, server.fetch_one, lambda _event: None, 1, 8, backoff=2)
+    watcher.poll()
+    for expected in [2, 4, 8, 8]:
+        watcher.poll()
+        assert watcher.interval == expected
+
+    server.prs = [_pr(1, commit="b")]
+    server.version += 1
+    assert len(watcher.poll()) == 1
+    assert watcher.interval == 1
+
+
+def test_pr_watcher_callback_on_worker_thread():
+    server = FakeServer([])
+    received = []
+    delivered = threading.Event()
+
+    def __callback(event):
+        received.append((event.pr_id, threading.current_thread().name))
+        delivered.set()
+
+    watcher = PullRequestWatcher(server.fetch_active, server.fetch_one, __callback, min_interval=0.01)
+    with watcher:
+        assert server.calls >= 1
+        server.prs = [_pr(5)]
+        server.version += 1
+        assert delivered.wait(5)
+    assert not watcher.running
+    assert received == [(5, "pr-watcher-dispatch")]
+
+
+def test_pr_watcher_direct_poll_not_queued():
+    server = FakeServer([_pr(1)])
+    received = []
+    watcher = PullRequestWatcher(server.fetch_active, server.fetch_one, received.append, min_interval=0.01)
+    watcher.poll()
+    server.prs = [_pr(1), _pr(2)]
+    server.version += 1
+    assert len(watcher.poll()) == 1
+
+    with watcher:
+        server.prs = [_pr(1), _pr(2), _pr(3)]
+        server.version += 1
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert [event.pr_id for event in received] == [3]
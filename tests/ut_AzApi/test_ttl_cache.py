@@ -0,0 +1,55 @@
+from azapidevops.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expiration():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("key", 1)
+    assert cache.get("key") == 1
+    clock.now = 9.9
+    assert cache.get("key") == 1
+    clock.now = 10
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_max_size():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.max_size = 1
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a", "default") == "default"
+    cache.ttl = 5
+    cache.set("a", 1)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_generation():
+    cache = TTLCache(ttl=10)
+    generation = cache.generation
+    cache.clear()
+    cache.set("a", 1, generation)
+    assert cache.get("a") is None
+    cache.set("a", 1, cache.generation)
+    assert cache.get("a") == 1
@@ -15,7 +15,7 @@ get_guid_by_descriptor_mock = MagicMock(text=_get_guid_by_descriptor, status_cod
 
 # AzApi_Repos
 _branch_list_response_raw = '{"value":[{"name":"refs/heads/main","objectId":"b79abb61b343476a200e007860db537e85","creator":{"displayName":"ciej R","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/user197/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"user1@gil.com","igeUrl":"https://dev.azure.com/user197/_api/_common/identityIge?id=6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/refs?filter=heads%2Fin"},{"name":"refs/heads/test1","objectId":"b79abb61b6dc2a6343476a200e007860db537e85","creator":{"displayName":"MRosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/user197/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"user1@gil.com","igeUrl":"https://dev.azure.com/user197/_api/_common/identityIge?id=6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/refs?filter=heads%2Ftest1"},{"name":"refs/heads/test2","objectId":"b79abb61b6dc2a6343476a200e007860db537e85","creator":{"displayName":"MRosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/user197/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"user1@gil.com","igeUrl":"https://dev.azure.com/user197/_api/_common/identityIge?id=6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/refs?filter=heads%2Ftest2"}],"count":3}'
-branch_list_response_mock = MagicMock(text=_branch_list_response_raw, status_code=200, json=Mock(return_value=json.loads(_branch_list_response_raw)))
+branch_list_response_mock = MagicMock(text=_branch_list_response_raw, status_code=200, headers={}, json=Mock(return_value=json.loads(_branch_list_response_raw)))
 
 _create_pr_response_raw = '{"repository":{"id":"c4baf599-aed2-472d-9a51-7933379ed4fa","name":"MRAzure","url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa","project":{"id":"2635d11d-46de-4dc8-9ba2-f2325ea2bc0c","name":"MRAzure","url":"https://dev.azure.com/user197/_apis/projects/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c","state":"wellFormed","revision":11,"visibility":"private","lastUpdateTime":"2024-04-18T21:47:30.43Z"},"size":734,"remoteUrl":"https://user197@dev.azure.com/user197/MRAzure/_git/MRAzure","sshUrl":"git@ssh.dev.azure.com:v3/user197/MRAzure/MRAzure","webUrl":"https://dev.azure.com/user197/MRAzure/_git/MRAzure","isDisabled":false,"isInintenance":false},"pullRequestId":1,"codeReviewId":1,"status":"active","createdBy":{"displayName":"MRosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/user197/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"user1@gil.com","igeUrl":"https://dev.azure.com/user197/_api/_common/identityIge?id=6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"creationDate":"2025-06-04T06:58:04.8778256Z","title":"Test PR","sourceRefName":"refs/heads/test2","targetRefName":"refs/heads/main","mergeStatus":"queued","isDraft":false,"mergeId":"706e25d7-9d71-45c3-8404-1d55792d037b","lastMergeSourceCommit":{"commitId":"b79abb61b6dc2a6343476a200e007860db537e85","url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/commits/b79abb61b6dc2a6343476a200e007860db537e85"},"lastMergeTargetCommit":{"commitId":"b79abb61b6dc2a6343476a200e007860db537e85","url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/commits/b79abb61b6dc2a6343476a200e007860db537e85"},"reviewers":[],"labels":[],"url":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/pullRequests/1","_links":{"self":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/pullRequests/1"},"repository":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa"},"workItems":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/pullRequests/1/workitems"},"sourceBranch":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/refs/heads/test2"},"targetBranch":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/refs/heads/main"},"statuses":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/pullRequests/1/statuses"},"sourceCommit":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/commits/b79abb61b6dc2a6343476a200e007860db537e85"},"targetCommit":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/commits/b79abb61b6dc2a6343476a200e007860db537e85"},"createdBy":{"href":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96"},"iterations":{"href":"https://dev.azure.com/user197/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c/_apis/git/repositories/c4baf599-aed2-472d-9a51-7933379ed4fa/pullRequests/1/iterations"}},"supportsIterations":true,"artifactId":"vstfs:///Git/PullRequestId/2635d11d-46de-4dc8-9ba2-f2325ea2bc0c%2fc4baf599-aed2-472d-9a51-7933379ed4fa%2f1"}'
 create_pr_response_mock = MagicMock(text=_create_pr_response_raw, status_code=201, json=Mock(return_value=json.loads(_create_pr_response_raw)))
@@ -28,7 +28,7 @@ _get_pools_list_raw = '{"count":10,"value":[{"createdOn":"2024-04-17T07:05:30.25
 get_pools_list_mock = MagicMock(text=_get_pools_list_raw, status_code=200, json=Mock(return_value=json.loads(_get_pools_list_raw)))
 
 _get_agents_list_raw = '{"count":1,"value":[{"_links":{"self":{"href":"https://dev.azure.com/mrosi97/_apis/distributedtask/pools/10/agents/9"},"web":{"href":"https://dev.azure.com/mrosi97/_settings/agentpools?view=jobs&poolId=10&agentId=9"}},"xParallelism":1,"createdOn":"2025-06-05T07:16:11.593Z","statusChangedOn":"2025-06-05T07:16:38.633Z","authorization":{"clientId":"6ff80a56-f9f3-4c85-880f-71686fbdb648","publicKey":{"exponent":"AQAB","modulus":"r4F9CLdekVeL06PoiNx+rsm8sadclIhcNokB4YS4wU48I5PedqjpmEVLswfNdmQp8DN0N1B4HcmwjWG54byofOUOnXskQZY5dxv0/J3G6QTWmkN8GQvBIJreBwVdEB9hxIHmSpKNSSQI6LDi/BoxTdaQWyB/40kvpb5Ao3GnWUxdT+jUNCJg5aoSqfnnzNllSWKNBwlusZnYiLvNuPO9frjuV1bBv5ZKLfY2IyFI1XmMNS6qeRqLd32vgOXpT3bHLz8s7gDt6xPcSBoZrxu3A5mi6H61urE2sd3/kVbDvr84Xl0e91hAY6godoJY/HOlmndfQWHJEXlp3tQsk1uwYQ=="}},"id":9,"name":"Asus","version":"4.255.0","osDescription":"Microsoft Windows 10.0.26100","enabled":true,"status":"online","provisioningState":"Provisioned","accessPoint":"CodexAccesspping"}]}'
-get_agents_list_mock = MagicMock(text=_get_agents_list_raw, status_code=200, json=Mock(return_value=json.loads(_get_agents_list_raw)))
+get_agents_list_mock = MagicMock(text=_get_agents_list_raw, status_code=200, headers={}, json=Mock(return_value=json.loads(_get_agents_list_raw)))
 
 _get_agent_capabilities_raw = r'''{"systemCapabilities":{"Agent.Name":"Asus","Agent.Version":"4.255.0","Agent.ComputerName":"ASUS-MR","Agent.HomeDirectory":"C:\\AzureAgent","Agent.OS":"Windows_NT","Agent.OSArchitecture":"X64","Agent.OSVersion":"10.0.26100","ALLUSERSPROFILE":"C:\\ProgramData","APPDATA":"C:\\Users\\mrosi\\AppData\\Roaming","Cmd":"C:\\WINDOWS\\system32\\cmd.exe","CommonProgramFiles":"C:\\Program Files\\Common Files","CommonProgramFiles(x86)":"C:\\Program Files (x86)\\Common Files","CommonProgramW6432":"C:\\Program Files\\Common Files","COMPUTERNAME":"ASUS-MR","ComSpec":"C:\\WINDOWS\\system32\\cmd.exe","CUDA_PATH":"C:\\Program Files\\NVIDIA GPU Computing Toolkit\\CUDA\\v12.6","CUDA_PATH_V12_6":"C:\\Program Files\\NVIDIA GPU Computing Toolkit\\CUDA\\v12.6","DotNetFramework":"C:\\Windows\\Microsoft.NET\\Framework64\\v4.0.30319","DotNetFramework_2.0":"C:\\Windows\\Microsoft.NET\\Framework\\v2.0.50727","DotNetFramework_2.0_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v2.0.50727","DotNetFramework_3.0":"C:\\Windows\\Microsoft.NET\\Framework\\v3.0","DotNetFramework_3.0_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v3.0","DotNetFramework_3.5":"C:\\Windows\\Microsoft.NET\\Framework\\v3.5","DotNetFramework_3.5_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v3.5","DotNetFramework_4.8.0":"C:\\Windows\\Microsoft.NET\\Framework\\v4.0.30319","DotNetFramework_4.8.0_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v4.0.30319","DriverData":"C:\\Windows\\System32\\Drivers\\DriverData","EFC_11092_1262719628":"1","EFC_11092_1592913036":"1","EFC_11092_2283032206":"1","EFC_11092_2775293581":"1","EFC_11092_3789132940":"1","FPS_BROWSER_APP_PROFILE_STRING":"Internet Explorer","FPS_BROWSER_USER_PROFILE_STRING":"Default","HOMEDRIVE":"C:","HOMEPATH":"\\Users\\mrosi","InteractiveSession":"True","LOCALAPPDATA":"C:\\Users\\mrosi\\AppData\\Local","LOGONSERVER":"\\\\ASUS-MR","MSBuild":"C:\\Windows\\Microsoft.NET\\Framework\\v4.0.30319\\","MSBuild_2.0":"C:\\Windows\\Microsoft.NET\\Framework\\v2.0.50727\\","MSBuild_2.0_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v2.0.50727\\","MSBuild_3.5":"C:\\Windows\\Microsoft.NET\\Framework\\v3.5\\","MSBuild_3.5_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v3.5\\","MSBuild_4.0":"C:\\Windows\\Microsoft.NET\\Framework\\v4.0.30319\\","MSBuild_4.0_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v4.0.30319\\","MSBuild_x64":"C:\\Windows\\Microsoft.NET\\Framework64\\v4.0.30319\\","NUMBER_OF_PROCESSORS":"12","OneDrive":"C:\\Users\\mrosi\\OneDrive","OS":"Windows_NT","Path":"C:\\Program Files\\NVIDIA GPU Computing Toolkit\\CUDA\\v12.6\\bin;C:\\Program Files\\NVIDIA GPU Computing Toolkit\\CUDA\\v12.6\\libnvvp;C:\\Windows\\system32;C:\\Windows;C:\\Windows\\System32\\Wbem;C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\;C:\\Windows\\System32\\OpenSSH\\;C:\\Program Files (x86)\\NVIDIA Corporation\\PhysX\\Common;C:\\WINDOWS\\system32;C:\\WINDOWS;C:\\WINDOWS\\System32\\Wbem;C:\\WINDOWS\\System32\\WindowsPowerShell\\v1.0\\;C:\\WINDOWS\\System32\\OpenSSH\\;C:\\Program Files\\Git\\cmd;C:\\Program Files\\NVIDIA Corporation\\Nsight Compute 2024.3.0\\;C:\\Program Files\\NVIDIA Corporation\\NVIDIA App\\NvDLISR;C:\\Users\\mrosi\\AppData\\Local\\Programs\\Python\\Python311\\Scripts\\;C:\\Users\\mrosi\\AppData\\Local\\Programs\\Python\\Python311\\;C:\\Users\\mrosi\\AppData\\Local\\Microsoft\\WindowsApps;C:\\Users\\mrosi\\AppData\\Local\\Microsoft\\WinGet\\Links;","PATHEXT":".COM;.EXE;.BAT;.CMD;.VBS;.VBE;.JS;.JSE;.WSF;.WSH;.MSC","PowerShell":"5.1.26100.4061","PROCESSOR_ARCHITECTURE":"AMD64","PROCESSOR_IDENTIFIER":"AMD64 Family 25 Model 80 Stepping 0, AuthenticAMD","PROCESSOR_LEVEL":"25","PROCESSOR_REVISION":"5000","ProgramData":"C:\\ProgramData","ProgramFiles":"C:\\Program Files","ProgramFiles(x86)":"C:\\Program Files (x86)","ProgramW6432":"C:\\Program Files","PROMPT":"$P$G","PUBLIC":"C:\\Users\\Public","SESSIONNAME":"Console","SystemDrive":"C:","SystemRoot":"C:\\WINDOWS","TEMP":"C:\\Users\\mrosi\\AppData\\Local\\Temp","TMP":"C:\\Users\\mrosi\\AppData\\Local\\Temp","USERDOMAIN":"ASUS-MR","USERDOMAIN_ROAMINGPROFILE":"ASUS-MR","USERNAME":"mrosi","USERPROFILE":"C:\\Users\\mrosi","VERBOSE_ARG":"'SilentlyContinue'","windir":"C:\\WINDOWS"},"userCapabilities":{"testflag":"2","testflag2":"2","testflag3":"2"},"_links":{"self":{"href":"https://dev.azure.com/mRosi97/_apis/distributedtask/pools/10/agents/9"},"web":{"href":"https://dev.azure.com/mRosi97/_settings/agentpools?view=jobs&poolId=10&agentId=9"}},"maxParallelism":1,"createdOn":"2025-06-05T07:16:11.593Z","statusChangedOn":"2025-06-09T06:23:48.16Z","authorization":{"clientId":"6ff80a56-f9f3-4c85-880f-71686fbdb648","publicKey":{"exponent":"AQAB","modulus":"r4F9CLdekVeL06PoiNx+rsm8sadclIhcNokB4YS4wU48I5PedqjpmEVLswfNdmQp8DN0N1B4HcmwjWG54byofOUOnXskQZY5dxv0/J3G6QTWmkN8GQvBIJreBwVdEB9hxIHmSpKNSSQI6LDi/BoxTdaQWyB/40kvpb5Ao3GnWUxdT+jUNCJg5aoSqfnnzNllSWKNBwlusZnYiLvNuPO9frjuV1bBv5ZKLfY2IyFI1XmMNS6qeRqLd32vgOXpT3bHLz8s7gDt6xPcSBoZrxu3A5mi6H61urE2sd3/kVbDvr84Xl0e91hAY6godoJY/HOlmndfQWHJEXlp3tQsk1uwYQ=="}},"id":9,"name":"Asus","version":"4.255.0","osDescription":"Microsoft Windows 10.0.26100","enabled":true,"status":"online","provisioningState":"Provisioned","accessPoint":"CodexAccessMapping"}'''
 get_agent_capabilities_mock = MagicMock(text=_get_agent_capabilities_raw, status_code=200, json=Mock(return_value=json.loads(_get_agent_capabilities_raw)))
@@ -43,3 +43,22 @@ _wiql_response = '{"queryType":"flat","queryResultType":"workItem","asOf":"2025-
 wiql_response_mock = MagicMock(text=_wiql_response, status_code=200, json=Mock(return_value=json.loads(_wiql_response)))
 _id_details_response = '{"count":3,"value":[{"id":1,"rev":1,"fields":{"System.Id":1,"System.State":"To Do","System.CreatedDate":"2025-06-04T14:07:16.317Z","System.CreatedBy":{"displayName":"Macj Rosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"m.Rosi97@gmail.com","imageUrl":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"System.Title":"test task"},"multilineFieldsFormat":{},"url":"https://dev.azure.com/mRosi97/_apis/wit/workItems/1"},{"id":2,"rev":4,"fields":{"System.Id":2,"System.State":"Done","System.CreatedDate":"2025-06-04T14:07:20.017Z","System.CreatedBy":{"displayName":"Macj Rosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"m.Rosi97@gmail.com","imageUrl":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"System.Title":"Test2"},"multilineFieldsFormat":{},"url":"https://dev.azure.com/mRosi97/_apis/wit/workItems/2"},{"id":4,"rev":2,"fields":{"System.Id":4,"System.State":"Doing","System.CreatedDate":"2025-06-10T07:17:23.173Z","System.CreatedBy":{"displayName":"Macj Rosi","url":"https://spsprodcin2.vssps.visualstudio.com/Ae96b06fa-d690-4466-9ee4-ce7a4ab8ef06/_apis/Identities/6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","_links":{"avatar":{"href":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"}},"id":"6da972d5-e5d7-67bb-a6ad-1175aa2d9a96","uniqueName":"m.Rosi97@gmail.com","imageUrl":"https://dev.azure.com/mRosi97/_apis/GraphProfile/MemberAvatars/msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2","descriptor":"msa.NmRhOTcyZDUtZTVkNy03N2JiLWE2YWQtMTE3NWFhMmQ5YTk2"},"System.Title":"Review Task"},"multilineFieldsFormat":{},"url":"https://dev.azure.com/mRosi97/_apis/wit/workItems/4"}]}'
 id_details_response_mock = MagicMock(text=_id_details_response, status_code=200, json=Mock(return_value=json.loads(_id_details_response)))
+
+_repositories_list_raw = {
+    "count": 4,
+    "value": [
+        {
+            "id": f"guid-{name}",
+            "name": name,
+            "project": {"id": "guid-Pro", "name": "Pro"},
+            "defaultBranch": "refs/heads/main",
+            "size": 734,
+            "remoteUrl": f"https://Org@dev.azure.com/Org/Pro/_git/{name}",
+            "sshUrl": f"git@ssh.dev.azure.com:v3/Org/Pro/{name}",
+            "webUrl": f"https://dev.azure.com/Org/Pro/_git/{name}",
+            "isDisabled": False,
+        }
+        for name in ["Repo", "Repos2", "Repo1", "Repo2"]
+    ],
+}
+repositories_list_response_mock = MagicMock(status_code=200, json=Mock(return_value=_repositories_list_raw))